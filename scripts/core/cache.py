@@ -1,42 +1,377 @@
 import os
+import sys
 import shutil
 import json
 import re
-from scripts.core.constants import CACHE_DIR
+import pickle
+import marshal
+import tempfile
+from datetime import datetime
+from scripts.core.constants import CACHE_DIR, DATA_DIR
 from scripts.core.version import Version
+from scripts.core import config_manager as config
 from scripts.utils import echo
-from scripts.core import file_loading
 
+# Optional faster backends, each with a stdlib fallback
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-def save_cache(data: dict, data_file: str, data_dir=CACHE_DIR, suppress=False):
-    """Caches data by saving it to a json file.
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# Available cache formats:
+# json      = Indented JSON. Human readable, and the default.
+# compact   = JSON without indentation or spaces.
+# orjson    = Compact JSON written with 'orjson'. Falls back to 'compact' if not installed.
+# msgpack   = Binary MessagePack. Falls back to 'marshal' if not installed.
+# pickle    = Binary Python pickle.
+# marshal   = Binary Python marshal. Fastest stdlib format, but tied to the Python version.
+CACHE_FORMATS = ("json", "compact", "orjson", "msgpack", "pickle", "marshal")
+JSON_FORMATS = ("json", "compact", "orjson")
+# File extension of each binary format. JSON formats use '.json'.
+BINARY_EXTENSIONS = {"msgpack": ".msgpack", "pickle": ".pickle", "marshal": ".marshal"}
+# Binary formats that can only be read by the Python version that wrote them
+_INTERPRETER_FORMATS = ("pickle", "marshal")
+_PYTHON_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+# Binary caches start with a header line: 'PZCACHE {"format": ..., "version": ...}'
+# Pickle and marshal caches also store the Python version that wrote them: '"python": "3.12"'
+_HEADER_MAGIC = b"PZCACHE "
+_HEADER_READ_SIZE = 512
+# Caches in the data directory get a '.meta' sidecar, so they can be checked without being opened
+_META_SUFFIX = ".meta"
+# JSON caches store the version as their first key, so it can be read from the start of the file
+_JSON_VERSION_PATTERN = re.compile(rb'^\s*\{\s*"version"\s*:\s*("(?:[^"\\]|\\.)*")')
+
+
+def _in_data_dir(path: str) -> bool:
+    """Checks whether a path is inside the data directory."""
+    return os.path.abspath(path).startswith(os.path.abspath(DATA_DIR))
+
+
+def _resolve_format(cache_format: str = None, data_dir: str = CACHE_DIR) -> str:
+    """Gets the format to save a cache with, falling back to stdlib formats if optional modules aren't installed."""
+    if cache_format is None:
+        # Only the data directory uses the configured format, so resources and outputs stay readable
+        cache_format = config.get_cache_format() if _in_data_dir(data_dir) else "json"
+
+    if cache_format not in CACHE_FORMATS:
+        echo.warning(f"Unknown cache format '{cache_format}', defaulting to 'json'.")
+        return "json"
+    if cache_format == "orjson" and orjson is None:
+        return "compact"
+    if cache_format == "msgpack" and msgpack is None:
+        return "marshal"
+    return cache_format
+
+
+def _dump_json(data: dict, version: str, cache_format: str) -> bytes:
+    """Serialises data as JSON, inserting the version as the first key without copying the data."""
+    if cache_format == "orjson":
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        separator = b""
+    elif cache_format == "compact":
+        payload = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        separator = b""
+    else:
+        payload = json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+        separator = b"\n    "
+
+    version_entry = b'"version":' + (b" " if separator else b"") + json.dumps(version).encode("utf-8")
+    if payload.strip() == b"{}":
+        return b"{" + separator + version_entry + (b"\n" if separator else b"") + b"}"
+    return b"{" + separator + version_entry + b"," + payload[1:]
+
+
+def _dump_binary(data: dict, version: str, cache_format: str) -> bytes:
+    """Serialises data in a binary format, prefixed with a header line holding the format and version."""
+    header = {"format": cache_format, "version": version}
+    if cache_format in _INTERPRETER_FORMATS:
+        header["python"] = _PYTHON_VERSION
+    header = _HEADER_MAGIC + json.dumps(header).encode("utf-8") + b"\n"
+    if cache_format == "msgpack":
+        payload = msgpack.packb(data, use_bin_type=True)
+    elif cache_format == "marshal":
+        payload = marshal.dumps(data)
+    else:
+        payload = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    return header + payload
+
+
+def read_cache_header(cache_file: str) -> tuple[str, str | None, int]:
+    """
+    Reads the format and version of a cache file, without decoding its data.
+
+    Args:
+        cache_file (str): Path to the cache file.
+
+    Returns:
+        tuple[str, str | None, int]: The cache format, version (None if it can't be read from the header, or
+            the data was written by a Python version that can't read it), and byte offset where the data starts.
+    """
+    with open(cache_file, "rb") as file:
+        start = file.read(_HEADER_READ_SIZE)
+
+    if start.startswith(_HEADER_MAGIC):
+        header_line = start.split(b"\n", 1)[0]
+        header = json.loads(header_line[len(_HEADER_MAGIC):])
+        version = header.get("version")
+        if header.get("python", _PYTHON_VERSION) != _PYTHON_VERSION:
+            version = None
+        return header.get("format", "pickle"), version, len(header_line) + 1
+
+    match = _JSON_VERSION_PATTERN.match(start)
+    version = json.loads(match.group(1)) if match else None
+    return "json", version, 0
+
+
+def get_cache_version(cache_file: str) -> str | None:
+    """
+    Gets the version of a cache file. Only the header is read, unless it's an older JSON cache without one.
+
+    Args:
+        cache_file (str): Path to the cache file. If no directory is included, `CACHE_DIR` is used.
+
+    Returns:
+        str | None: Version of the cached data, or None if the cache doesn't exist or has no version.
+    """
+    cache_file = _resolve_cache_path(cache_file)
+    if not os.path.exists(cache_file):
+        return None
+
+    try:
+        cache_format, cache_version, _ = read_cache_header(cache_file)
+        if cache_version is None and cache_format == "json":
+            data = _decode_cache(cache_file, cache_format, 0)
+            if isinstance(data, dict):
+                cache_version = data.get("version")
+        return cache_version
+    except Exception as e:
+        echo.error(f"Failed reading cache version of '{cache_file}': {e}")
+        return None
+
+
+def _cache_file_variants(cache_file: str) -> list[str]:
+    """Gets the paths a cache can be saved at, one per file extension, with the '.json' path first."""
+    extensions = [".json", *BINARY_EXTENSIONS.values()]
+    root, extension = os.path.splitext(cache_file)
+    if extension not in extensions:
+        root = cache_file
+    return [root + extension for extension in extensions]
+
+
+def _resolve_cache_path(cache_file: str) -> str:
+    """
+    Gets the path of a cache file, using `CACHE_DIR` if no directory is included.
+
+    Caches are named with '.json', but binary formats are saved with their own extension. The path of
+    whichever file exists is returned, or the given path if none do.
+    """
+    if not os.path.dirname(cache_file):
+        cache_file = os.path.join(CACHE_DIR, cache_file)
+    if os.path.exists(cache_file) or not cache_file.endswith(".json"):
+        return cache_file
+    return next((path for path in _cache_file_variants(cache_file) if os.path.exists(path)), cache_file)
+
+
+def find_cache_file(cache_file: str) -> str | None:
+    """
+    Gets the path a cache was saved at, whatever its format.
+
+    Args:
+        cache_file (str): Path to the cache file, named with '.json'. If no directory is included, `CACHE_DIR` is used.
+
+    Returns:
+        str | None: Path of the existing cache file, or None if it doesn't exist.
+    """
+    cache_file = _resolve_cache_path(cache_file)
+    return cache_file if os.path.exists(cache_file) else None
+
+
+def _write_cache_meta(cache_file: str, cache_format: str, version: str, sources: dict = None) -> None:
+    """Writes the sidecar metadata of a cache file, matching its current size and modified time."""
+    stat = os.stat(cache_file)
+    meta = {
+        "version": version,
+        "format": cache_format,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "sources": sources or {},
+    }
+    if cache_format in _INTERPRETER_FORMATS:
+        meta["python"] = _PYTHON_VERSION
+    with open(cache_file + _META_SUFFIX, "w", encoding="utf-8") as file:
+        json.dump(meta, file, ensure_ascii=False)
+
+
+def get_cache_meta(cache_file: str) -> dict:
+    """
+    Gets the metadata of a cache file, without decoding its data.
+
+    The sidecar is only used while it matches the cache file's size and modified time, otherwise
+    the metadata is rebuilt from the cache header.
 
     Args:
-        data (dict): Data to be cached, by storing it in a json file.
-        data_file (str): Name of the JSON file to be saved as. Including the file extension is optional.
-        data_dir (_type_, optional): Custom directory for the JSON file. Defaults to value of 'scripts.core.constants.DATA_PATH'.
+        cache_file (str): Path to the cache file. If no directory is included, `CACHE_DIR` is used.
+
+    Returns:
+        dict: 'version', 'format', 'size', 'created' and 'sources' of the cache, or an empty dict if it doesn't exist.
+    """
+    cache_file = _resolve_cache_path(cache_file)
+    try:
+        stat = os.stat(cache_file)
+    except OSError:
+        return {}
+
+    meta_file = cache_file + _META_SUFFIX
+    if os.path.exists(meta_file):
+        try:
+            with open(meta_file, "r", encoding="utf-8") as file:
+                meta = json.load(file)
+            if (
+                meta.get("size") == stat.st_size
+                and meta.get("mtime_ns") == stat.st_mtime_ns
+                and meta.get("python", _PYTHON_VERSION) == _PYTHON_VERSION
+            ):
+                return meta
+        except (OSError, json.JSONDecodeError):
+            pass
+
+    cache_format = read_cache_header(cache_file)[0] if stat.st_size else "json"
+    return {
+        "version": get_cache_version(cache_file),
+        "format": cache_format,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "created": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds"),
+        "sources": {},
+    }
+
+
+def is_cache_current(cache_file: str, sources: dict = None, inputs: list = None) -> bool:
+    """
+    Checks whether a cache is from the current version, without decoding its data.
+
+    Args:
+        cache_file (str): Path to the cache file. If no directory is included, `CACHE_DIR` is used.
+        sources (dict, optional): Source hashes the cache must have been saved with, e.g. {path: sha256}.
+        inputs (list, optional): Paths of the files the cache was built from. The cache must be newer than
+            all of them. Missing inputs are ignored.
+
+    Returns:
+        bool: True if the cache exists, matches the current version and, if given, the source hashes and inputs.
+    """
+    meta = get_cache_meta(cache_file)
+    if not meta or meta.get("version") != Version.get():
+        return False
+    if sources is not None and meta.get("sources") != sources:
+        return False
+    if inputs:
+        for path in inputs:
+            if not path:
+                continue
+            try:
+                if os.stat(path).st_mtime_ns > meta["mtime_ns"]:
+                    return False
+            except OSError:
+                continue
+    return True
+
+
+def _decode_cache(cache_file: str, cache_format: str, offset: int):
+    """Decodes the data of a cache file, starting at the byte offset after its header."""
+    with open(cache_file, "rb") as file:
+        file.seek(offset)
+        raw = file.read()
+
+    if cache_format in JSON_FORMATS:
+        if orjson is not None:
+            try:
+                return orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass  # e.g. NaN values, which only the stdlib accepts
+        return json.loads(raw.decode("utf-8"))
+    if cache_format == "msgpack":
+        if msgpack is None:
+            raise ImportError("'msgpack' is required to load this cache")
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    if cache_format == "marshal":
+        return marshal.loads(raw)
+    return pickle.loads(raw)
+
+
+def save_cache(data: dict, data_file: str, data_dir=CACHE_DIR, suppress=False, cache_format: str = None, sources: dict = None):
+    """Caches data by saving it to a file, with the current version stored in its header and metadata sidecar.
+
+    Args:
+        data (dict): Data to be cached, by storing it in a file.
+        data_file (str): Name of the file to be saved as. Including the '.json' extension is optional. Binary
+            formats replace it with their own extension, which `load_cache` resolves.
+        data_dir (_type_, optional): Custom directory for the file. Defaults to value of 'scripts.core.constants.CACHE_DIR'.
         suppress (bool, optional): Suppress displaying warnings/print statements. Defaults to False.
+        cache_format (str, optional): One of `CACHE_FORMATS`. Defaults to the 'cache_format' config setting for
+            files in the data directory, otherwise 'json'.
+        sources (dict, optional): Hashes of the source files the data was built from, e.g. {path: sha256}.
+            Stored in the metadata sidecar, for `is_cache_current`.
     """
-    if not data_file.endswith(".json"):
-        data_file += ".json"
-    data_file_path = os.path.join(data_dir, data_file)
-    os.makedirs(os.path.dirname(data_file_path), exist_ok=True)
+    if data_file.endswith(".json"):
+        data_file = data_file[:-len(".json")]
 
     # Adds space between words for CamelCase strings and cleans string
-    cache_name = re.sub(r'(?<=[a-z])([A-Z])', r' \1', data_file.replace(".json", "")).replace("_", " ").strip().lower()
+    cache_name = re.sub(r'(?<=[a-z])([A-Z])', r' \1', data_file).replace("_", " ").strip().lower()
 
-    data_copy = data.copy() # Copy so we don't modify the existing usable data.
+    cache_format = _resolve_format(cache_format, data_dir)
+    data_file_path = os.path.join(data_dir, data_file + BINARY_EXTENSIONS.get(cache_format, ".json"))
+    os.makedirs(os.path.dirname(data_file_path), exist_ok=True)
     # Add version number to data. Version can be checked to save time parsing.
-    data_copy["version"] = Version.get()
-    
-    file_loading.save_json(data_file_path, data_copy)
-    
+    version = Version.get()
+
+    try:
+        if cache_format in JSON_FORMATS:
+            if "version" in data:
+                # Only copied when the data has its own 'version' key, which the header replaces
+                data = {key: value for key, value in data.items() if key != "version"}
+            content = _dump_json(data, version, cache_format)
+        else:
+            content = _dump_binary(data, version, cache_format)
+
+        # Write to a unique temporary file first, so an interrupted or concurrent save doesn't corrupt the cache
+        fd, temp_path = tempfile.mkstemp(
+            dir=os.path.dirname(data_file_path), prefix=os.path.basename(data_file_path) + ".", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, "wb") as file:
+                file.write(content)
+            os.replace(temp_path, data_file_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        # Remove the cache saved in any other format, so it isn't loaded instead
+        for path in _cache_file_variants(data_file_path):
+            if path != data_file_path and os.path.exists(path):
+                os.remove(path)
+                if os.path.exists(path + _META_SUFFIX):
+                    os.remove(path + _META_SUFFIX)
+
+        if _in_data_dir(data_dir):
+            _write_cache_meta(data_file_path, cache_format, version, sources)
+    except (OSError, TypeError, ValueError, pickle.PicklingError) as e:
+        echo.error(f"Could not write to {data_file_path} – {e}")
+        return
+
     if not suppress:
         echo.info(f"{cache_name.capitalize()} saved to '{data_file_path}'")
 
 
-def load_cache(cache_file, cache_name="data", get_version=False, backup_old=False, suppress=False) -> dict:
-    """Loads the cache from a json file with the option to return the version of it, and back it up if it's old.
+def load_cache(cache_file, cache_name="data", get_version=False, backup_old=False, suppress=False, current_only=False) -> dict:
+    """Loads the cache from a file with the option to return the version of it, and back it up if it's old.
 
     Args:
         cache_file (str): Path to the cache file.
@@ -44,6 +379,7 @@ def load_cache(cache_file, cache_name="data", get_version=False, backup_old=Fals
         get_version (bool, optional): If True, returns the version of the cached data. Defaults to False.
         backup_old (bool, optional): If True, backs up the cache, only if it's an old version. Defaults to False.
         suppress (bool, optional): Suppress displaying print statements (errors still displayed). Defaults to False.
+        current_only (bool, optional): If True, an old version isn't decoded and empty data is returned. Defaults to False.
 
     Returns:
         dict: Cached data if valid, otherwise an empty dictionary.
@@ -53,28 +389,41 @@ def load_cache(cache_file, cache_name="data", get_version=False, backup_old=Fals
     json_cache = {}
 
     # Check if cache_file includes a directory path
-    if not os.path.dirname(cache_file):
-        cache_file = os.path.join(CACHE_DIR, cache_file)
+    cache_file = _resolve_cache_path(cache_file)
 
     if cache_name.strip().lower() != "data":
         cache_name = cache_name.strip() + " data"
 
     try:
         if os.path.exists(cache_file):
-            json_cache = file_loading.load_json(cache_file)
-            
-            cache_version = json_cache.get("version")
-            # Remove 'version' key before returning.
-            json_cache.pop("version", None)
+            cache_format, cache_version, offset = read_cache_header(cache_file)
+
+            if cache_version is None and cache_format in _INTERPRETER_FORMATS:
+                # Written by another Python version, which this one can't reliably read
+                if not suppress:
+                    echo.info(f"{cache_name.capitalize()} cache was saved by another Python version: '{cache_file}'")
+            elif current_only and cache_version is not None and cache_version != Version.get():
+                if not suppress:
+                    echo.info(f"{cache_name.capitalize()} cache is outdated: '{cache_file}' ({cache_version})")
+            else:
+                json_cache = _decode_cache(cache_file, cache_format, offset)
+
+                if isinstance(json_cache, dict):
+                    # Remove 'version' key before returning.
+                    cache_version = json_cache.pop("version", cache_version)
+
+                if not suppress:
+                    echo.info(f"{cache_name.capitalize()} loaded from cache: '{cache_file}' ({cache_version})")
 
-            if not suppress:
-                echo.info(f"{cache_name.capitalize()} loaded from cache: '{cache_file}' ({cache_version})")
+                if current_only and cache_version != Version.get():
+                    json_cache = {}
 
             if backup_old and cache_version != Version.get():
-                shutil.copy(cache_file, cache_file.replace(".json", "_old.json"))
+                root, extension = os.path.splitext(cache_file)
+                shutil.copy(cache_file, f"{root}_old{extension}")
 
     except json.JSONDecodeError as e:
-        echo.error(f"Failed to decode JSON file 'cache_file': {e}")
+        echo.error(f"Failed to decode JSON file '{cache_file}': {e}")
 
     except Exception as e:
         echo.error(f"Failed getting {cache_name.lower()} '{cache_file}': {e}")
@@ -98,7 +447,7 @@ def clear_cache(cache_path=CACHE_DIR, cache_name=None, suppress=False):
         cache_name = "cache"
     try:
         if cache_path != CACHE_DIR:
-            cache_path = os.path.join(CACHE_DIR, cache_path)
+            cache_path = _resolve_cache_path(os.path.join(CACHE_DIR, cache_path))
 
         # Check if it's a file or directory
         if os.path.exists(cache_path):
@@ -107,8 +456,10 @@ def clear_cache(cache_path=CACHE_DIR, cache_name=None, suppress=False):
                 os.makedirs(cache_path)  # Recreate directory
             else:
                 os.remove(cache_path)  # Delete file
+                if os.path.exists(cache_path + _META_SUFFIX):
+                    os.remove(cache_path + _META_SUFFIX)
 
         if not suppress:
             echo.success(f"{cache_name.capitalize()} cleared.")
     except Exception as e:
-        echo.error(f"Failed clearing {cache_name.lower()} '{cache_path}': {e}")
\ No newline at end of file
+        echo.error(f"Failed clearing {cache_name.lower()} '{cache_path}': {e}")
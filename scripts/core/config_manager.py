@@ -12,7 +12,9 @@ CONFIG_DEFAULTS = {
         "game_directory": 'C:\\Program Files (x86)\\Steam\\steamapps\\common\\ProjectZomboid',
         "zomboid_decompiler": '', # path for the ZomboidDecompiler.bat
         "pywikibot": '', # path for the pywikibot main/run python file
-        "max_workers": '' # number of max workers for multithreading
+        "max_workers": '', # number of max workers for multithreading
+        "cache_format": 'json', # format for saving caches, see 'scripts.core.cache.CACHE_FORMATS'
+        "png_compress_level": '6' # zlib compression level (0-9) for extracted PNG images
     }
 }
 
@@ -180,6 +182,45 @@ def get_max_workers():
     return util.convert_int(get(key='max_workers', section='Settings'))
 
 
+def get_worker_count(default: int = None) -> int:
+    """
+    Get the `max_workers` setting as a usable pool size.
+
+    Args:
+        default (int, optional): Fallback when `max_workers` is unset or invalid. Defaults to the CPU count.
+
+    Returns:
+        int: Number of workers, at least 1.
+    """
+    max_workers = get_max_workers()
+    if isinstance(max_workers, int) and max_workers > 0:
+        return max_workers
+    return max(1, default or os.cpu_count() or 1)
+
+
+def get_cache_format() -> str:
+    """
+    Get the `cache_format` setting.
+
+    Returns:
+        str: Format used for saving caches.
+    """
+    return (get(key='cache_format', section='Settings') or 'json').strip().lower()
+
+
+def get_png_compress_level() -> int:
+    """
+    Get the `png_compress_level` setting, clamped to zlib's 0-9 range.
+
+    Returns:
+        int: Compression level used when saving PNG images.
+    """
+    level = util.convert_int(get(key='png_compress_level', section='Settings'))
+    if not isinstance(level, int):
+        return 6
+    return min(9, max(0, level))
+
+
 def set(key, value, section='Settings'):
     """
     Update a config value and write it to the config file.
@@ -281,6 +322,16 @@ def set_max_workers(value):
     set('max_workers', value)
 
 
+def set_cache_format(value):
+    """
+    Set the `cache_format` setting.
+
+    Args:
+        value (str): New cache format.
+    """
+    set('cache_format', value)
+
+
 def main():
     """
     Main entry point to reset the config and update dependent modules.
@@ -117,8 +117,7 @@ def map_dir(base_dir, extension=None, media_type="scripts", suppress=False, excl
 
 
 def map_game_files(suppress=False):
-    from scripts.core.version import Version
-    from scripts.core.cache import save_cache, load_cache
+    from scripts.core.cache import save_cache, load_cache, is_cache_current
     """
     Maps script and lua files, then saves to cache.
 
@@ -130,9 +129,7 @@ def map_game_files(suppress=False):
     """
     global _game_file_map_cache
 
-    loaded_cache, cache_version = load_cache("game_file_map.json", get_version=True)
-
-    if cache_version != Version.get():
+    if not is_cache_current("game_file_map.json"):
         scripts = map_dir(get_scripts_dir(), ".txt", "scripts", suppress=suppress)
         lua = map_dir(get_lua_dir(), ".lua", "lua", suppress=suppress)
         maps = map_dir(get_maps_dir(), media_type="maps", suppress=suppress, exclude_ext=[".lotheader", ".png", ".bin", ".lotpack", ".zip", ".bak"])
@@ -148,7 +145,7 @@ def map_game_files(suppress=False):
         _game_file_map_cache = mapping
         save_cache(mapping, "game_file_map.json", suppress=suppress)
     else:
-        mapping = loaded_cache
+        mapping = load_cache("game_file_map.json")
 
     return mapping
 
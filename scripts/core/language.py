@@ -1,7 +1,8 @@
 import os
 import json
 import re
-from scripts.core.constants import DATA_DIR
+from concurrent.futures import ProcessPoolExecutor
+from scripts.core.constants import CACHE_DIR
 from scripts.core import config_manager as config
 from scripts.utils import echo
 
@@ -118,10 +119,13 @@ class Language:
         return LANGUAGE_CODES.get(wiki_code, {}).get("code", wiki_code)
 
 
+TRANSLATIONS_CACHE_DIR = os.path.join(CACHE_DIR, "translations")
+
+
 class Translate:
-    _translations = {}
-    _cache_loaded = False
-    _CACHE_JSON = "translations_data.json"
+    _translations = {}  # Only languages that have been loaded, see `load()` and `release()`
+    _unavailable = set()
+    _CACHE_JSON = "translations_{}.json"
 
     _PROPERTY_PREFIXES = {
         'DisplayName': "", # Obsolete for JSON translations
@@ -166,15 +170,15 @@ class Translate:
         if not property_value:
             return property_value
 
-        cls._ensure_loaded()
-
         lang_code = lang_code or Language.get()
-        if lang_code not in cls._translations:
+        translations = cls._translations.get(lang_code)
+        if translations is None:
+            translations = cls._load_language(lang_code)
+        if translations is None:
             if not suppress_warnings:
-                echo.warning("No translations loaded for language code:", lang_code)
+                echo.warning(f"No translations loaded for language code: {lang_code}")
             return default or property_value
 
-        translations = cls._translations[lang_code]
         key = cls._PROPERTY_PREFIXES.get(property_key, "") + property_value
         
         # Check if key exists
@@ -207,38 +211,77 @@ class Translate:
         return value
 
     @classmethod
-    def load(cls):
-        """Force-load all translation data, bypassing lazy init."""
-        if not cls._cache_loaded:
-            cls._cache()
-            cls._cache_loaded = True
+    def load(cls, lang_code: str = None):
+        """Force-load translation data for a language, bypassing lazy init. Defaults to the current language."""
+        cls._load_language(lang_code or Language.get())
+
+    @classmethod
+    def preload(cls, lang_codes: list[str]):
+        """Rebuild outdated translation caches for several languages in parallel, without loading them."""
+        from scripts.core.cache import is_cache_current
+
+        stale = [
+            code for code in lang_codes
+            if code in LANGUAGE_CODES
+            and code not in cls._translations
+            and code not in cls._unavailable
+            and not is_cache_current(cls._get_cache_path(code))
+        ]
+        cls._build(stale)
+
+    @classmethod
+    def release(cls, keep: list[str] = ()):
+        """Release loaded translation data from memory, except for the languages in `keep`."""
+        cls._translations = {code: data for code, data in cls._translations.items() if code in keep}
 
 
     ## ------------------------- Caching Logic ------------------------- ##
 
     @classmethod
-    def _ensure_loaded(cls):
-        if not cls._cache_loaded:
-            cls.load()
+    def _get_cache_path(cls, wiki_code: str) -> str:
+        return os.path.join(TRANSLATIONS_CACHE_DIR, cls._CACHE_JSON.format(wiki_code))
 
     @classmethod
-    def _cache(cls):
-        from scripts.core.version import Version
-        from scripts.core.cache import save_cache, load_cache
+    def _load_language(cls, wiki_code: str) -> dict | None:
+        """Load a language from its cache, rebuilding the cache if it's outdated. Returns None if unavailable."""
+        from scripts.core.cache import load_cache, is_cache_current
+
+        if wiki_code in cls._translations:
+            return cls._translations[wiki_code]
+        if wiki_code not in LANGUAGE_CODES or wiki_code in cls._unavailable:
+            return None
 
-        cache_path = os.path.join(DATA_DIR, cls._CACHE_JSON)
-        cls._translations, cache_version = load_cache(cache_path, "translation", get_version=True)
+        cache_path = cls._get_cache_path(wiki_code)
+        if is_cache_current(cache_path):
+            translations = load_cache(cache_path, "translation", suppress=True)
+        else:
+            translations = cls._build([wiki_code]).get(wiki_code)
 
-        if cache_version != Version.get():
-            for wiki_code in LANGUAGE_CODES:
-                try:
-                    game_code = Language.get_game_code(wiki_code)
-                    parsed = cls._parse(wiki_code, game_code)
-                    cls._translations[wiki_code] = parsed
-                except Exception as e:
-                    echo.warning(f"Failed to load {wiki_code}: {e}")
+        if translations is not None:
+            cls._translations[wiki_code] = translations
+        return translations
 
-            save_cache(cls._translations, cls._CACHE_JSON, suppress=True)
+    @classmethod
+    def _build(cls, wiki_codes: list[str]) -> dict[str, dict]:
+        """Parse and cache translations for languages, in a process pool when there's more than one."""
+        from scripts.core.cache import save_cache
+
+        max_workers = config.get_worker_count()
+        if max_workers > 1 and len(wiki_codes) > 1:
+            with ProcessPoolExecutor(max_workers=min(max_workers, len(wiki_codes))) as executor:
+                results = list(executor.map(_parse_language, wiki_codes))
+        else:
+            results = [_parse_language(code) for code in wiki_codes]
+
+        built = {}
+        for wiki_code, parsed, error in results:
+            if parsed is None:
+                echo.warning(f"Failed to load {wiki_code}: {error}")
+                cls._unavailable.add(wiki_code)
+                continue
+            save_cache(parsed, cls._CACHE_JSON.format(wiki_code), TRANSLATIONS_CACHE_DIR, suppress=True)
+            built[wiki_code] = parsed
+        return built
 
     @classmethod
     def _parse(cls, wiki_code, game_code):
@@ -270,5 +313,13 @@ class Translate:
         return parsed
 
 
+def _parse_language(wiki_code: str) -> tuple[str, dict | None, str | None]:
+    """Worker for `Translate._build()`. Returns the language code, its parsed translations and any error."""
+    try:
+        return wiki_code, Translate._parse(wiki_code, Language.get_game_code(wiki_code)), None
+    except Exception as e:
+        return wiki_code, None, str(e)
+
+
 def main():
     Language.init()
\ No newline at end of file
@@ -51,8 +51,13 @@ class Version:
         """Loads version from config and checks for changes."""
         from scripts.tools import diff
         cls.set(config.get_version())
-        current = diff.scan_game_snapshot([SCRIPTS_DIR])
         previous = diff.load_snapshot(cls._version, name="scripts")
+
+        # Only hash files when their stats suggest a change
+        if previous and not diff.has_snapshot_changed(previous, [SCRIPTS_DIR]):
+            return
+
+        current = diff.scan_game_snapshot([SCRIPTS_DIR])
         decompiled = False
 
         if current != previous:
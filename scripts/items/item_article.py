@@ -5,6 +5,7 @@ from concurrent.futures import ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 from scripts.core.language import Language
 from scripts.core import page_manager, file_loading
+from scripts.core.cache import load_cache as load_cache_file
 from scripts.core.constants import RESOURCE_DIR, PBAR_FORMAT, DATA_DIR
 from scripts.utils import echo
 from scripts.objects.item import Item
@@ -314,7 +315,7 @@ def load_cache():
     all_items_path = os.path.join(DATA_DIR, "cache", "distributions", "all_items.json")
 
     try:
-        _all_items_data = file_loading.load_json(all_items_path)
+        _all_items_data = load_cache_file(all_items_path, "distribution", suppress=True)
         echo.info(f"Loaded distribution data from {all_items_path}")
     except Exception as dist_error:
         echo.error(f"Failed to load distribution data: {dist_error}")
@@ -17,45 +17,76 @@ cache_path = os.path.join(DATA_DIR, "cache", "distributions")
 # Dictionary to store changes for reference across the script
 item_name_changes = {}
 
+# Reverse index of normalised display name -> item ID, built from itemname_en.txt on first use
+_item_name_index = None
 
-def load_item_dictionary(item_name):
-    """Load and search for a modified item name based on a dictionary in itemname_en.txt."""
-    file_path = os.path.join("resources", "itemname_en.txt")
 
-    if not os.path.exists(file_path):
-        return item_name  # If the file doesn't exist, return the original item name
+def _normalise_item_name(name):
+    """Normalise a display name for lookups by removing spaces."""
+    return name.replace(" ", "")
+
+
+def build_item_name_index():
+    """
+    Build the reverse index of display names to item IDs from itemname_en.txt.
+
+    The first item ID listed for a display name is kept. If the file doesn't exist the index is empty.
+
+    Returns:
+        dict: Normalised display name mapped to the item ID (without the module prefix).
+    """
+    global _item_name_index
+    file_path = os.path.join("resources", "itemname_en.txt")
 
     # Manually parse the dictionary file
     item_dict = {}
-    with open(file_path, "r") as file:
-        for line in file:
-            line = line.strip()
-            if line.startswith("ItemName_Base"):
-                # Extract key and value from lines formatted as `ItemName_Base.something = "Something",`
-                try:
-                    key, value = line.split(" = ")
-                    key = key.strip()  # The full key e.g., ItemName_Base.223Box
-                    value = value.strip().strip('",')  # Strip quotes and trailing comma
-                    item_dict[key] = value
-                except ValueError:
-                    # Skip lines that don't fit the format
-                    pass
-
-    # Format item name for comparison: remove spaces and surround with double quotes
-    formatted_item_name = f'"{item_name.replace(" ", "")}"'
-
-    # Search values for a match
+    if os.path.exists(file_path):
+        with open(file_path, "r") as file:
+            for line in file:
+                line = line.strip()
+                if line.startswith("ItemName_Base"):
+                    # Extract key and value from lines formatted as `ItemName_Base.something = "Something",`
+                    try:
+                        key, value = line.split(" = ")
+                        key = key.strip()  # The full key e.g., ItemName_Base.223Box
+                        value = value.strip().strip('",')  # Strip quotes and trailing comma
+                        item_dict[key] = value
+                    except ValueError:
+                        # Skip lines that don't fit the format
+                        pass
+
+    _item_name_index = {}
     for key, value in item_dict.items():
-        if formatted_item_name == f'"{value.replace(" ", "")}"':
-            # Match found; extract new item ID from the key
-            new_item_id = key.split(".", 1)[1]
-            item_name_changes[item_name] = (
-                new_item_id  # Store original and new item name
-            )
-            return new_item_id
+        # Skip keys without an item ID, e.g. `ItemName_Base = "..."`
+        if "." not in key:
+            continue
+        _item_name_index.setdefault(_normalise_item_name(value), key.split(".", 1)[1])
+
+    return _item_name_index
+
+
+def invalidate_item_name_index():
+    """
+    Clear the display name index so it is rebuilt from itemname_en.txt on next use.
+
+    itemname_en.txt is supplied by hand, so nothing in this project regenerates it. Anything that replaces
+    the file while the index is loaded (e.g. a script copying in a new translation file) must call this after.
+    """
+    global _item_name_index
+    _item_name_index = None
+
+
+def load_item_dictionary(item_name):
+    """Look up a modified item name based on the display names in itemname_en.txt."""
+    index = _item_name_index if _item_name_index is not None else build_item_name_index()
+
+    new_item_id = index.get(_normalise_item_name(item_name))
+    if new_item_id is None:
+        # If no match is found, return the original item name
+        return item_name
 
-    # If no match is found, return the original item name
-    return item_name
+    item_name_changes[item_name] = new_item_id  # Store original and new item name
+    return new_item_id
 
 
 def process_json(file_paths):
@@ -253,6 +284,411 @@ def process_json(file_paths):
     return item_list
 
 
+def _strip_base_prefix(item_id):
+    """Remove a leading 'Base.' module prefix from an item ID."""
+    return item_id[5:] if item_id.startswith("Base.") else item_id
+
+
+def _get_amount_string(item_data):
+    """Format the butchering amount for a part or bone entry."""
+    if "nb" in item_data:
+        return str(item_data["nb"])
+    elif "minNb" in item_data and "maxNb" in item_data:
+        return f"{item_data['minNb']}-{item_data['maxNb']}"
+    elif "maxNb" in item_data:
+        return str(item_data["maxNb"])
+    elif "minNb" in item_data:
+        return str(item_data["minNb"])
+    else:
+        return "1"  # Default amount
+
+
+def _parse_vehicle_label(label, labels):
+    """
+    Split a vehicle distribution label into a readable vehicle type and container.
+
+    Args:
+        label (str): Vehicle distribution key, e.g. "PoliceGloveBox".
+        labels (Iterable[str]): All vehicle distribution keys, used to detect base entries.
+
+    Returns:
+        tuple: (vehicle_type, container) formatted for display.
+    """
+    # Define known container types to look for at the end of strings
+    container_types_suffix = [
+        "GloveBox",
+        "TruckBed",
+        "SeatFront",
+        "SeatRear",
+        "Seat",
+        "EmptySeat",
+        "DriverSeat",
+    ]
+
+    # Define container types that appear at the beginning
+    container_types_prefix = ["Trunk"]
+
+    # Define special vehicle prefixes that should be kept together as a unit
+    # but will still need proper word splitting for display
+    special_vehicles = [
+        "PrisonGuard",
+        "PoliceState",
+        "PoliceSheriff",
+        "PoliceDetective",
+        "PoliceSWAT",
+        "ArmyLight",
+        "ArmyHeavy",
+        "BadTeens",
+        "PackRat",
+        "StepVan_Plonkies",
+        "StepVan_AirportCatering",
+        "VanSeats_AirportShuttle",
+        "StepVan_MarineBites",
+        "StepVan_Zippee",
+        "StepVan_Soda",
+        "StepVan_Beer",
+        "StepVan_Chips",
+        "StepVan_Windows",
+        "Van_Beer",
+        "StepVan_Genuine_Beer",
+        "StepVan_Cereal",
+        "Van_Locksmith",
+        "StepVan_Florist",
+        "Van_CraftSupplies",
+        "MobileLibrary",
+        "PickUpTruckLights_Airport",
+        "MetalWelder",
+        "MassGenFac",
+        "ConstructionWorker",
+        "KnoxDistillery",
+    ]
+
+    # Special case abbreviations that should be kept as-is
+    abbreviations = ["SWAT", "NNN"]
+
+    # Helper function to split camel case strings
+    def split_camel_case(name):
+        # Special cases
+        if name == "PoliceSWAT":
+            return "Police SWAT"
+        elif name == "Mass Gen Fac":
+            return "Mass-Genfac"
+
+        # Handle abbreviations first
+        for abbr in abbreviations:
+            if abbr in name:
+                # Replace abbreviation with a placeholder that won't be split
+                placeholder = f"___{abbr}___"
+                name = name.replace(abbr, placeholder)
+
+        # Split camel case
+        result = re.sub(r"([a-z])([A-Z])", r"\1 \2", name)
+
+        # Restore abbreviations
+        for abbr in abbreviations:
+            placeholder = f"___{abbr}___"
+            result = result.replace(placeholder, abbr)
+
+        return result
+
+    # Helper function to format names with proper spacing
+    def format_name(name, is_special_with_underscore=False):
+        # Special handling for underscore-containing special vehicles
+        if is_special_with_underscore and "_" in name:
+            parts = name.split("_")
+            # Put words after underscore first, then the part before underscore
+            name = parts[1] + " " + parts[0]
+
+        # Replace underscores with spaces
+        name = name.replace("_", " ")
+
+        # Split camel case
+        name = split_camel_case(name)
+
+        # Ensure abbreviations have spaces after them
+        for abbr in abbreviations:
+            # Replace abbreviation followed by a letter with abbreviation + space + letter
+            name = re.sub(f"({abbr})([a-zA-Z])", r"\1 \2", name)
+
+        # Trim any excess whitespace and return
+        return name.strip()
+
+    # Default values
+    vehicle_type = label
+    container = "Unknown"
+    is_special_with_underscore = False
+
+    # First check for container types at the end
+    suffix_match = False
+    for suffix in container_types_suffix:
+        if label.endswith(suffix):
+            container = suffix
+            # Vehicle type is everything before the container suffix
+            vehicle_type = label[: -len(suffix)]
+            suffix_match = True
+            break
+
+    # If found a suffix, now check if the vehicle type is a special vehicle
+    if suffix_match:
+        for special in special_vehicles:
+            if vehicle_type == special:
+                is_special_with_underscore = "_" in special
+                break
+    # If no suffix found, check for container types at the beginning
+    else:
+        prefix_match = False
+        for prefix in container_types_prefix:
+            if label.startswith(prefix):
+                container = prefix
+                # Vehicle type is everything after the container prefix
+                vehicle_type = label[len(prefix) :]
+                prefix_match = True
+                break
+
+        # If no container type found, check if this is a special vehicle
+        if not prefix_match:
+            special_vehicle_match = False
+            for special in special_vehicles:
+                if label == special:
+                    vehicle_type = special
+                    is_special_with_underscore = "_" in special
+                    container = "Base"  # Marking as base entry
+                    special_vehicle_match = True
+                    break
+
+            # If not a special vehicle and no container, this might be a base vehicle type
+            if not special_vehicle_match:
+                # Check if this is a base entry (like "Police", "Nurse", etc.)
+                # by looking for corresponding entries with containers
+                is_base_entry = any(
+                    entry.startswith(label) and entry != label for entry in labels
+                )
+                if is_base_entry:
+                    vehicle_type = label
+                    container = "Base"  # Marking as base entry
+
+    # Format the vehicle type and container names for readability
+    vehicle_type = format_name(vehicle_type, is_special_with_underscore)
+
+    # Format the container name to be more readable
+    if container == "GloveBox":
+        container = "Glove Box"
+    elif container == "TruckBed":
+        container = "Truck Bed"
+    elif container == "SeatFront":
+        container = "Front Seat"
+    elif container == "SeatRear":
+        container = "Rear Seat"
+    elif container == "Trunk":
+        container = "Trunk"
+    else:
+        container = format_name(container)
+
+    return vehicle_type, container
+
+
+def build_distribution_index(
+    procedural_data,
+    distribution_data,
+    vehicle_data,
+    clothing_data,
+    stories_data,
+    butchering_data,
+    attached_weapons_data,
+    container_contents_data,
+):
+    """
+    Build an inverted index of item -> distribution entries in a single pass over each source.
+
+    Each per-item list keeps the order the entries would be found in when walking the source
+    data, and duplicate entries are dropped the same way as a per-item scan would.
+
+    Returns:
+        dict: Indexes keyed by "Containers", "Vehicles", "Clothing", "Stories", "Butchering"
+        and "AttachedWeapons". The attached weapons index is a set of item IDs (without the
+        "Base." prefix) that appear in any weapon definition.
+    """
+    containers_index = {}
+    containers_seen = {}
+
+    def add_container(item_name, entry_tuple, entry):
+        seen = containers_seen.setdefault(item_name, set())
+        if entry_tuple not in seen:
+            seen.add(entry_tuple)
+            containers_index.setdefault(item_name, []).append(entry)
+
+    # Map each procedural list to the room/container pairs that reference it
+    proclist_locations = {}
+    for room, room_content in distribution_data.items():
+        if not isinstance(room_content, dict):
+            continue
+        for container, container_content in room_content.items():
+            if not isinstance(container_content, dict):
+                continue
+            for proc_entry in container_content.get("procList", []):
+                proclist_locations.setdefault(proc_entry.get("name"), []).append(
+                    (room, container)
+                )
+
+    def add_proclist_entries(proclist, entries, rolls):
+        locations = proclist_locations.get(proclist, [])
+        for entry in entries:
+            chance = entry["chance"]
+            for room, container in locations:
+                add_container(
+                    entry["name"],
+                    (room, container, proclist, chance, rolls),
+                    {
+                        "Room": room,
+                        "Container": container,
+                        "Proclist": proclist,
+                        "Chance": chance,
+                        "Rolls": rolls,
+                    },
+                )
+
+    def process_nested_object(obj, room_name, container_name=None):
+        if "items" in obj:
+            rolls = obj.get("rolls", 0)
+            for entry in obj["items"]:
+                chance = entry["chance"]
+                add_container(
+                    entry["name"],
+                    (room_name, container_name, chance, rolls),
+                    {
+                        "Room": room_name,
+                        "Container": container_name,
+                        "Chance": chance,
+                        "Rolls": rolls,
+                    },
+                )
+        else:
+            for sub_key, sub_value in obj.items():
+                if isinstance(sub_value, dict):
+                    process_nested_object(sub_value, room_name, sub_key)
+
+    for proclist, content in procedural_data.items():
+        items = content.get("items", [])
+        add_proclist_entries(proclist, items, content.get("rolls", 0))
+        junk = content.get("junk", {})
+        add_proclist_entries(proclist, junk.get("items", []), junk.get("rolls", 0))
+        # If neither primary items nor junk exist, check nested objects
+        if not items and not junk:
+            process_nested_object(content, room_name=proclist)
+
+    # Container contents use direct probability, not rolls-based
+    for container_id, container_data in (container_contents_data or {}).items():
+        if not isinstance(container_data, dict):
+            continue
+        container_name = _strip_base_prefix(container_id)
+        for item_name, chance in container_data.get("items", {}).items():
+            add_container(
+                item_name,
+                ("Any", container_name, chance, 1),
+                {
+                    "Room": "Any",
+                    "Container": container_name,
+                    "Chance": chance,
+                    "Rolls": 1,
+                },
+            )
+
+    # Vehicles
+    vehicles_index = {}
+    vehicles_seen = {}
+    vehicle_labels = [label for label in vehicle_data if label != "version"]
+    for label in vehicle_labels:
+        details = vehicle_data[label]
+        vehicle_type, container = _parse_vehicle_label(label, vehicle_data.keys())
+        rolls = details.get("rolls", 0)
+        junk_items = details.get("junk", {}).get("items", {})
+        for items in (details.get("items", {}), junk_items):
+            for item_name, chance in items.items():
+                entry_tuple = (vehicle_type, container, chance, rolls)
+                seen = vehicles_seen.setdefault(item_name, set())
+                if entry_tuple in seen:
+                    continue
+                seen.add(entry_tuple)
+                vehicles_index.setdefault(item_name, []).append(
+                    {
+                        "Type": vehicle_type,
+                        "Container": container,
+                        "Chance": chance,
+                        "Rolls": rolls,
+                    }
+                )
+
+    # Clothing, keyed by the outfit position so matches can be merged in order
+    clothing_index = {}
+    position = 0
+    for gender_outfits in ["FemaleOutfits", "MaleOutfits"]:
+        for outfit_name, outfit_details in clothing_data.get(
+            gender_outfits, {}
+        ).items():
+            for item_name, chance in outfit_details.get("Items", {}).items():
+                clothing_index.setdefault(item_name, []).append(
+                    (position, outfit_name, outfit_details.get("GUID", ""), chance)
+                )
+            position += 1
+
+    # Stories
+    stories_index = {}
+    for stories in stories_data.get("story_types", {}).values():
+        for story_id, story_data in stories.items():
+            for item_name in dict.fromkeys(story_data.get("items", [])):
+                stories_index.setdefault(item_name, []).append(story_id)
+
+    # Butchering
+    butchering_index = {}
+    animals_data = butchering_data.get("AnimalPartsDefinitions", {}).get("animals", {})
+    for animal_name, animal_data in animals_data.items():
+        for part_type in ["head", "skull", "feather", "leather"]:
+            if part_type in animal_data:
+                butchering_index.setdefault(
+                    _strip_base_prefix(animal_data[part_type]), []
+                ).append({"animal": animal_name, "amount": "1", "type": part_type})
+
+        for part_type in ["parts", "bones"]:
+            for part in animal_data.get(part_type, []):
+                butchering_index.setdefault(
+                    _strip_base_prefix(part.get("item", "")), []
+                ).append(
+                    {
+                        "animal": animal_name,
+                        "amount": _get_amount_string(part),
+                        "type": part_type,
+                    }
+                )
+
+    # Attached weapons: only items listed in a definition can have a spawn chance
+    attached_weapons_index = set()
+    definitions_data = attached_weapons_data.get("AttachedWeaponDefinitions", {})
+    weapon_lists = [
+        def_data.get("weapons", [])
+        for def_name, def_data in definitions_data.items()
+        if def_name != "attachedWeaponCustomOutfit" and isinstance(def_data, dict)
+    ]
+    for outfit_config in definitions_data.get(
+        "attachedWeaponCustomOutfit", {}
+    ).values():
+        for weapon_def in outfit_config.get("weapons", []):
+            if isinstance(weapon_def, dict):
+                weapon_lists.append(weapon_def.get("weapons", []))
+    for weapons in weapon_lists:
+        for weapon in weapons:
+            if isinstance(weapon, str):
+                attached_weapons_index.add(_strip_base_prefix(weapon))
+
+    return {
+        "Containers": containers_index,
+        "Vehicles": vehicles_index,
+        "Clothing": clothing_index,
+        "Stories": stories_index,
+        "Butchering": butchering_index,
+        "AttachedWeapons": attached_weapons_index,
+    }
+
+
 def build_item_json(
     item_list,
     procedural_data,
@@ -273,332 +709,24 @@ def build_item_json(
 
         outfits_data = get_outfits()
 
-    def get_container_info(item_name):
-        containers_info = []
-        unique_entries = set()
-
-        def process_nested_object(obj, room_name, container_name=None):
-            if "items" in obj:
-                items = obj["items"]
-                rolls = obj.get("rolls", 0)
-                for entry in items:
-                    if entry["name"] == item_name:
-                        chance = entry["chance"]
-                        entry_tuple = (room_name, container_name, chance, rolls)
-                        if entry_tuple not in unique_entries:
-                            containers_info.append(
-                                {
-                                    "Room": room_name,
-                                    "Container": container_name,
-                                    "Chance": chance,
-                                    "Rolls": rolls,
-                                }
-                            )
-                            unique_entries.add(entry_tuple)
-            else:
-                for sub_key, sub_value in obj.items():
-                    if isinstance(sub_value, dict):
-                        process_nested_object(sub_value, room_name, sub_key)
-
-        for proclist, content in procedural_data.items():
-            # Process primary items
-            items = content.get("items", [])
-            rolls = content.get("rolls", 0)
-            for entry in items:
-                if entry["name"] == item_name:
-                    chance = entry["chance"]
-                    for room, room_content in distribution_data.items():
-                        for container, container_content in room_content.items():
-                            proc_lists = container_content.get("procList", [])
-                            for proc_entry in proc_lists:
-                                if proc_entry.get("name") == proclist:
-                                    entry_tuple = (
-                                        room,
-                                        container,
-                                        proclist,
-                                        chance,
-                                        rolls,
-                                    )
-                                    if entry_tuple not in unique_entries:
-                                        containers_info.append(
-                                            {
-                                                "Room": room,
-                                                "Container": container,
-                                                "Proclist": proclist,
-                                                "Chance": chance,
-                                                "Rolls": rolls,
-                                            }
-                                        )
-                                        unique_entries.add(entry_tuple)
-            # Process junk items
-            junk = content.get("junk", {})
-            junk_items = junk.get("items", [])
-            junk_rolls = junk.get("rolls", 0)
-            for entry in junk_items:
-                if entry["name"] == item_name:
-                    chance = entry["chance"]
-                    for room, room_content in distribution_data.items():
-                        for container, container_content in room_content.items():
-                            proc_lists = container_content.get("procList", [])
-                            for proc_entry in proc_lists:
-                                if proc_entry.get("name") == proclist:
-                                    entry_tuple = (
-                                        room,
-                                        container,
-                                        proclist,
-                                        chance,
-                                        junk_rolls,
-                                    )
-                                    if entry_tuple not in unique_entries:
-                                        containers_info.append(
-                                            {
-                                                "Room": room,
-                                                "Container": container,
-                                                "Proclist": proclist,
-                                                "Chance": chance,
-                                                "Rolls": junk_rolls,
-                                            }
-                                        )
-                                        unique_entries.add(entry_tuple)
-            # If neither primary items nor junk exist, check nested objects
-            if not items and not junk:
-                process_nested_object(content, room_name=proclist)
-
-        # Add container contents data
-        container_contents_matches = get_container_contents_info(
-            item_name, container_contents_data
-        )
-        for match in container_contents_matches:
-            # For container contents, we use the chance directly (not rolls-based calculation)
-            entry_tuple = (
-                match["Room"],
-                match["Container"],
-                match["Chance"],
-                match["Rolls"],
-            )
-            if entry_tuple not in unique_entries:
-                containers_info.append(match)
-                unique_entries.add(entry_tuple)
+    # Build the item -> distribution index once, rather than scanning every source per item
+    echo.info("Indexing distribution data...")
+    distribution_index = build_distribution_index(
+        procedural_data,
+        distribution_data,
+        vehicle_data,
+        clothing_data,
+        stories_data,
+        butchering_data,
+        attached_weapons_data,
+        container_contents_data,
+    )
 
-        return containers_info
+    def get_container_info(item_name):
+        return distribution_index["Containers"].get(item_name, [])
 
     def get_vehicle_info(item_name):
-        vehicles_info = []
-        unique_entries = set()
-
-        # Define known container types to look for at the end of strings
-        container_types_suffix = [
-            "GloveBox",
-            "TruckBed",
-            "SeatFront",
-            "SeatRear",
-            "Seat",
-            "EmptySeat",
-            "DriverSeat",
-        ]
-
-        # Define container types that appear at the beginning
-        container_types_prefix = ["Trunk"]
-
-        # Define special vehicle prefixes that should be kept together as a unit
-        # but will still need proper word splitting for display
-        special_vehicles = [
-            "PrisonGuard",
-            "PoliceState",
-            "PoliceSheriff",
-            "PoliceDetective",
-            "PoliceSWAT",
-            "ArmyLight",
-            "ArmyHeavy",
-            "BadTeens",
-            "PackRat",
-            "StepVan_Plonkies",
-            "StepVan_AirportCatering",
-            "VanSeats_AirportShuttle",
-            "StepVan_MarineBites",
-            "StepVan_Zippee",
-            "StepVan_Soda",
-            "StepVan_Beer",
-            "StepVan_Chips",
-            "StepVan_Windows",
-            "Van_Beer",
-            "StepVan_Genuine_Beer",
-            "StepVan_Cereal",
-            "Van_Locksmith",
-            "StepVan_Florist",
-            "Van_CraftSupplies",
-            "MobileLibrary",
-            "PickUpTruckLights_Airport",
-            "MetalWelder",
-            "MassGenFac",
-            "ConstructionWorker",
-            "KnoxDistillery",
-        ]
-
-        # Special case abbreviations that should be kept as-is
-        abbreviations = ["SWAT", "NNN"]
-
-        # Helper function to split camel case strings
-        def split_camel_case(name):
-            # Special cases
-            if name == "PoliceSWAT":
-                return "Police SWAT"
-            elif name == "Mass Gen Fac":
-                return "Mass-Genfac"
-
-            # Handle abbreviations first
-            for abbr in abbreviations:
-                if abbr in name:
-                    # Replace abbreviation with a placeholder that won't be split
-                    placeholder = f"___{abbr}___"
-                    name = name.replace(abbr, placeholder)
-
-            # Split camel case
-            result = re.sub(r"([a-z])([A-Z])", r"\1 \2", name)
-
-            # Restore abbreviations
-            for abbr in abbreviations:
-                placeholder = f"___{abbr}___"
-                result = result.replace(placeholder, abbr)
-
-            return result
-
-        # Helper function to format names with proper spacing
-        def format_name(name, is_special_with_underscore=False):
-            # Special handling for underscore-containing special vehicles
-            if is_special_with_underscore and "_" in name:
-                parts = name.split("_")
-                # Put words after underscore first, then the part before underscore
-                name = parts[1] + " " + parts[0]
-
-            # Replace underscores with spaces
-            name = name.replace("_", " ")
-
-            # Split camel case
-            name = split_camel_case(name)
-
-            # Ensure abbreviations have spaces after them
-            for abbr in abbreviations:
-                # Replace abbreviation followed by a letter with abbreviation + space + letter
-                name = re.sub(f"({abbr})([a-zA-Z])", r"\1 \2", name)
-
-            # Trim any excess whitespace and return
-            return name.strip()
-
-        for label, details in vehicle_data.items():
-            # Skip the "version" entry which isn't a vehicle
-            if label == "version":
-                continue
-
-            # Default values
-            vehicle_type = label
-            container = "Unknown"
-            is_special_with_underscore = False
-
-            # First check for container types at the end
-            suffix_match = False
-            for suffix in container_types_suffix:
-                if label.endswith(suffix):
-                    container = suffix
-                    # Vehicle type is everything before the container suffix
-                    vehicle_type = label[: -len(suffix)]
-                    suffix_match = True
-                    break
-
-            # If found a suffix, now check if the vehicle type is a special vehicle
-            if suffix_match:
-                special_vehicle_match = False
-                for special in special_vehicles:
-                    if vehicle_type == special:
-                        is_special_with_underscore = "_" in special
-                        special_vehicle_match = True
-                        break
-            # If no suffix found, check for container types at the beginning
-            else:
-                prefix_match = False
-                for prefix in container_types_prefix:
-                    if label.startswith(prefix):
-                        container = prefix
-                        # Vehicle type is everything after the container prefix
-                        vehicle_type = label[len(prefix) :]
-                        prefix_match = True
-                        break
-
-                # If no container type found, check if this is a special vehicle
-                if not prefix_match:
-                    special_vehicle_match = False
-                    for special in special_vehicles:
-                        if label == special:
-                            vehicle_type = special
-                            is_special_with_underscore = "_" in special
-                            container = "Base"  # Marking as base entry
-                            special_vehicle_match = True
-                            break
-
-                    # If not a special vehicle and no container, this might be a base vehicle type
-                    if not special_vehicle_match:
-                        # Check if this is a base entry (like "Police", "Nurse", etc.)
-                        # by looking for corresponding entries with containers
-                        is_base_entry = any(
-                            entry.startswith(label) and entry != label
-                            for entry in vehicle_data.keys()
-                        )
-                        if is_base_entry:
-                            vehicle_type = label
-                            container = "Base"  # Marking as base entry
-
-            # Format the vehicle type and container names for readability
-            vehicle_type = format_name(vehicle_type, is_special_with_underscore)
-
-            # Format the container name to be more readable
-            if container == "GloveBox":
-                container = "Glove Box"
-            elif container == "TruckBed":
-                container = "Truck Bed"
-            elif container == "SeatFront":
-                container = "Front Seat"
-            elif container == "SeatRear":
-                container = "Rear Seat"
-            elif container == "Trunk":
-                container = "Trunk"
-            else:
-                container = format_name(container)
-
-            # Process items in this vehicle container
-            rolls = details.get("rolls", 0)
-            items = details.get("items", {})
-
-            if item_name in items:
-                chance = items[item_name]
-                entry_tuple = (vehicle_type, container, chance, rolls)
-                if entry_tuple not in unique_entries:
-                    vehicles_info.append(
-                        {
-                            "Type": vehicle_type,
-                            "Container": container,
-                            "Chance": chance,
-                            "Rolls": rolls,
-                        }
-                    )
-                    unique_entries.add(entry_tuple)
-
-            # Process junk items
-            junk_items = details.get("junk", {}).get("items", {})
-            if item_name in junk_items:
-                chance = junk_items[item_name]
-                entry_tuple = (vehicle_type, container, chance, rolls)
-                if entry_tuple not in unique_entries:
-                    vehicles_info.append(
-                        {
-                            "Type": vehicle_type,
-                            "Container": container,
-                            "Chance": chance,
-                            "Rolls": rolls,
-                        }
-                    )
-                    unique_entries.add(entry_tuple)
-
-        return vehicles_info
+        return distribution_index["Vehicles"].get(item_name, [])
 
     def get_foraging_info(item_name):
         item_info = foraging_data.get(item_name, {})
@@ -627,9 +755,7 @@ def build_item_json(
 
         return relevant_data
 
-    def get_clothing_info(item_name, clothing_data):
-        clothing_matches = []
-
+    def get_clothing_info(item_name):
         # Try to resolve the item name using the same logic as outfits.py
         resolved_item_names = set()
 
@@ -645,38 +771,32 @@ def build_item_json(
             # If Item.fix_item_id fails, continue with just the original name
             pass
 
-        for gender_outfits in ["FemaleOutfits", "MaleOutfits"]:
-            gender_outfits_data = clothing_data.get(gender_outfits, {})
-
-            for outfit_name, outfit_details in gender_outfits_data.items():
-                items = outfit_details.get("Items", {})
+        # Merge matches for all resolved names, only adding once per outfit
+        outfit_matches = {}
+        for resolved_name in resolved_item_names:
+            for position, outfit_name, guid, chance in distribution_index[
+                "Clothing"
+            ].get(resolved_name, []):
+                outfit_matches.setdefault(position, (outfit_name, guid, chance))
 
-                # Check if any of our resolved item names appear in the clothing data
-                for resolved_name in resolved_item_names:
-                    if resolved_name in items:
-                        clothing_matches.append(
-                            {
-                                "GUID": outfit_details.get("GUID", ""),
-                                "outfit_name": get_outfit_link(outfit_name),
-                                "Chance": items[resolved_name],
-                            }
-                        )
-                        break  # Only add once per outfit
+        clothing_matches = []
+        for position in sorted(outfit_matches):
+            outfit_name, guid, chance = outfit_matches[position]
+            clothing_matches.append(
+                {
+                    "GUID": guid,
+                    "outfit_name": get_outfit_link(outfit_name),
+                    "Chance": chance,
+                }
+            )
 
         return clothing_matches
 
     def get_story_info(item_name):
-        matching_stories = []
-        # New structure: iterate through story_types
-        story_types = stories_data.get("story_types", {})
-        for story_type_name, stories in story_types.items():
-            for story_id, story_data in stories.items():
-                items = story_data.get("items", [])
-                if item_name in items:
-                    matching_stories.append(
-                        {"id": story_id, "link": get_story_link(story_id)}
-                    )
-        return matching_stories
+        return [
+            {"id": story_id, "link": get_story_link(story_id)}
+            for story_id in distribution_index["Stories"].get(item_name, [])
+        ]
 
     def get_story_link(story_category):
         if story_category.startswith("RZS"):
@@ -721,156 +841,7 @@ def build_item_json(
         Get butchering information for an item by finding which animals produce it.
         Returns a list of animals and amounts that produce this item.
         """
-        butchering_matches = []
-
-        # Process the butchering data to find items
-        animals_data = butchering_data.get("AnimalPartsDefinitions", {}).get(
-            "animals", {}
-        )
-
-        for animal_name, animal_data in animals_data.items():
-            # Helper function to calculate amount string
-            def get_amount_string(item_data):
-                if "nb" in item_data:
-                    return str(item_data["nb"])
-                elif "minNb" in item_data and "maxNb" in item_data:
-                    return f"{item_data['minNb']}-{item_data['maxNb']}"
-                elif "maxNb" in item_data:
-                    return str(item_data["maxNb"])
-                elif "minNb" in item_data:
-                    return str(item_data["minNb"])
-                else:
-                    return "1"  # Default amount
-
-            # Check head item
-            if "head" in animal_data:
-                head_item = animal_data["head"]
-                head_item_clean = (
-                    head_item.replace("Base.", "")
-                    if head_item.startswith("Base.")
-                    else head_item
-                )
-                if head_item_clean == item_name:
-                    butchering_matches.append(
-                        {"animal": animal_name, "amount": "1", "type": "head"}
-                    )
-
-            # Check skull item
-            if "skull" in animal_data:
-                skull_item = animal_data["skull"]
-                skull_item_clean = (
-                    skull_item.replace("Base.", "")
-                    if skull_item.startswith("Base.")
-                    else skull_item
-                )
-                if skull_item_clean == item_name:
-                    butchering_matches.append(
-                        {"animal": animal_name, "amount": "1", "type": "skull"}
-                    )
-
-            # Check feather item
-            if "feather" in animal_data:
-                feather_item = animal_data["feather"]
-                feather_item_clean = (
-                    feather_item.replace("Base.", "")
-                    if feather_item.startswith("Base.")
-                    else feather_item
-                )
-                if feather_item_clean == item_name:
-                    butchering_matches.append(
-                        {"animal": animal_name, "amount": "1", "type": "feather"}
-                    )
-
-            # Check leather item
-            if "leather" in animal_data:
-                leather_item = animal_data["leather"]
-                leather_item_clean = (
-                    leather_item.replace("Base.", "")
-                    if leather_item.startswith("Base.")
-                    else leather_item
-                )
-                if leather_item_clean == item_name:
-                    butchering_matches.append(
-                        {"animal": animal_name, "amount": "1", "type": "leather"}
-                    )
-
-            # Check parts items
-            if "parts" in animal_data:
-                for part in animal_data["parts"]:
-                    part_item = part.get("item", "")
-                    part_item_clean = (
-                        part_item.replace("Base.", "")
-                        if part_item.startswith("Base.")
-                        else part_item
-                    )
-                    if part_item_clean == item_name:
-                        amount = get_amount_string(part)
-                        butchering_matches.append(
-                            {"animal": animal_name, "amount": amount, "type": "parts"}
-                        )
-
-            # Check bones items
-            if "bones" in animal_data:
-                for bone in animal_data["bones"]:
-                    bone_item = bone.get("item", "")
-                    bone_item_clean = (
-                        bone_item.replace("Base.", "")
-                        if bone_item.startswith("Base.")
-                        else bone_item
-                    )
-                    if bone_item_clean == item_name:
-                        amount = get_amount_string(bone)
-                        butchering_matches.append(
-                            {"animal": animal_name, "amount": amount, "type": "bones"}
-                        )
-
-        return butchering_matches
-
-    def get_container_contents_info(item_name, container_contents_data):
-        """
-        Get container contents information for an item.
-
-        This function checks all container contents for the specified item and returns
-        information about which containers can contain the item with their chances.
-
-        Args:
-            item_name (str): The item to search for
-            container_contents_data (dict): Container contents data from cache
-
-        Returns:
-            list: List of dictionaries with container information
-        """
-        container_matches = []
-
-        if not container_contents_data:
-            return container_matches
-
-        for container_id, container_data in container_contents_data.items():
-            if not isinstance(container_data, dict):
-                continue
-            items = container_data.get("items", {})
-
-            # Check if our item is in this container's items
-            if item_name in items:
-                chance = items[item_name]
-
-                # Remove "Base." prefix from container_id if present
-                container_name = (
-                    container_id.replace("Base.", "")
-                    if container_id.startswith("Base.")
-                    else container_id
-                )
-
-                container_matches.append(
-                    {
-                        "Room": "Any",
-                        "Container": container_name,
-                        "Chance": chance,
-                        "Rolls": 1,  # Container contents use direct probability, not rolls-based
-                    }
-                )
-
-        return container_matches
+        return distribution_index["Butchering"].get(item_name, [])
 
     def get_attached_weapon_info(item_name, attached_weapons_data, outfits_data=None):
         """
@@ -889,6 +860,11 @@ def build_item_json(
             if item_name.startswith("Base.")
             else item_name
         )
+
+        # Skip items that aren't listed in any weapon definition
+        if item_name_no_prefix not in distribution_index["AttachedWeapons"]:
+            return attached_weapon_matches
+
         full_item_name = f"Base.{item_name_no_prefix}"
 
         # Extract definitions from the parsed data
@@ -1137,7 +1113,7 @@ def build_item_json(
             "Containers": get_container_info(item_name),
             "Vehicles": get_vehicle_info(item_name),
             "Foraging": get_foraging_info(item_name),
-            "Clothing": get_clothing_info(item_name, clothing_data),
+            "Clothing": get_clothing_info(item_name),
             "Stories": get_story_info(item_name),
             "Fishing": get_fishing_info(item_name),
             "Butchering": get_butchering_info(item_name),
@@ -2321,7 +2297,8 @@ def main():
     Returns:
         bool: True if processing completed successfully, False otherwise
     """
-    # Run distribution parser and check if it was successful
+    # Run distribution parser (including container contents) and check if it was successful
+    echo.info("Parsing distribution data...")
     if not distribution_parser.main():
         echo.error(
             "Distribution parser failed to run due to missing Java or decompiler issues."
@@ -2359,16 +2336,6 @@ def main():
     parsed_data = lua_helper.parse_lua_tables(lua_runtime)
     save_cache(parsed_data, "attached_weapon_definitions.json", cache_path)
 
-    # Parse distribution data
-    echo.info("Parsing distribution data...")
-    distribution_parser.main()
-
-    # Parse container contents (this depends on distribution data being available)
-    echo.info("Parsing container contents...")
-    from scripts.parser.distribution_parser import parse_container_contents
-
-    parse_container_contents(cache_path)
-
     # Process item list and build JSON data
     echo.info("Processing item list...")
     file_paths["butchering"] = os.path.join(
@@ -99,7 +99,7 @@ def process_lua_file(lua_file):
     try:
         filename = Path(lua_file).name
         prefer = Path(lua_file).parent.name
-        lua_runtime = lua_helper.load_lua_file(filename, prefer=prefer, media_type="maps")
+        lua_runtime = lua_helper.load_lua_file(filename, prefer=prefer, media_type="maps", shared=False)
         lua_runtime.execute("SpawnPoints = SpawnPoints()")
         parsed_data = lua_helper.parse_lua_tables(lua_runtime, tables=["SpawnPoints"])
         lua_path = Path(lua_file)
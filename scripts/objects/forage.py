@@ -6,7 +6,7 @@ from scripts.core.file_loading import get_lua_path
 from scripts.parser import distribution_parser
 from scripts.objects.item import Item
 from scripts.utils import util
-from scripts.core.cache import save_cache, load_cache
+from scripts.core.cache import save_cache, load_cache, find_cache_file
 from scripts.utils.lua_helper import load_lua_file, parse_lua_tables, lua_to_python
 from scripts.core.version import Version
 from scripts.core.language import Translate
@@ -35,7 +35,7 @@ class ForagingItem:
         if cls._foraging is not None:
             return cls._foraging
 
-        if not os.path.exists(FORAGING_CACHE_PATH):
+        if not find_cache_file(FORAGING_CACHE_PATH):
             # forage_definitions_path = get_lua_path("forageDefinitions")
             # distribution_parser.parse_foraging(forage_definitions_path, DISTRIBUTIONS_DIR)
             distribution_parser.parse_foraging(DISTRIBUTIONS_DIR)
@@ -15,7 +15,7 @@ from scripts.core.language import Language, Translate
 from scripts.utils import lua_helper, echo, util
 from scripts.core import logger
 from scripts.core.constants import RESOURCE_DIR, ITEM_KEY_PATH
-from scripts.core.cache import load_cache, save_cache
+from scripts.core.cache import load_cache, save_cache, is_cache_current
 from scripts.core.version import Version
 from scripts.core.page_manager import get_pages
 from scripts.objects.components import FluidContainer, Durability
@@ -44,9 +44,14 @@ class Item:
     _item_key_reverse = {}  # Cache for reverse lookup of ItemKeys to item IDs
     _instances = {}
     _icon_cache_files = None
+    _icon_lookup = None  # Lowercase icon filename -> filename in texture_names.json
+    _icon_variants = None  # Base icon name -> variant icon filenames
+    _icon_overrides = None  # Item ID -> icon filename from icons.csv
     _burn_data = None
     _forage_clothing_penalties = None
 
+    ICON_VARIANTS = ("Rotten", "_Rotten", "Spoiled", "Cooked", "Burnt", "_Burnt", "Overdone")
+
     # Define property defaults
     _property_defaults = {
         "ItemType": "Normal",
@@ -423,13 +428,12 @@ class Item:
         if cls._item_key_cache is None:
             cls._item_key_cache = {}
         
-        raw_data, data_version = load_cache(ITEM_KEY_PATH, "Item key", get_version=True)
-        if data_version != Version.get():
+        if not is_cache_current(ITEM_KEY_PATH):
             from scripts.parser import java_parser
             while True:
                 user_input = input("ItemKey cache is outdated. Regenerate? (Y/N):\n> ").strip().lower()
                 if user_input == "n":
-                    data = raw_data.copy()
+                    data = load_cache(ITEM_KEY_PATH, "Item key")
                     break
                 elif user_input == "y":
                     echo.info("Regenerating item key cache...")
@@ -439,7 +443,7 @@ class Item:
                 else:
                     echo.warning("Invalid input. Please enter 'Y' or 'N'.")
         else:
-            data = raw_data.copy()
+            data = load_cache(ITEM_KEY_PATH, "Item key")
         
         flat_data = {}
         for group in data.values():
@@ -562,6 +566,64 @@ class Item:
             cls._icon_cache_files = texture_cache.get("Item", [])
         return cls._icon_cache_files
 
+    @classmethod
+    def get_icon_lookup(cls) -> dict[str, str]:
+        """Return a map of lowercase icon filenames to their filename in the icon cache."""
+        if cls._icon_lookup is None:
+            lookup = {}
+            for file in cls.get_icon_cache():
+                lookup.setdefault(file.lower(), file)
+            cls._icon_lookup = lookup
+        return cls._icon_lookup
+
+    @classmethod
+    def get_icon_variants(cls, icon: str) -> list[str]:
+        """
+        Return the variant icon filenames (e.g. 'Rotten', 'Cooked') that exist for an icon.
+
+        Args:
+            icon (str): Base icon name, without the '.png' extension.
+
+        Returns:
+            list[str]: Variant filenames, in `ICON_VARIANTS` order.
+        """
+        if cls._icon_variants is None:
+            index = {}
+            for file in set(cls.get_icon_cache()):
+                for order, variant in enumerate(cls.ICON_VARIANTS):
+                    suffix = f"{variant}.png"
+                    if file.endswith(suffix):
+                        index.setdefault(file[: -len(suffix)], []).append((order, file))
+            cls._icon_variants = {
+                base: [file for _, file in sorted(files)] for base, files in index.items()
+            }
+        return cls._icon_variants.get(icon, [])
+
+    @classmethod
+    def get_icon_overrides(cls) -> dict[str, str]:
+        """Return the icon overrides from 'icons.csv', mapped by item ID."""
+        if cls._icon_overrides is None:
+            overrides = {}
+            icons_csv = os.path.join("resources", "icons.csv")
+            if os.path.exists(icons_csv):
+                with open(icons_csv, newline="", encoding="UTF-8") as csv_file:
+                    for row in csv.DictReader(csv_file):
+                        overrides.setdefault(row["item_id"], row["icon"] + ".png")
+            else:
+                echo.warning(
+                    f"File '{icons_csv}' does not exist. Getting icon from item properties."
+                )
+            cls._icon_overrides = overrides
+        return cls._icon_overrides
+
+    @classmethod
+    def reset_icon_cache(cls):
+        """Clear the cached icon list, lookups and overrides, so they're reloaded on next use."""
+        cls._icon_cache_files = None
+        cls._icon_lookup = None
+        cls._icon_variants = None
+        cls._icon_overrides = None
+
     @classmethod
     def load_burn_data(cls):
         """Load and cache burn time data from camping_fuel.lua."""
@@ -709,36 +771,24 @@ class Item:
         icon_default = "Question_On"
         icon = None
 
-        icon_cache_files = Item.get_icon_cache()
+        icon_lookup = Item.get_icon_lookup()
 
         def check_icon_exists(icon_name):
             if isinstance(icon_name, str):
                 icon_name = [icon_name]
 
-            updated_icons = []
-            for name in icon_name:
-                for file in icon_cache_files:
-                    if file.lower() == name.lower():
-                        updated_icons.append(file)
-                        break
+            updated_icons = [
+                icon_lookup[name.lower()] for name in icon_name if name.lower() in icon_lookup
+            ]
 
             if not updated_icons:
                 return icon_name
 
             return updated_icons
 
-        icons_csv = os.path.join("resources", "icons.csv")
-        if os.path.exists(icons_csv):
-            with open(icons_csv, newline="", encoding="UTF-8") as csv_file:
-                csv_reader = csv.DictReader(csv_file)
-                for row in csv_reader:
-                    if row["item_id"] == self.item_id:
-                        icon = [row["icon"] + ".png"]
-                        break
-        else:
-            echo.warning(
-                f"File '{icons_csv}' does not exist. Getting icon from item properties."
-            )
+        override = Item.get_icon_overrides().get(self.item_id)
+        if override:
+            icon = [override]
 
         if not icon:
             icon = self.raw_icon
@@ -749,21 +799,7 @@ class Item:
 
             elif icon:
                 # Use 'Icon' property
-                icon_variants = [
-                    "Rotten",
-                    "_Rotten",
-                    "Spoiled",
-                    "Cooked",
-                    "Burnt",
-                    "_Burnt",
-                    "Overdone",
-                ]
-                icons = [icon]
-                for variant in icon_variants:
-                    variant_icon = f"{icon}{variant}.png"
-                    if variant_icon in icon_cache_files:
-                        icons.append(variant_icon)
-                icon = icons
+                icon = [icon] + Item.get_icon_variants(icon)
 
             elif self.icons_for_texture:
                 # Use 'IconsForTeture' property
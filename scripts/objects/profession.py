@@ -16,7 +16,7 @@ def parse_main_creation_methods(func: str, expression: str = None, name: str = N
 
     inject_lua = inject_lua
 
-    runtime = load_lua_file("MainCreationMethods.lua", inject_lua=inject_lua)
+    runtime = load_lua_file("MainCreationMethods.lua", inject_lua=inject_lua, shared=False)
     
     try:
         runtime.eval(f"BaseGameCharacterDetails.{func}()")
@@ -103,8 +103,11 @@ def init():
                 "ProceduralDistributions.lua"
             ]
 
-            lua_runtime = lua_helper.load_lua_file(LUA_FILE, dependencies=CLUTTER_FILES)
-            parsed_data = lua_helper.parse_lua_tables(lua_runtime)
+            # Only loaded once, so don't keep the runtime in the pool
+            lua_runtime = lua_helper.load_lua_file(LUA_FILE, dependencies=CLUTTER_FILES, shared=False)
+            # Empty the Lua tables as they're converted, so the distributions aren't held twice
+            parsed_data = lua_helper.parse_lua_tables(lua_runtime, release=True)
+            del lua_runtime
 #            parsed_data = convert_list_to_dict(parsed_data)
             parsed_data = sort_keys(parsed_data, is_top_level=True) # Sort keys for readability in json file
             save_cache(parsed_data, CACHE_JSON)
@@ -4,7 +4,7 @@ import lupa
 from lupa import LuaRuntime
 import xml.etree.ElementTree as ET
 from scripts.core.constants import CACHE_DIR, OUTPUT_DIR
-from scripts.core.cache import save_cache
+from scripts.core.cache import save_cache, is_cache_current
 from scripts.core import config_manager as cfg
 from scripts.core.file_loading import (
     get_lua_path,
@@ -16,6 +16,17 @@ from scripts.utils import lua_helper, echo
 
 cache_path = os.path.join(CACHE_DIR, "distributions")
 
+# Clutter tables loaded alongside Distributions.lua and ProceduralDistributions.lua
+CLUTTER_FILES = [
+    "Distribution_BinJunk.lua",
+    "Distribution_ShelfJunk.lua",
+    "Distribution_BagsAndContainers.lua",
+    "Distribution_ClosetJunk.lua",
+    "Distribution_CounterJunk.lua",
+    "Distribution_DeskJunk.lua",
+    "Distribution_SideTableJunk.lua",
+]
+
 
 def parse_container_files(
     distributions_lua_path, procedural_distributions_path, output_path
@@ -47,17 +58,7 @@ def parse_container_files(
 
         # Load clutter tables first
         distributions_dir = os.path.dirname(distributions_lua_path)
-        clutter_files = [
-            "Distribution_BinJunk.lua",
-            "Distribution_ShelfJunk.lua",
-            "Distribution_BagsAndContainers.lua",
-            "Distribution_ClosetJunk.lua",
-            "Distribution_CounterJunk.lua",
-            "Distribution_DeskJunk.lua",
-            "Distribution_SideTableJunk.lua",
-        ]
-
-        for cf in clutter_files:
+        for cf in CLUTTER_FILES:
             cf_path = os.path.join(distributions_dir, cf)
             if os.path.exists(cf_path):
                 with open(cf_path, "r", encoding="utf-8") as cff:
@@ -164,17 +165,7 @@ def parse_container_files(
 
         # Just like in distributions_parser, load clutter tables here
         distributions_dir = os.path.dirname(distributions_lua_path)
-        clutter_files = [
-            "Distribution_BinJunk.lua",
-            "Distribution_ShelfJunk.lua",
-            "Distribution_BagsAndContainers.lua",
-            "Distribution_ClosetJunk.lua",
-            "Distribution_CounterJunk.lua",
-            "Distribution_DeskJunk.lua",
-            "Distribution_SideTableJunk.lua",
-        ]
-
-        for cf in clutter_files:
+        for cf in CLUTTER_FILES:
             cf_path = os.path.join(distributions_dir, cf)
             if os.path.exists(cf_path):
                 with open(cf_path, "r", encoding="utf-8") as cff:
@@ -274,6 +265,25 @@ def parse_container_files(
     main()
 
 
+def get_foraging_files():
+    """
+    Gets the paths of forageDefinitions.lua and the foraging category Lua files.
+
+    Returns:
+        list: Lua file paths, starting with forageDefinitions.lua.
+    """
+    foraging_dir = os.path.join(get_lua_dir(), "shared", "Foraging")
+    categories_dir = os.path.join(foraging_dir, "Categories")
+    foraging_files = [os.path.join(foraging_dir, "forageDefinitions.lua")]
+    if os.path.exists(categories_dir):
+        foraging_files.extend(
+            os.path.join(categories_dir, filename)
+            for filename in os.listdir(categories_dir)
+            if filename.endswith(".lua")
+        )
+    return foraging_files
+
+
 def parse_foraging(output_path):
     """
     Parses foraging-related Lua files and combines their data into a single JSON output.
@@ -1060,10 +1070,16 @@ def parse_container_contents(output_path):
     echo.info(f"Container contents data saved with {len(container_dict)} containers")
 
 
-def main():
+def main(force: bool = False):
     """
     Main function to process all distribution data.
 
+    Each parse stage is skipped if its output caches are newer than its input files and from the
+    current game version.
+
+    Args:
+        force (bool, optional): Re-parse every stage, even if its caches are current. Defaults to False.
+
     Returns:
         bool: True if processing was successful, False if decompiler check failed
     """
@@ -1080,32 +1096,106 @@ def main():
     clothing_file_path = os.path.join(get_clothing_dir(), "clothing.xml")
     guid_table_path = os.path.join(get_media_dir(), "fileGuidTable.xml")
 
-    # Foraging path for init check
-    foraging_dir = os.path.join(get_lua_dir(), "shared", "Foraging")
-    forage_definitions_path = os.path.join(foraging_dir, "forageDefinitions.lua")
+    # Foraging paths, with forageDefinitions.lua first for the init check
+    foraging_files = get_foraging_files()
 
     # Call the init function to check if all files exist
     init(
         distributions_lua_path,
-        forage_definitions_path,
+        foraging_files[0],
         procedural_distributions_path,
         vehicle_distributions_path,
         clothing_file_path,
         guid_table_path,
     )
 
-    # Parse files into json
-    parse_container_files(
-        distributions_lua_path, procedural_distributions_path, cache_path
+    # Story inputs: the clutter definitions and the decompiled story classes
+    story_inputs = [
+        os.path.join(
+            get_lua_dir(),
+            "server",
+            "RandomizedWorldContent",
+            "StoryClutter",
+            "StoryClutter_Definitions.lua",
+        )
+    ]
+    story_dir = os.path.join(
+        OUTPUT_DIR, "ZomboidDecompiler", "source", "zombie", "randomizedWorld"
     )
-    parse_foraging(cache_path)
-    parse_vehicles(vehicle_distributions_path, cache_path)
+    for root, dirs, files in os.walk(story_dir):
+        story_inputs.extend(
+            os.path.join(root, filename)
+            for filename in files
+            if filename.endswith(".java")
+        )
 
-    parse_clothing(clothing_file_path, guid_table_path, "clothing.json")
-    parse_stories("stories.json")
+    # Container inputs: the distribution tables and the clutter tables they load
+    container_inputs = [distributions_lua_path, procedural_distributions_path] + [
+        os.path.join(os.path.dirname(distributions_lua_path), clutter_file)
+        for clutter_file in CLUTTER_FILES
+    ]
+
+    # Pipeline stages: (name, input files, output caches, parse function)
+    stages = [
+        (
+            "container files",
+            container_inputs,
+            ["distributions.json", "proceduraldistributions.json"],
+            lambda: parse_container_files(
+                distributions_lua_path, procedural_distributions_path, cache_path
+            ),
+        ),
+        (
+            "foraging",
+            foraging_files,
+            ["foraging.json"],
+            lambda: parse_foraging(cache_path),
+        ),
+        (
+            "vehicles",
+            [vehicle_distributions_path],
+            ["vehicle_distributions.json"],
+            lambda: parse_vehicles(vehicle_distributions_path, cache_path),
+        ),
+        (
+            "clothing",
+            [clothing_file_path, guid_table_path],
+            ["clothing.json"],
+            lambda: parse_clothing(clothing_file_path, guid_table_path, "clothing.json"),
+        ),
+        (
+            "stories",
+            story_inputs,
+            ["stories.json"],
+            lambda: parse_stories("stories.json"),
+        ),
+        (
+            # Item scripts are also an input, but only change with the game version
+            "container contents",
+            container_inputs
+            + [
+                os.path.join(cache_path, "distributions.json"),
+                os.path.join(cache_path, "proceduraldistributions.json"),
+            ],
+            ["container_contents.json"],
+            lambda: parse_container_contents(cache_path),
+        ),
+    ]
+
+    skipped = []
+    for name, inputs, outputs, parse in stages:
+        if not force and all(
+            is_cache_current(os.path.join(cache_path, output), inputs=inputs)
+            for output in outputs
+        ):
+            skipped.append(name)
+            continue
+        parse()
 
-    # Parse container contents
-    parse_container_contents(cache_path)
+    if skipped:
+        echo.info(
+            f"Skipped parsing {', '.join(skipped)}: caches are newer than their inputs and the game version is unchanged."
+        )
     return True
 
 
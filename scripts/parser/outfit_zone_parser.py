@@ -10,6 +10,7 @@ import os
 from lupa import LuaRuntime, LuaError
 
 from scripts.core.constants import CACHE_DIR
+from scripts.core.cache import load_cache, find_cache_file
 from scripts.core.file_loading import get_lua_dir, read_file
 from scripts.utils import echo
 from scripts.utils.lua_helper import parse_lua_tables, save_cache
@@ -24,19 +25,14 @@ def parse_outfit_zones(force_regenerate: bool = False) -> dict:
     """
     cache_file = os.path.join(CACHE_DIR, "zone_definitions.json")
 
-    if not force_regenerate and os.path.exists(cache_file):
+    if not force_regenerate and find_cache_file(cache_file):
         echo.info("Loading zone definitions from cache...")
 
-        try:
-            import json
-
-            with open(cache_file, "r", encoding="utf-8") as f:
-                cached_data = json.load(f)
-
+        cached_data = load_cache(cache_file, "zone definitions", suppress=True)
+        if cached_data:
             echo.success("Loaded cached zone definitions data")
             return cached_data
-        except Exception as e:
-            echo.warning(f"Failed to load cache, regenerating: {e}")
+        echo.warning("Failed to load cache, regenerating")
 
     echo.info("Loading ZombiesZoneDefinition.lua file...")
 
@@ -1,11 +1,13 @@
 """
 Parser for .pack texture atlas files.
 
-This module reads pack data and returns structured metadata.
+This module reads pack data and returns structured metadata. Pack files are
+memory-mapped, so only the parts that are read are loaded into memory.
 """
 
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
+import mmap
 import re
 import struct
 
@@ -107,7 +109,7 @@ class PackSheet:
 
 @dataclass(slots=True)
 class Pack:
-    """Parsed .pack metadata and original bytes."""
+    """Parsed .pack metadata and original bytes, which may be a memory-mapped file."""
 
     sheets: list[PackSheet]
     version: int | None
@@ -115,7 +117,13 @@ class Pack:
     parser: str
     path: Path | None = None
     fallback_reason: str | None = None
-    data: bytes = field(default=b"", repr=False)
+    data: bytes | mmap.mmap = field(default=b"", repr=False)
+
+    def __enter__(self) -> "Pack":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     @classmethod
     def from_metadata(cls, data: dict, path: Path | None = None) -> "Pack":
@@ -142,10 +150,20 @@ class Pack:
             "sheets": [sheet.to_dict() for sheet in self.sheets],
         }
 
-    def png_bytes(self, sheet: PackSheet) -> bytes:
+    def png_bytes(self, sheet: PackSheet) -> memoryview:
+        """Return a sheet's PNG data as a zero-copy view of the pack data."""
         if not self.data:
             raise PackParserError("Pack does not contain source bytes.")
-        return self.data[sheet.png_start:sheet.png_end]
+        return memoryview(self.data)[sheet.png_start:sheet.png_end]
+
+    def close(self) -> None:
+        """Release the pack data, unmapping the file if it was memory-mapped.
+
+        Views from ``png_bytes`` must be released first.
+        """
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+        self.data = b""
 
 
 def read_u32(data: bytes, pos: int) -> tuple[int, int]:
@@ -353,14 +371,14 @@ def parse_structured_pack(data: bytes, path: Path | None = None) -> Pack:
 
 def scan_sheet_meta(data: bytes, meta_start: int, meta_end: int, sheet_width: int, sheet_height: int) -> list[SpriteEntry]:
     """Scan a metadata range for sprite names followed by sprite values."""
-    seg = data[meta_start:meta_end]
     sprites: list[tuple[int, SpriteEntry]] = []
     seen: set[tuple[str, int, int, int, int]] = set()
 
-    for match in NAME_RE.finditer(seg):
+    # Search the range in place, rather than copying it out of the pack data
+    for match in NAME_RE.finditer(data, meta_start, meta_end):
         raw_name = match.group(0)
         name = raw_name.decode("ascii", "ignore")
-        name_end = meta_start + match.end()
+        name_end = match.end()
 
         for align in range(-1, 5):
             pos = name_end + align
@@ -438,7 +456,26 @@ def parse_pack(data: bytes, path: Path | None = None, fallback: bool = True) ->
         return pack
 
 
+def map_pack_file(path: str | Path) -> bytes | mmap.mmap:
+    """Memory-map a pack file read-only. Empty files, which can't be mapped, return empty bytes."""
+    with open(path, "rb") as file:
+        if file.seek(0, 2) == 0:
+            return b""
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 def parse_pack_file(path: str | Path, fallback: bool = True) -> Pack:
-    """Read and parse a pack file."""
+    """Memory-map and parse a pack file.
+
+    The returned pack keeps the file mapped for ``png_bytes``. Use ``Pack.close``
+    or a ``with`` block to unmap it early.
+    """
     pack_path = Path(path)
-    return parse_pack(pack_path.read_bytes(), pack_path, fallback=fallback)
+    data = map_pack_file(pack_path)
+
+    try:
+        return parse_pack(data, pack_path, fallback=fallback)
+    except Exception:
+        if isinstance(data, mmap.mmap):
+            data.close()
+        raise
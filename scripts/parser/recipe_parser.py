@@ -588,68 +588,90 @@ def parse_sprite_config(block_text: str) -> Tuple[Dict[str, List[str]], float]:
     return sprite_mapping, base_health
 
 
-def parse_construction_recipe(full_text: str) -> List[Dict[str, Any]]:
+def collect_construction_data(
+    full_text: str,
+) -> Tuple[Dict[str, Dict[str, Dict[str, str]]], List[Dict[str, Any]]]:
     """
-    Parse every `entity … { component CraftRecipe { … } }` in the source text
-    and return a list of normalised recipe dictionaries.
-
-    The routine now:
-
-      1.  Collects a *global* skin‑mapping for **all** modules first.
-      2.  Parses each entity and resolves its (skinName, entityStyle) pair
-          against that global table so the `outputs` field is always filled
-          when the information exists anywhere in the file‑set.
+    Collect the skin-mapping and entity entries from the source text, without
+    resolving them into recipes. Results from several files can be merged
+    before being passed to `build_construction_recipes`.
     """
-    construction_recipes: List[Dict[str, Any]] = []
-    module_blocks = parse_module_block(full_text)
+    skin_mapping: Dict[str, Dict[str, Dict[str, str]]] = {}
+    entity_entries: List[Dict[str, Any]] = []
 
-    global_skin_mapping: Dict[str, Dict[str, Dict[str, str]]] = {}
-    for module_entry in module_blocks:
+    for module_entry in parse_module_block(full_text):
         skin_map = parse_module_skin_mapping(module_entry["block"])
         # merge (keeps earlier values if there are duplicates)
         for skin_name, entity_map in skin_map.items():
-            global_skin_mapping.setdefault(skin_name, {}).update(entity_map)
+            skin_mapping.setdefault(skin_name, {}).update(entity_map)
 
-    for module_entry in module_blocks:
-        entity_blocks = parse_entity_blocks(module_entry["block"])
+        entity_entries.extend(parse_entity_blocks(module_entry["block"]))
 
-        for entity_entry in entity_blocks:
-            entity_name: str = entity_entry["name"]
-            craft_recipe_block = entity_entry["components"].get("CraftRecipe")
-            if not craft_recipe_block:
-                continue  # entity has no CraftRecipe component
+    return skin_mapping, entity_entries
 
-            parsed_recipe_block = parse_recipe_block(
-                craft_recipe_block.splitlines(), block_id=entity_name
-            )
 
-            recipe_output: Dict[str, Any] = {"name": entity_name}
-            recipe_output.update(parsed_recipe_block)
+def build_construction_recipes(
+    global_skin_mapping: Dict[str, Dict[str, Dict[str, str]]],
+    entity_entries: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    """
+    Resolve entity entries with a `CraftRecipe` component into normalised
+    recipe dictionaries, using the global skin-mapping for their outputs.
+    """
+    construction_recipes: List[Dict[str, Any]] = []
 
-            skin_name: str = entity_entry.get("skinName")
-            entity_style: str = entity_entry.get("entityStyle")
+    for entity_entry in entity_entries:
+        entity_name: str = entity_entry["name"]
+        craft_recipe_block = entity_entry["components"].get("CraftRecipe")
+        if not craft_recipe_block:
+            continue  # entity has no CraftRecipe component
 
-            if skin_name and entity_style:
-                style_mapping = global_skin_mapping.get(skin_name, {})
-                if entity_style in style_mapping:
-                    skin_entry_mapping = style_mapping[entity_style]
-                    recipe_output["outputs"] = [
-                        {
-                            "displayName": skin_entry_mapping.get("DisplayName"),
-                            "icon": skin_entry_mapping.get("Icon"),
-                        }
-                    ]
+        parsed_recipe_block = parse_recipe_block(
+            craft_recipe_block.splitlines(), block_id=entity_name
+        )
 
-            sprite_outputs, base_health = parse_sprite_config(
-                entity_entry["components"].get("SpriteConfig", "")
-            )
-            recipe_output["spriteOutputs"] = sprite_outputs
-            if base_health is not None:
-                recipe_output["skillBaseHealth"] = base_health
+        recipe_output: Dict[str, Any] = {"name": entity_name}
+        recipe_output.update(parsed_recipe_block)
 
-            if recipe_output.get("category", "").lower() == "debug":
-                continue
+        skin_name: str = entity_entry.get("skinName")
+        entity_style: str = entity_entry.get("entityStyle")
+
+        if skin_name and entity_style:
+            style_mapping = global_skin_mapping.get(skin_name, {})
+            if entity_style in style_mapping:
+                skin_entry_mapping = style_mapping[entity_style]
+                recipe_output["outputs"] = [
+                    {
+                        "displayName": skin_entry_mapping.get("DisplayName"),
+                        "icon": skin_entry_mapping.get("Icon"),
+                    }
+                ]
 
-            construction_recipes.append(recipe_output)
+        sprite_outputs, base_health = parse_sprite_config(
+            entity_entry["components"].get("SpriteConfig", "")
+        )
+        recipe_output["spriteOutputs"] = sprite_outputs
+        if base_health is not None:
+            recipe_output["skillBaseHealth"] = base_health
+
+        if recipe_output.get("category", "").lower() == "debug":
+            continue
+
+        construction_recipes.append(recipe_output)
 
     return construction_recipes
+
+
+def parse_construction_recipe(full_text: str) -> List[Dict[str, Any]]:
+    """
+    Parse every `entity … { component CraftRecipe { … } }` in the source text
+    and return a list of normalised recipe dictionaries.
+
+    The routine now:
+
+      1.  Collects a *global* skin‑mapping for **all** modules first.
+      2.  Parses each entity and resolves its (skinName, entityStyle) pair
+          against that global table so the `outputs` field is always filled
+          when the information exists anywhere in the file‑set.
+    """
+    return build_construction_recipes(*collect_construction_data(full_text))
@@ -1,14 +1,17 @@
+import os
 import re
 import copy
+import hashlib
+from concurrent.futures import ProcessPoolExecutor
 from tqdm import tqdm
 from pathlib import Path
-from scripts.core.file_loading import get_script_files, read_file
+from scripts.core.file_loading import get_script_files, read_file, hash_file
 from scripts.core.language import Translate
-from scripts.core.cache import save_cache, load_cache
+from scripts.core.cache import save_cache, load_cache, is_cache_current
 from scripts.core.constants import CACHE_DIR, PBAR_FORMAT, DIFF_DIR
 from scripts.core.version import Version
 from scripts.core import config_manager as config
-from scripts.parser.recipe_parser import parse_recipe_block, parse_construction_recipe
+from scripts.parser.recipe_parser import parse_recipe_block, collect_construction_data, build_construction_recipes
 from scripts.utils import echo, color
 
 PREFIX_BLACKLIST = {
@@ -25,6 +28,30 @@ PREFIX_BLACKLIST = {
 
 COLON_SEPARATOR = ["fixing", "evolvedrecipe"]
 
+# Script types parsed together in a single pass over the script files.
+# 'template' is listed before 'vehicle', as vehicle post-processing injects templates.
+SCRIPT_TYPES = (
+    "item",
+    "fluid",
+    "template",
+    "vehicle",
+    "fixing",
+    "evolvedrecipe",
+    "uniquerecipe",
+    "craftRecipe",
+    "entity",
+    "energy",
+    "multistagebuild",
+    "model",
+    "animation",
+    "animationsMesh",
+    "mannequin",
+    "timedAction",
+    "physicsHitReaction",
+    "ragdoll",
+    "sound",
+)
+
 # Available configs:
 # list_keys              = Store multiple identical keys as a list. Always treated as a list.
 # list_keys_semicolon    = Split the value by semicolons (`;`) into a list. Always treated as a list.
@@ -199,6 +226,25 @@ SCRIPT_CONFIGS = {
 # Cached scripts
 script_cache = {}
 
+# Per-file caches, so only changed script files are re-parsed, and only their caches rewritten
+SCRIPT_MANIFEST_CACHE = "parsed_script_manifest.json"
+SCRIPT_FILES_CACHE_DIR = str(Path(CACHE_DIR) / "script_files")
+_file_hashes = {}  # {(path, mtime_ns, size): sha256}
+
+# Disabled in worker processes, where 'DisplayName' is translated after merging instead
+_translate_display_names = True
+
+# Value converters for each script type, see `_build_value_converters()`
+_value_converters = {}
+
+BASE_PREFIX_PATTERN = re.compile(r"([;,|/\s:])base:", re.IGNORECASE)
+KEY_VALUE_PATTERN = re.compile(r"^([^\s:=]+)\s*[:=]\s*(.+)")
+MODULE_PATTERN = re.compile(r"^module\s+(\w+)")
+SCRIPT_BLOCK_PATTERN = re.compile(r"^(\w+)\s+(.+)")
+BLOCK_HEADER_PATTERN = re.compile(r"^(\w+)(?:\s+([\w*/]+))?$")
+NESTED_HEADER_PATTERN = re.compile(r"^\w+(?:\s+[\w*/@]+)?$")
+COMPONENT_PATTERN = re.compile(r"^component\s+(\w+)$")
+
 ## ------------------------- Post Processing ------------------------- ##
 
 
@@ -613,79 +659,88 @@ def process_value(
     Returns:
         str | list | dict: The processed value, cast into a normalised format (e.g., list, dict, or scalar).
     """
-    config = SCRIPT_CONFIGS.get(script_type, {})
+    converters = _value_converters.get(script_type)
+    if converters is None:
+        converters = _build_value_converters(script_type)
+
+    converter = converters.get(key.lower())
+    if converter is None:
+        return normalise(value)
+    return converter(value, block_id)
+
 
-    key_lower = key.lower()
-
-    # Initialise configs
-    list_keys = {k.lower() for k in config.get("list_keys", [])}
-    list_keys_semicolon = {k.lower() for k in config.get("list_keys_semicolon", [])}
-    list_keys_colon = {k.lower() for k in config.get("list_keys_colon", [])}
-    list_keys_pipe = {k.lower() for k in config.get("list_keys_pipe", [])}
-    list_keys_space = {k.lower() for k in config.get("list_keys_space", [])}
-    list_keys_slash = {k.lower() for k in config.get("list_keys_slash", [])}
-    dict_keys = {k.lower() for k in config.get("dict_keys", [])}
-    dict_keys_colon = {k.lower() for k in config.get("dict_keys_colon", [])}
-    dict_keys_equal = {k.lower() for k in config.get("dict_keys_equal", [])}
-    dict_keys_space = {k.lower() for k in config.get("dict_keys_space", [])}
-
-    parts = [value]
-
-    # Process values based on configs and special cases
-    if key_lower == "evolvedrecipe" and script_type == "item":
-        return parse_evolved_recipe(value, block_id)
-    elif key_lower == "displayname" and script_type == "item":
+def _translate_display_name(value: str, block_id: str) -> str:
+    """Special case for 'DisplayName', translated to English when enabled."""
+    if _translate_display_names:
         value = Translate.get(block_id, "DisplayName", "en", value)
-        return value
-    elif key_lower == "fluid" and script_type in ("item", "entity"):
-        return parse_fluid(value, block_id)
-    elif key_lower == "fixer" and script_type == "fixing":
-        return parse_fixer(value, block_id)
-    elif key_lower in list_keys_semicolon:
-        parts = split_semicolon_list(value)
-    elif key_lower in list_keys_colon:
-        parts = split_colon_list(value)
-    elif key_lower in list_keys_pipe:
-        parts = split_pipe_list(value)
-    elif key_lower in list_keys_slash:
-        parts = split_slash_list(value)
-    elif key_lower in list_keys_space:
-        parts = split_space_list(value)
-    else:
-        parts = [normalise(value)]
-
-    # If it should be a dict (e.g., colon-separated pairs)
-    if key_lower in dict_keys_colon:
-        return split_colon_dict(parts)
-    if key_lower in dict_keys_equal:
-        return split_equal_dict(parts)
-    if key_lower in dict_keys_space:
-        return split_space_dict(parts)
-
-    # Ensure list if required
-    if key_lower in list_keys:
-        return parts
-    # Ensure dict if required, adding duplicates
-    if key_lower in dict_keys:
-        count_dict = {}
-        for entry in parts:
-            count_dict[entry] = count_dict.get(entry, 0) + 1
-        return count_dict
-
-    # Ensure we return as a list when required
-    list_keys_combined = (
-        list_keys
-        | list_keys_semicolon
-        | list_keys_pipe
-        | list_keys_space
-        | list_keys_slash
-        | list_keys_colon
+    return value
+
+
+def _count_entries(parts: list) -> dict:
+    """Store duplicate entries as counts in a dict."""
+    count_dict = {}
+    for entry in parts:
+        count_dict[entry] = count_dict.get(entry, 0) + 1
+    return count_dict
+
+
+def _make_value_converter(splitter, finaliser):
+    """Combine a splitter and finaliser into a `(value, block_id)` converter for `process_value()`."""
+    if splitter is None:
+        return lambda value, block_id: finaliser([normalise(value)])
+    return lambda value, block_id: finaliser(splitter(value))
+
+
+def _build_value_converters(script_type: str) -> dict:
+    """
+    Build and cache the lowercase key -> converter table for a script type, from its `SCRIPT_CONFIGS` rules.
+    Keys without a converter are normalised as a single value.
+    """
+    config = SCRIPT_CONFIGS.get(script_type, {})
+
+    def keys(rule: str) -> set[str]:
+        return {k.lower() for k in config.get(rule, [])}
+
+    # Splitters, in order of precedence
+    splitters = (
+        (keys("list_keys_semicolon"), split_semicolon_list),
+        (keys("list_keys_colon"), split_colon_list),
+        (keys("list_keys_pipe"), split_pipe_list),
+        (keys("list_keys_slash"), split_slash_list),
+        (keys("list_keys_space"), split_space_list),
+    )
+    list_keys_combined = keys("list_keys").union(*(key_set for key_set, _ in splitters))
+
+    # Finalisers, in order of precedence
+    finalisers = (
+        (keys("dict_keys_colon"), split_colon_dict),
+        (keys("dict_keys_equal"), split_equal_dict),
+        (keys("dict_keys_space"), split_space_dict),
+        (keys("list_keys"), lambda parts: parts),
+        (keys("dict_keys"), _count_entries),
+        (list_keys_combined, lambda parts: parts),
     )
-    if key_lower in list_keys_combined:
-        return parts
 
-    # Fallback
-    return parts[0] if len(parts) == 1 else parts
+    converters = {}
+    for key_lower in set().union(*(key_set for key_set, _ in splitters + finalisers)):
+        splitter = next((func for key_set, func in splitters if key_lower in key_set), None)
+        finaliser = next(
+            (func for key_set, func in finalisers if key_lower in key_set),
+            lambda parts: parts[0] if len(parts) == 1 else parts,
+        )
+        converters[key_lower] = _make_value_converter(splitter, finaliser)
+
+    # Special cases
+    if script_type == "item":
+        converters["evolvedrecipe"] = parse_evolved_recipe
+        converters["displayname"] = _translate_display_name
+    if script_type in ("item", "entity"):
+        converters["fluid"] = parse_fluid
+    if script_type == "fixing":
+        converters["fixer"] = parse_fixer
+
+    _value_converters[script_type] = converters
+    return converters
 
 
 def normalise(value: str) -> str | int | float | bool:
@@ -699,21 +754,22 @@ def normalise(value: str) -> str | int | float | bool:
         str | int | float | bool: The value converted to its appropriate type.
     """
     value = value.strip().rstrip(",")
+    lower = value.lower()
 
     # Remove 'base:' prefix (case insensitive) from anywhere in the value
-    # Handle at start of string
-    if value.lower().startswith("base:"):
-        value = value[5:]
-    # Handle after any separator (semicolon, comma, pipe, slash, space, colon)
-    value = re.sub(r"([;,|/\s:])base:", r"\1", value, flags=re.IGNORECASE)
-
-    lower = value.lower()
+    if "base:" in lower:
+        # Handle at start of string
+        if lower.startswith("base:"):
+            value = value[5:]
+        # Handle after any separator (semicolon, comma, pipe, slash, space, colon)
+        value = BASE_PREFIX_PATTERN.sub(r"\1", value)
+        lower = value.lower()
 
     if lower in ("true", "false"):
         return lower == "true"
 
     # Java-style float suffix
-    if value.lower().endswith("f"):
+    if lower.endswith("f"):
         stripped = value[:-1]
         try:
             return float(stripped)
@@ -745,36 +801,140 @@ def remove_comments(lines: list[str]) -> list[str]:
     block_depth = 0
 
     for raw_line in lines:
+        # Fast path for lines without any comment markers
+        if block_depth == 0 and "/" not in raw_line:
+            stripped_line = raw_line.strip()
+            if stripped_line:
+                cleaned_lines.append(stripped_line)
+            continue
+
         char_pos = 0
-        output_chars: list[str] = []
+        output_parts: list[str] = []
 
         while char_pos < len(raw_line):
-            # Single line comments
-            if block_depth == 0 and raw_line[char_pos : char_pos + 2] == "//":
-                break
-
-            # Multi line comments (nesting supported)
-            if raw_line[char_pos : char_pos + 2] == "/*":
-                block_depth += 1
-                char_pos += 2
-                continue
-            if block_depth and raw_line[char_pos : char_pos + 2] == "*/":
-                block_depth -= 1
-                char_pos += 2
-                continue
-
             if block_depth == 0:
-                output_chars.append(raw_line[char_pos])
+                line_comment = raw_line.find("//", char_pos)
+                block_open = raw_line.find("/*", char_pos)
 
-            char_pos += 1
+                # Single line comments
+                if line_comment != -1 and (block_open == -1 or line_comment < block_open):
+                    output_parts.append(raw_line[char_pos:line_comment])
+                    break
+                if block_open == -1:
+                    output_parts.append(raw_line[char_pos:])
+                    break
+
+                output_parts.append(raw_line[char_pos:block_open])
+                block_depth += 1
+                char_pos = block_open + 2
+            else:
+                # Multi line comments (nesting supported)
+                block_open = raw_line.find("/*", char_pos)
+                block_close = raw_line.find("*/", char_pos)
+                if block_close == -1 and block_open == -1:
+                    break
+                if block_open != -1 and (block_close == -1 or block_open < block_close):
+                    block_depth += 1
+                    char_pos = block_open + 2
+                else:
+                    block_depth -= 1
+                    char_pos = block_close + 2
 
-        stripped_line = "".join(output_chars).strip()
+        stripped_line = "".join(output_parts).strip()
         if stripped_line and block_depth == 0:
             cleaned_lines.append(stripped_line)
 
     return cleaned_lines
 
 
+def _match_block_ends(lines: list[str]) -> dict[int, int]:
+    """
+    Find where every block opened by a '{' line ends, in a single pass.
+
+    A block ends on the first line where the running brace count drops below its value at the '{' line.
+
+    Returns:
+        dict[int, int]: Index of each '{' line mapped to the index of its closing line, or `len(lines)` if unclosed.
+    """
+    block_ends = {}
+    open_blocks = []  # (index, brace count) of unclosed '{' lines, with non-decreasing counts
+    depth = 0
+    for index, line in enumerate(lines):
+        if "{" in line or "}" in line:
+            depth += line.count("{") - line.count("}")
+            while open_blocks and open_blocks[-1][1] > depth:
+                block_ends[open_blocks.pop()[0]] = index
+            if line == "{":
+                open_blocks.append((index, depth))
+    for index, _ in open_blocks:
+        block_ends[index] = len(lines)
+    return block_ends
+
+
+class ScriptLines:
+    """
+    Comment-free, stripped lines of a script, with every block's extent resolved up front.
+
+    Blocks are passed to the parsers as `(start, end)` spans over the same lines, so nested blocks
+    aren't re-scanned for comments or braces, keeping parsing linear in the file size.
+    """
+
+    __slots__ = ("lines", "block_ends", "_nested_counts", "_separator_counts")
+
+    def __init__(self, lines: list[str]):
+        """
+        Args:
+            lines (list[str]): Lines with comments already removed, e.g. from `remove_comments()`.
+        """
+        self.lines = [line.strip() for line in lines]
+        self.block_ends = _match_block_ends(self.lines)
+        self._nested_counts = None
+        self._separator_counts = {}
+
+    @classmethod
+    def from_text(cls, content: str) -> "ScriptLines":
+        """Remove comments from script text and index its blocks."""
+        return cls(remove_comments(content.splitlines()))
+
+    def block_span(self, brace_index: int, end: int) -> tuple[int, int]:
+        """
+        Get the span of the block opened by the '{' line at `brace_index`, including its closing line.
+
+        Args:
+            brace_index (int): Index of the '{' line.
+            end (int): End of the enclosing span, which the block can't extend past.
+        """
+        return brace_index + 1, min(self.block_ends.get(brace_index, len(self.lines)) + 1, end)
+
+    @staticmethod
+    def _count(flags) -> list[int]:
+        counts = [0]
+        total = 0
+        for flag in flags:
+            total += flag
+            counts.append(total)
+        return counts
+
+    def has_nested_block(self, start: int, end: int) -> bool:
+        """Check if any line in the span is a block header followed by '{'."""
+        if self._nested_counts is None:
+            lines = self.lines
+            self._nested_counts = self._count(
+                lines[i + 1] == "{" and NESTED_HEADER_PATTERN.match(lines[i]) is not None
+                for i in range(len(lines) - 1)
+            )
+        if end - start < 2:
+            return False
+        return self._nested_counts[end - 1] > self._nested_counts[start]
+
+    def has_separator(self, separator: str, start: int, end: int) -> bool:
+        """Check if any line in the span contains the separator."""
+        counts = self._separator_counts.get(separator)
+        if counts is None:
+            counts = self._separator_counts[separator] = self._count(separator in line for line in self.lines)
+        return counts[end] > counts[start]
+
+
 def parse_key_value_line(
     line: str, data: dict, block_id: str = "Unknown", script_type: str = ""
 ) -> None:
@@ -791,7 +951,7 @@ def parse_key_value_line(
     Returns:
         None
     """
-    match = re.match(r"^([^\s:=]+)\s*[:=]\s*(.+)", line)
+    match = KEY_VALUE_PATTERN.match(line)
     if not match:
         return
 
@@ -844,68 +1004,56 @@ def parse_key_value_line(
 
 
 def parse_block(
-    lines: list[str], block_id: str = "Unknown", script_type: str = ""
+    lines: "list[str] | ScriptLines",
+    block_id: str = "Unknown",
+    script_type: str = "",
+    start: int = 0,
+    end: int = None,
 ) -> dict:
     """
     Parse a block of script lines into a nested dictionary.
 
     Args:
-        lines (list[str]): Block of script lines.
+        lines (list[str] | ScriptLines): Block of script lines, or the indexed lines of a whole script.
         block_id (str, optional): Identifier for this block. Defaults to "Unknown".
         script_type (str, optional): Script type to apply correct parsing rules. Defaults to "".
+        start (int, optional): Index of the block's first line. Defaults to 0.
+        end (int, optional): Index after the block's last line. Defaults to the end of `lines`.
 
     Returns:
         dict: Parsed block as a structured dictionary.
     """
+    if not isinstance(lines, ScriptLines):
+        lines = ScriptLines(lines)
+    text = lines.lines
+    if end is None:
+        end = len(text)
 
-    def is_nested_block_start(lines: list[str]) -> bool:
-        """Checks if any line is followed by '{', indicating a nested block."""
-        for i in range(len(lines) - 1):
-            line = lines[i].strip()
-            next_line = lines[i + 1].strip()
-            if re.match(r"^\w+(?:\s+[\w*/@]+)?$", line) and next_line == "{":
-                return True
-        return False
+    # Assign a separator based on the script type
+    separator = ":" if script_type in COLON_SEPARATOR else "="
 
     data = {}
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
+    i = start
+    while i < end:
+        line = text[i]
 
-        block_match = re.match(r"^(\w+)(?:\s+([\w*/]+))?$", line)
+        block_match = BLOCK_HEADER_PATTERN.match(line)
         # Check if this line starts a new nested block
-        if block_match and i + 1 < len(lines) and lines[i + 1].strip() == "{":
+        if block_match and i + 1 < end and text[i + 1] == "{":
             block_type, block_name = block_match.groups()
-            i += 2
-            block_lines = []
-            block_depth = 1
-
-            while i < len(lines):
-                next_line = lines[i].strip()
-                block_depth += next_line.count("{")
-                block_depth -= next_line.count("}")
-                block_lines.append(next_line)
-                i += 1
-                if block_depth <= 0:
-                    break
-
-            stripped_block_lines = remove_comments(block_lines)
-
-            has_nested_block = is_nested_block_start(stripped_block_lines)
-
-            # Assign a separator based on the script type
-            separator = r":" if script_type in COLON_SEPARATOR else r"="
+            block_start, block_end = lines.block_span(i + 1, end)
+            i = block_end
 
             # Special case for 'itemMapper' block type
             if block_type == "itemMapper":
-                block_data = parse_item_mapper(stripped_block_lines, block_id)
+                block_data = parse_item_mapper(text[block_start:block_end], block_id)
             # Determine whether to parse this block recursively (nested structure or key-value pairs)
-            elif has_nested_block or any(
-                re.search(separator, ln) for ln in stripped_block_lines
+            elif lines.has_nested_block(block_start, block_end) or lines.has_separator(
+                separator, block_start, block_end
             ):
-                block_data = parse_block(stripped_block_lines, block_id, script_type)
+                block_data = parse_block(lines, block_id, script_type, block_start, block_end)
             else:
-                block_data = [normalise(ln) for ln in stripped_block_lines if ln != "}"]
+                block_data = [normalise(ln) for ln in text[block_start:block_end] if ln != "}"]
 
             if block_name:
                 data.setdefault(block_type, {})[block_name] = block_data
@@ -947,47 +1095,47 @@ def is_blacklisted(filepath: str, script_type: str) -> bool:
 
 
 def parse_entity_block(
-    lines: list[str], entity_name: str, script_type: str = "entity"
+    lines: "list[str] | ScriptLines",
+    entity_name: str,
+    script_type: str = "entity",
+    start: int = 0,
+    end: int = None,
 ) -> dict:
     """
     Parse an entity block to extract component data.
 
     Args:
-        lines (list[str]): Lines within the entity block
+        lines (list[str] | ScriptLines): Lines within the entity block, or the indexed lines of a whole script
         entity_name (str): Name of the entity
         script_type (str): Script type (should be "entity")
+        start (int, optional): Index of the block's first line. Defaults to 0.
+        end (int, optional): Index after the block's last line. Defaults to the end of `lines`.
 
     Returns:
         dict: Parsed entity data with flattened component fields
     """
+    if not isinstance(lines, ScriptLines):
+        lines = ScriptLines(lines)
+    text = lines.lines
+    if end is None:
+        end = len(text)
+
     entity_data = {}
-    i = 0
+    i = start
 
-    while i < len(lines):
-        line = lines[i].strip()
+    while i < end:
+        line = text[i]
 
         # Check for component blocks
-        component_match = re.match(r"^component\s+(\w+)$", line)
-        if component_match and i + 1 < len(lines) and lines[i + 1].strip() == "{":
+        component_match = COMPONENT_PATTERN.match(line)
+        if component_match and i + 1 < end and text[i + 1] == "{":
             component_name = component_match.group(1)
-            i += 2
-            component_lines = []
-            block_depth = 1
-
-            while i < len(lines):
-                next_line = lines[i].strip()
-                block_depth += next_line.count("{")
-                block_depth -= next_line.count("}")
-                component_lines.append(next_line)
-                i += 1
-                if block_depth <= 0:
-                    break
-
-            cleaned = remove_comments(component_lines)
+            block_start, block_end = lines.block_span(i + 1, end)
+            i = block_end
 
             # Skip CraftRecipe component as it's handled by parse_construction_recipe
             if component_name != "CraftRecipe":
-                component_data = parse_block(cleaned, entity_name, script_type)
+                component_data = parse_block(lines, entity_name, script_type, block_start, block_end)
 
                 # Flatten component data into entity data
                 # For SpriteConfig, extract key fields at the top level
@@ -1032,278 +1180,502 @@ def parse_entity_block(
     return entity_data
 
 
-def check_cache_version(script_type: str):
-    cached_data, cached_version = load_cache(
-        f"parsed_{script_type}_data.json", f"{script_type}", get_version=True
-    )
-    if cached_version == Version.get():
-        return cached_data
+def check_cache_version(script_type: str, sources: dict = None):
+    """Loads the cache of a script type, if it's current and was saved with the given `get_script_sources()`."""
+    cache_file = f"parsed_{script_type}_data.json"
+    if is_cache_current(cache_file, sources=sources):
+        return load_cache(cache_file, f"{script_type}")
     return {}
 
 
-def extract_script_data(
-    script_type: str,
-    do_post_processing: bool = True,
-    cache_result: bool = True,
-    use_cache=True,
-) -> dict[str, dict]:
+## ------------------------- File Cache ------------------------- ##
+
+
+def _get_file_entry(filepath: str, previous: dict = None) -> dict:
     """
-    Parses all script files of a given script type, extracting blocks into dictionaries keyed by FullType (i.e. [Module].[Type])
+    Gets the manifest entry (mtime, size and sha256) of a script file.
+    The hash is only recalculated when the file's stat differs from the previous entry.
+    """
+    stat = Path(filepath).stat()
+    entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+    if previous and previous.get("mtime_ns") == entry["mtime_ns"] and previous.get("size") == entry["size"]:
+        entry["sha256"] = previous.get("sha256")
+        return entry
+
+    key = (filepath, entry["mtime_ns"], entry["size"])
+    if key not in _file_hashes:
+        _file_hashes[key] = hash_file(Path(filepath))
+    entry["sha256"] = _file_hashes[key]
+    return entry
+
+
+def load_script_manifest() -> dict[str, dict]:
+    """Loads the per-file script manifest, or an empty dict if it's from another version."""
+    if not is_cache_current(SCRIPT_MANIFEST_CACHE):
+        return {}
+    return load_cache(SCRIPT_MANIFEST_CACHE, "script manifest", suppress=True)
+
+
+def scan_script_files(
+    script_files: list[str], manifest: dict[str, dict]
+) -> tuple[dict[str, dict], set[str]]:
+    """
+    Compares script files against the manifest, by stat first and then by hash.
 
     Args:
-        script_type (str): Type of script to extract (e.g., "item", "vehicle").
-        prefix (str): Required prefix of the block type (e.g., "vehicle_").
+        script_files (list[str]): Absolute paths of the script files.
+        manifest (dict[str, dict]): Previously saved manifest entries, keyed by file path.
 
     Returns:
-        dict[str, dict]: A dictionary of parsed script blocks keyed by full ID (FullType).
+        tuple[dict[str, dict], set[str]]: Updated manifest entries for the current files, and paths that changed or are new.
     """
-    global script_cache
+    new_manifest = {}
+    changed = set()
 
-    # Clear memory cache
-    if not use_cache or config.get_debug_mode():
-        script_cache = {}
+    for filepath in script_files:
+        previous = manifest.get(filepath)
+        try:
+            entry = _get_file_entry(filepath, previous)
+        except OSError:
+            changed.add(filepath)
+            continue
 
-    # Get script_type from cache if it's already been parsed.
-    if script_type in script_cache:
-        return script_cache[script_type]
+        if previous and previous.get("sha256") == entry["sha256"]:
+            entry["types"] = previous.get("types", [])
+        else:
+            changed.add(filepath)
+        new_manifest[filepath] = entry
 
-    # Try load from disk cache if not debug mode
-    if use_cache and not config.get_debug_mode():
-        # Try to load cache from local storage
-        saved_cache_data = check_cache_version(script_type)
-        if saved_cache_data:
-            script_cache[script_type] = saved_cache_data  # Cache in memory for next run
-            return saved_cache_data
+    return new_manifest, changed
 
-    script_dict = {}
-    entity_dict = {}  # special case for entity
-    script_files = get_script_files()
 
-    if not script_files:
-        echo.warning("No script files found.")
+def get_script_sources(script_files: list[str]) -> dict[str, str]:
+    """
+    Gets the `sources` the script type caches are saved with, a digest of the path and hash of every script file.
+    Refreshes the manifest stats if files were only touched, so they aren't hashed again.
+    """
+    manifest = load_script_manifest()
+    new_manifest, changed = scan_script_files(script_files, manifest)
+    if manifest and not changed and manifest.keys() == new_manifest.keys() and new_manifest != manifest:
+        save_cache(new_manifest, SCRIPT_MANIFEST_CACHE, suppress=True)
 
-    with tqdm(
-        total=len(script_files),
-        desc=f"Parsing {script_type} files",
-        unit=" files",
-        bar_format=PBAR_FORMAT,
-        unit_scale=True,
-        leave=False,
-    ) as pbar:
-        for filepath in script_files:
-            pbar.set_postfix_str(f"Parsing: '{Path(filepath).stem[:30]}'")
+    digest = hashlib.sha256()
+    for filepath in script_files:
+        entry = new_manifest.get(filepath)
+        # Files that couldn't be read are included without a hash, so they're picked up once readable
+        digest.update(f"{filepath}\0{entry['sha256'] if entry else ''}\n".encode("utf-8"))
+    return {"script_files": digest.hexdigest()}
+
+
+def _script_file_cache(filepath: str) -> str:
+    """Gets the cache file name of a script file, unique to its path."""
+    path_hash = hashlib.sha1(filepath.encode("utf-8")).hexdigest()[:12]
+    return f"{Path(filepath).stem}_{path_hash}.json"
+
+
+def _prune_script_file_caches(manifest: dict[str, dict]) -> None:
+    """Removes the per-file caches of script files that aren't in the manifest."""
+    if not os.path.isdir(SCRIPT_FILES_CACHE_DIR):
+        return
+
+    keep = {_script_file_cache(filepath)[:-len(".json")] for filepath in manifest}
+    for filename in os.listdir(SCRIPT_FILES_CACHE_DIR):
+        name = filename.removesuffix(".meta")
+        if name.endswith(".tmp") or os.path.splitext(name)[0] in keep:
+            continue
+        try:
+            os.remove(os.path.join(SCRIPT_FILES_CACHE_DIR, filename))
+        except OSError:
+            pass
+
+
+def parse_script_file(filepath: str, script_types: set[str]) -> dict:
+    """
+    Parses a single script file in one pass, sorting every top-level block into its script type.
+
+    Args:
+        filepath (str): Absolute path to the script file.
+        script_types (set[str]): Script types to extract (e.g., {"item", "vehicle"}). Blocks of other types are skipped.
+
+    Returns:
+        dict: Parsed data for this file, containing:
+            - "blocks": Parsed script blocks as {script_type: {full_id: block_data}}.
+            - "skins": xuiSkin mapping used to resolve entity recipe outputs.
+            - "entities": Raw entity entries used to build entity construction recipes.
+    """
+    result = {"blocks": {script_type: {} for script_type in script_types}, "skins": {}, "entities": []}
+    blocks = result["blocks"]
+
+    content = read_file(filepath)
+    if not content:
+        echo.warning(f"File is empty or unreadable: {filepath}")
+        return result
+
+    # Entity construction recipes rely on the raw text and a global skin mapping, so collect those separately
+    if "entity" in script_types and "entity" in content:
+        result["skins"], result["entities"] = collect_construction_data(content)
+
+    # Clean up comments and index blocks, once for the whole file
+    lines = ScriptLines.from_text(content)
+    text = lines.lines
+    source_file = Path(filepath).stem
+    module = None
+    i = 0
+
+    while i < len(text):
+        line = text[i]
+
+        # Get the module name (e.g., 'module Base')
+        if match := MODULE_PATTERN.match(line):
+            module = match.group(1)
+            i += 1
+            continue
+
+        # Detect block start (e.g., 'item Axe {')
+        block_match = SCRIPT_BLOCK_PATTERN.match(line)
+        if block_match and i + 1 < len(text) and text[i + 1] == "{":
+            block_type, block_name = block_match.groups()
 
-            # Check if file should be blacklisted
-            if is_blacklisted(filepath, script_type):
+            # Get the lines inside this block, between curly brackets
+            block_start, block_end = lines.block_span(i + 1, len(text))
+            i = block_end
+
+            # Skip unknown or irrelevant blocks
+            if block_type not in script_types:
                 continue
 
-            content = read_file(filepath)
-            if not content:
-                echo.warning(f"File is empty or unreadable: {filepath}")
+            # Special case for entity, which doesn't require a module
+            if block_type == "entity":
+                entity_name = block_name.strip()
+                entity_data = parse_entity_block(lines, entity_name, block_type, block_start, block_end)
+                blocks[block_type].setdefault(entity_name, {}).update(entity_data)
                 continue
 
-            if script_type == "entity":
-                file_texts: dict[str, str] = {}
-                for filepath in script_files:
-                    # Check if file should be blacklisted
-                    if is_blacklisted(filepath, script_type):
-                        continue
-
-                    text = read_file(filepath)
-                    if not text:
-                        echo.warning(f"File is empty or unreadable: {filepath}")
-                        continue
-
-                    file_texts[filepath] = text
-
-                if not file_texts:
-                    echo.warning("No entity files found.")
-                    return {}
-
-                full_text = "\n".join(file_texts.values())
-                recipes = parse_construction_recipe(full_text)
-
-                entity_dict = {}
-
-                # First pass: get recipe data
-                for recipe in recipes:
-                    name = recipe.get("name")
-                    if not name:
-                        continue
-
-                    # Best‑effort: find which file contains the entity definition
-                    source_file = next(
-                        (
-                            Path(p).stem
-                            for p, t in file_texts.items()
-                            if re.search(rf"\bentity\s+{re.escape(name)}\b", t)
-                        ),
-                        "unknown",
-                    )
+            block_name = block_name.replace(" ", "_")
 
-                    recipe["ScriptType"] = script_type
-                    recipe["SourceFile"] = source_file
-                    entity_dict[name] = recipe
-
-                # Second pass: parse full entity structure to get additional fields
-                for filepath, text in file_texts.items():
-                    lines = remove_comments(text.splitlines())
-                    module = None
-                    i = 0
-
-                    while i < len(lines):
-                        line = lines[i].strip()
-                        if not line:
-                            i += 1
-                            continue
-
-                        # Get module name
-                        if match := re.match(r"^module\s+(\w+)", line):
-                            module = match.group(1)
-                            i += 1
-                            continue
-
-                        # Detect entity block start
-                        block_match = re.match(r"^entity\s+(.+)", line)
-                        if (
-                            block_match
-                            and i + 1 < len(lines)
-                            and lines[i + 1].strip() == "{"
-                        ):
-                            entity_name = block_match.group(1).strip()
-
-                            # Extract entity block lines
-                            i += 2
-                            block_lines = []
-                            block_depth = 1
-
-                            while i < len(lines):
-                                next_line = lines[i].strip()
-                                block_depth += next_line.count("{")
-                                block_depth -= next_line.count("}")
-                                block_lines.append(next_line)
-                                i += 1
-                                if block_depth <= 0:
-                                    break
-
-                            # Parse the entity block structure
-                            cleaned = remove_comments(block_lines)
-                            entity_data = parse_entity_block(
-                                cleaned, entity_name, script_type
-                            )
-
-                            # Merge with existing recipe data if present
-                            if entity_name in entity_dict:
-                                entity_dict[entity_name].update(entity_data)
-                            else:
-                                entity_data["ScriptType"] = script_type
-                                entity_data["SourceFile"] = Path(filepath).stem
-                                entity_dict[entity_name] = entity_data
-
-                            continue
-
-                        i += 1
-
-                save_cache(entity_dict, "parsed_entity_data.json")
-                script_cache[script_type] = entity_dict
-                echo.success(f"Parsed {len(entity_dict)} entity entries.")
-                return dict(sorted(entity_dict.items()))
-
-            # Clean up comments and prep for parsing
-            lines = remove_comments(content.splitlines())
-            module = None
-            i = 0
-
-            while i < len(lines):
-                line = lines[i].strip()
-                if not line:
-                    i += 1
-                    continue
+            # Skip blacklisted prefixes (e.g., 'MakeUp_' for items)
+            blacklist = PREFIX_BLACKLIST.get(block_type, [])
+            if not module or any(block_name.startswith(prefix) for prefix in blacklist):
+                continue
 
-                # Get the module name (e.g., 'module Base')
-                if match := re.match(r"^module\s+(\w+)", line):
-                    module = match.group(1)
-                    i += 1
-                    continue
+            current_id = f"{module}.{block_name}"
+            if block_type == "craftRecipe":
+                current_id = block_name
 
-                # Detect block start (e.g., 'item Axe {')
-                block_match = re.match(r"^(\w+)\s+(.+)", line)
-                if block_match and i + 1 < len(lines) and lines[i + 1].strip() == "{":
-                    block_type, block_name = block_match.groups()
-                    if block_name is not None:
-                        block_name = block_name.replace(" ", "_")
-
-                    # Skip blacklisted prefixes (e.g., 'MakeUp_' for items)
-                    blacklist = PREFIX_BLACKLIST.get(script_type, [])
-                    if (
-                        block_type == script_type
-                        and module
-                        and not any(
-                            block_name.startswith(prefix) for prefix in blacklist
-                        )
-                    ):
-                        current_id = f"{module}.{block_name}"
-
-                        if script_type == "craftRecipe":
-                            current_id = block_name
-
-                        # Extract lines inside this block, between curly brackets
-                        i += 2
-                        block_lines = []
-                        block_depth = 1
-
-                        while i < len(lines):
-                            next_line = lines[i].strip()
-                            block_depth += next_line.count("{")
-                            block_depth -= next_line.count("}")
-                            block_lines.append(next_line)
-                            i += 1
-                            if block_depth <= 0:
-                                break
-
-                        # Recursively parse the block and attach data, handle custom if required
-                        cleaned = remove_comments(block_lines)
-                        if script_type == "craftRecipe":
-                            block_data = parse_recipe_block(cleaned, current_id)
-                        else:
-                            block_data = parse_block(cleaned, current_id, script_type)
-
-                        block_data["ScriptType"] = script_type
-                        block_data["SourceFile"] = Path(filepath).stem
-                        script_dict[current_id] = block_data
-                    else:
-                        # Skip unknown or irrelevant blocks
-                        i += 2
-                        skip_depth = 1
-                        while i < len(lines) and skip_depth > 0:
-                            next_line = lines[i].strip()
-                            skip_depth += next_line.count("{")
-                            skip_depth -= next_line.count("}")
-                            i += 1
-                    continue
+            # Recursively parse the block and attach data, handle custom if required
+            if block_type == "craftRecipe":
+                block_data = parse_recipe_block(text[block_start:block_end], current_id)
+            else:
+                block_data = parse_block(lines, current_id, block_type, block_start, block_end)
+
+            block_data["ScriptType"] = block_type
+            block_data["SourceFile"] = source_file
+            blocks[block_type][current_id] = block_data
+            continue
+
+        i += 1
+
+    return result
+
+
+## ------------------------- Parallel Parsing ------------------------- ##
+
+
+def _init_parse_worker(version: str) -> None:
+    """Prepares a worker process for parsing, so it never prompts for a version or loads translations."""
+    global _translate_display_names
+    Version.set(version)
+    _translate_display_names = False
+
+
+def _parse_script_file_worker(args: tuple[str, set[str]]) -> dict:
+    """Worker entry point for `parse_script_file`, taking a `(filepath, script_types)` tuple."""
+    return parse_script_file(*args)
+
+
+def translate_display_names(script_dict: dict[str, dict]) -> None:
+    """
+    Translates 'DisplayName' values in place. Used for blocks parsed in worker processes.
+
+    Nested blocks are translated too, using the top-level block ID, as `_translate_display_name` does when parsing.
+    """
+
+    def translate(block_id: str, data: dict) -> None:
+        for key, value in data.items():
+            if isinstance(value, dict):
+                translate(block_id, value)
+            elif key.lower() == "displayname" and isinstance(value, str):
+                data[key] = Translate.get(block_id, "DisplayName", "en", value)
+
+    for block_id, block_data in script_dict.items():
+        translate(block_id, block_data)
+
+
+def _merge_entity_data(file_results: list[tuple[str, dict]]) -> dict[str, dict]:
+    """
+    Merges per-file entity results, combining construction recipe data with entity components.
+
+    Args:
+        file_results (list[tuple[str, dict]]): `(filepath, parse_script_file result)` pairs, in file order.
+
+    Returns:
+        dict[str, dict]: Parsed entity data keyed by entity name.
+    """
+    skin_mapping = {}
+    entity_entries = []
+    entity_sources = {}
+
+    for filepath, file_result in file_results:
+        for skin_name, entity_map in file_result["skins"].items():
+            skin_mapping.setdefault(skin_name, {}).update(entity_map)
+        for entry in file_result["entities"]:
+            entity_sources.setdefault(entry["name"], Path(filepath).stem)
+        entity_entries.extend(file_result["entities"])
+
+    entity_dict = {}
+
+    # First pass: get recipe data
+    for recipe in build_construction_recipes(skin_mapping, entity_entries):
+        name = recipe.get("name")
+        if not name:
+            continue
+
+        recipe["ScriptType"] = "entity"
+        recipe["SourceFile"] = entity_sources.get(name, "unknown")
+        entity_dict[name] = recipe
+
+    # Second pass: merge the full entity structure to get additional fields
+    for filepath, file_result in file_results:
+        for entity_name, entity_data in file_result["blocks"].get("entity", {}).items():
+            if entity_name in entity_dict:
+                entity_dict[entity_name].update(entity_data)
+            else:
+                entity_data["ScriptType"] = "entity"
+                entity_data["SourceFile"] = Path(filepath).stem
+                entity_dict[entity_name] = entity_data
+
+    return entity_dict
+
+
+def parse_script_files(
+    script_files: list[str],
+    script_types: list[str],
+    parallel: bool = True,
+    use_file_cache: bool = False,
+) -> dict[str, dict[str, dict]]:
+    """
+    Parses script files once for several script types, merging their blocks in file order.
+    Uses a process pool sized by `max_workers` when parallel parsing is enabled and useful.
+
+    Args:
+        script_files (list[str]): Absolute paths of the script files to parse.
+        script_types (list[str]): Script types to extract (e.g., ["item", "vehicle"]).
+        parallel (bool, optional): Allow parsing files in a process pool. Defaults to True.
+        use_file_cache (bool, optional): Reuse cached results of unchanged files, only parsing changed ones. Defaults to False.
+
+    Returns:
+        dict[str, dict[str, dict]]: Merged script blocks as {script_type: {full_id: block_data}}.
+            Later files overwrite earlier ones, as with a serial parse.
+    """
+    # Check which script types each file should be parsed for, based on the blacklists
+    tasks = []
+    for filepath in script_files:
+        file_types = {stype for stype in script_types if not is_blacklisted(filepath, stype)}
+        if file_types:
+            tasks.append((filepath, file_types))
+
+    # Reuse results of files that haven't changed, and were parsed for all the required types
+    manifest, new_manifest, changed = {}, {}, set()
+    if use_file_cache:
+        manifest = load_script_manifest()
+        new_manifest, changed = scan_script_files(script_files, manifest)
+
+    file_cache = {}
+    pending = []
+    for task in tasks:
+        filepath, file_types = task
+        if (
+            filepath in new_manifest
+            and filepath not in changed
+            and file_types.issubset(new_manifest[filepath]["types"])
+        ):
+            file_result = load_cache(
+                os.path.join(SCRIPT_FILES_CACHE_DIR, _script_file_cache(filepath)), "script file", suppress=True
+            )
+            if file_result:
+                file_cache[filepath] = file_result
+                continue
+        pending.append(task)
+
+    if use_file_cache and file_cache:
+        echo.info(f"Reusing cached data for {len(file_cache)} unchanged script files, parsing {len(pending)}.")
+
+    max_workers = config.get_worker_count()
+    use_pool = parallel and max_workers > 1 and len(pending) > 1
+    desc = script_types[0] if len(script_types) == 1 else "script"
+
+    with tqdm(
+        total=len(pending),
+        desc=f"Parsing {desc} files",
+        unit=" files",
+        bar_format=PBAR_FORMAT,
+        unit_scale=True,
+        leave=False,
+    ) as pbar:
+        if not use_pool:
+            for task in pending:
+                pbar.set_postfix_str(f"Parsing: '{Path(task[0]).stem[:30]}'")
+                file_cache[task[0]] = parse_script_file(*task)
+                pbar.update(1)
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(pending)),
+                initializer=_init_parse_worker,
+                initargs=(Version.get(),),
+            ) as executor:
+                results = executor.map(
+                    _parse_script_file_worker,
+                    pending,
+                    chunksize=max(1, len(pending) // (max_workers * 4)),
+                )
+                for task, file_result in zip(pending, results):
+                    pbar.set_postfix_str(f"Parsed: '{Path(task[0]).stem[:30]}'")
+                    if "item" in task[1]:
+                        translate_display_names(file_result["blocks"]["item"])
+                    file_cache[task[0]] = file_result
+                    pbar.update(1)
+
+    # Merge in file order, keeping the result deterministic
+    file_results = [(task[0], file_cache[task[0]]) for task in tasks]
+
+    if use_file_cache and (pending or new_manifest != manifest):
+        for filepath, file_types in pending:
+            # Files that couldn't be read have no manifest entry, so are re-parsed next time
+            if filepath in new_manifest:
+                new_manifest[filepath]["types"] = sorted(file_types)
+                save_cache(file_cache[filepath], _script_file_cache(filepath), SCRIPT_FILES_CACHE_DIR, suppress=True)
+
+        # Remove the caches of script files that no longer exist
+        if manifest.keys() - new_manifest.keys():
+            _prune_script_file_caches(new_manifest)
+        save_cache(new_manifest, SCRIPT_MANIFEST_CACHE, suppress=True)
+
+    parsed = {}
+    for script_type in script_types:
+        if script_type == "entity":
+            parsed[script_type] = _merge_entity_data(file_results)
+            continue
 
-                i += 1
+        script_dict = {}
+        for _, file_result in file_results:
+            script_dict.update(file_result["blocks"].get(script_type, {}))
 
-            pbar.update(1)
+        parsed[script_type] = script_dict
 
-    if do_post_processing:
+    return parsed
+
+
+def _store_script_data(
+    script_dict: dict[str, dict],
+    script_type: str,
+    do_post_processing: bool = True,
+    cache_result: bool = True,
+    sources: dict = None,
+) -> dict[str, dict]:
+    """
+    Post-processes freshly parsed script data, then caches it in memory and on disk.
+    The disk cache is saved with `sources`, so `check_cache_version` knows which script files it was parsed from.
+    """
+    if do_post_processing and script_type != "entity":
         script_dict = post_process(script_dict, script_type)
 
     if not script_dict:
-        echo.warning("No valid script entries were found.")
+        echo.warning(f"No valid {script_type} entries were found.")
     else:
         echo.success(f"Parsed {len(script_dict)} {script_type} entries.")
 
     if cache_result:
         # Cache dict in memory
         script_cache[script_type] = script_dict
+        save_cache(script_dict, f"parsed_{script_type}_data.json", sources=sources)
 
-        # Special case for storing both types of entity data
-        if script_type == "entity":
-            save_cache(entity_dict, f"parsed_{script_type}_data.json")
-            save_cache(script_dict, f"parsed_{script_type}_old_data.json")
+    return script_dict
+
+
+def extract_script_data(
+    script_type: str,
+    do_post_processing: bool = True,
+    cache_result: bool = True,
+    use_cache=True,
+    parallel: bool = True,
+) -> dict[str, dict]:
+    """
+    Parses all script files of a given script type, extracting blocks into dictionaries keyed by FullType (i.e. [Module].[Type])
+
+    When a fresh parse is needed, every script type in `SCRIPT_TYPES` that isn't already in memory is parsed
+    in the same pass over the script files, and cached, so later calls for other types don't re-read the files.
+
+    Args:
+        script_type (str): Type of script to extract (e.g., "item", "vehicle").
+        do_post_processing (bool, optional): Apply post-processing, such as template injection. Defaults to True.
+        cache_result (bool, optional): Store the result in memory and on disk. Defaults to True.
+        use_cache (bool, optional): Load from memory or disk cache if available. Defaults to True.
+        parallel (bool, optional): Parse files in a process pool, sized by `max_workers`. Defaults to True.
+
+    Returns:
+        dict[str, dict]: A dictionary of parsed script blocks keyed by full ID (FullType).
+    """
+    global script_cache
+
+    debug_mode = config.get_debug_mode()
+
+    # Clear memory cache
+    if not use_cache or debug_mode:
+        script_cache = {}
+
+    # Get script_type from cache if it's already been parsed.
+    if script_type in script_cache:
+        return script_cache[script_type]
+
+    script_files = get_script_files()
+
+    if not script_files:
+        echo.warning("No script files found.")
+
+    # Try load from disk cache if not debug mode, and it was parsed from the current script files
+    use_file_cache = use_cache and not debug_mode
+    sources = get_script_sources(script_files) if use_file_cache or cache_result else None
+    if use_file_cache:
+        # Try to load cache from local storage
+        saved_cache_data = check_cache_version(script_type, sources)
+        if saved_cache_data:
+            script_cache[script_type] = saved_cache_data  # Cache in memory for next run
+            return saved_cache_data
+
+    # Parse the other known script types in the same pass, unless results aren't being kept
+    if use_cache and cache_result and not debug_mode:
+        script_types = [
+            stype for stype in SCRIPT_TYPES
+            if stype == script_type or stype not in script_cache
+        ]
+        if script_type not in script_types:
+            script_types.append(script_type)
+    else:
+        script_types = [script_type]
+
+    parsed = parse_script_files(
+        script_files, script_types, parallel=parallel, use_file_cache=use_file_cache
+    )
+
+    # Stored in `SCRIPT_TYPES` order, so post-processing (e.g. templates) can use earlier types
+    for stype in script_types:
+        if stype == script_type:
+            script_dict = _store_script_data(
+                parsed[stype], stype, do_post_processing, cache_result, sources
+            )
         else:
-            save_cache(script_dict, f"parsed_{script_type}_data.json")
+            _store_script_data(parsed[stype], stype, sources=sources)
 
     return dict(sorted(script_dict.items()))
 
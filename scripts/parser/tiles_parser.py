@@ -3,11 +3,21 @@ This script was originally written in JavaScript by User:Jab.
 It has been converted to python for use in the wiki parser.
 """
 
+import hashlib
 import os
+import re
 import struct
-from scripts.core.constants import DATA_DIR
-from scripts.core.cache import save_cache
-from scripts.core.file_loading import get_media_dir
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from scripts.core.constants import DATA_DIR, CACHE_DIR
+from scripts.core.cache import save_cache, load_cache, is_cache_current
+from scripts.core.config_manager import get_worker_count
+from scripts.core.file_loading import get_media_dir, hash_file
+from scripts.tiles.tile_store import TileStore
+
+TILES_CACHE_DIR = os.path.join(CACHE_DIR, "tiles")
+TILES_CACHE_FORMAT = 1  # bump when the decoded layout changes
 
 IsoFlagType = {
     'collideW': 0, 'collideN': 1, 'solidfloor': 2, 'noStart': 3, 'windowW': 4,
@@ -60,22 +70,60 @@ RenderLayerName = {v: k for k, v in RenderLayer.items()}
 # Binary reader
 # —————————————————————————————————————————————————————————————————————
 
+INT32 = struct.Struct('<i')
+INT32_X3 = struct.Struct('<3i')
+INT32_X4 = struct.Struct('<4i')
+MAX_STRING_LENGTH = 1024
+# Strings end with a newline or 0xFF byte. Anything else (carriage returns, long strings, end of data) uses the slow path for its error.
+STRING = re.compile(rb'([^\n\r\xff]{0,%d})[\n\xff]' % (MAX_STRING_LENGTH - 1))
+STRING_PAIR = re.compile(rb'([^\n\r\xff]{0,%d})[\n\xff]([^\n\r\xff]{0,%d})[\n\xff]' % ((MAX_STRING_LENGTH - 1,) * 2))
+
 class BufferReader:
+    __slots__ = ('data', 'offset', '_strings')
+
     def __init__(self, data: bytes):
         self.data = data
         self.offset = 0
+        self._strings = {}  # raw bytes -> interned string, as names and values repeat often
 
     def read_int32(self) -> int:
-        val = struct.unpack_from('<i', self.data, self.offset)[0]
+        val = INT32.unpack_from(self.data, self.offset)[0]
         self.offset += 4
         return val
 
+    def read_int32s(self, fmt: struct.Struct) -> tuple:
+        """Read several int32s at once with a precompiled struct, such as `INT32_X3`."""
+        vals = fmt.unpack_from(self.data, self.offset)
+        self.offset += fmt.size
+        return vals
+
     def read_uint8(self) -> int:
         val = self.data[self.offset]
         self.offset += 1
         return val
 
+    def _decode(self, raw: bytes) -> str:
+        string = self._strings.get(raw)
+        if string is None:
+            string = self._strings[raw] = sys.intern(raw.decode('latin-1'))
+        return string
+
     def read_string(self) -> str:
+        match = STRING.match(self.data, self.offset)
+        if match is None:
+            return self._read_string_slow()
+        self.offset = match.end()
+        return self._decode(match.group(1))
+
+    def read_string_pair(self) -> tuple[str, str]:
+        """Read two consecutive strings, such as a property name and value, in one match."""
+        match = STRING_PAIR.match(self.data, self.offset)
+        if match is None:
+            return self.read_string(), self.read_string()
+        self.offset = match.end()
+        return self._decode(match.group(1)), self._decode(match.group(2))
+
+    def _read_string_slow(self) -> str:
         chars = []
         while True:
             b = self.read_uint8()
@@ -84,9 +132,101 @@ class BufferReader:
             if b == 13:
                 raise ValueError("\\r\\n unsupported")
             chars.append(chr(b))
-            if len(chars) >= 1024:
+            if len(chars) >= MAX_STRING_LENGTH:
                 raise ValueError("String too long")
-        return ''.join(chars)
+        return sys.intern(''.join(chars))
+
+
+def decode_tiles_file(path: str) -> list:
+    """
+    Decode a .tiles file without applying it, so files can be decoded independently.
+
+    Returns:
+        list: One [base, magic, variants] entry per sheet, where each variant is a flat
+            [name, value, name, value, ...] list of its properties.
+    """
+    with open(path,'rb') as file:
+        data = file.read()
+    r = BufferReader(data)
+    _, _, sheet_count = r.read_int32s(INT32_X3)
+    read_string = r.read_string
+    read_string_pair = r.read_string_pair
+    read_int32 = r.read_int32
+    sheets = []
+    for _ in range(sheet_count):
+        base = read_string()
+        read_string()
+        _, _, magic, variant_count = r.read_int32s(INT32_X4)
+        variants = []
+        for _ in range(variant_count):
+            props = []
+            for _ in range(read_int32()):
+                props.extend(read_string_pair())
+            variants.append(props)
+        sheets.append([base, magic, variants])
+    return sheets
+
+
+def _get_tiles_cache_name(path: str, media_dir: str) -> str:
+    """Get the per-file cache name for a .tiles file, unique to its location in the media directory."""
+    rel_path = os.path.relpath(path, media_dir).replace(os.sep, '/')
+    digest = hashlib.sha1(rel_path.encode('utf-8')).hexdigest()[:8]
+    name = os.path.splitext(os.path.basename(path))[0]
+    return f"{name}_{digest}.json"
+
+
+def _load_decoded_tiles(path: str, cache_name: str, sha256: str) -> list | None:
+    """Load a decoded .tiles file from its cache, if it was decoded from a file with the same hash."""
+    cache_file = os.path.join(TILES_CACHE_DIR, cache_name)
+    if not is_cache_current(cache_file, sources={path: sha256}):
+        return None
+    cached = load_cache(cache_file, suppress=True)
+    if cached.get('format') != TILES_CACHE_FORMAT or cached.get('source') != path:
+        return None
+    return cached.get('sheets')
+
+
+def decode_tiles_files(tiles_files: list[str], media_dir: str, force: bool = False) -> list[list]:
+    """
+    Decode .tiles files, using the per-file cache and a process pool for any that changed.
+
+    Args:
+        tiles_files (list[str]): Paths of the .tiles files.
+        media_dir (str): Media directory the files are in, used to name their caches.
+        force (bool, optional): Decode every file even if its cache is current. Defaults to False.
+
+    Returns:
+        list[list]: Decoded sheets for each file, in the same order as `tiles_files`.
+    """
+    cache_names = [_get_tiles_cache_name(path, media_dir) for path in tiles_files]
+    # Hashed rather than compared by modified time, so files rewritten with the same content aren't decoded again
+    hashes = [hash_file(Path(path)) for path in tiles_files]
+    decoded = [
+        None if force else _load_decoded_tiles(path, cache_name, sha256)
+        for path, cache_name, sha256 in zip(tiles_files, cache_names, hashes)
+    ]
+    stale = [i for i, sheets in enumerate(decoded) if sheets is None]
+    if not stale:
+        return decoded
+
+    stale_files = [tiles_files[i] for i in stale]
+    max_workers = get_worker_count()
+    if max_workers > 1 and len(stale_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(stale_files))) as executor:
+            results = list(executor.map(decode_tiles_file, stale_files))
+    else:
+        results = [decode_tiles_file(path) for path in stale_files]
+
+    for i, sheets in zip(stale, results):
+        decoded[i] = sheets
+        save_cache(
+            {'format': TILES_CACHE_FORMAT, 'source': tiles_files[i], 'sheets': sheets},
+            cache_names[i],
+            TILES_CACHE_DIR,
+            suppress=True,
+            sources={tiles_files[i]: hashes[i]},
+        )
+    return decoded
 
 
 # —————————————————————————————————————————————————————————————————————
@@ -94,6 +234,8 @@ class BufferReader:
 # —————————————————————————————————————————————————————————————————————
 
 class TileProperty:
+    __slots__ = ('property_name', 'possible_values', 'id_map')
+
     def __init__(self):
         self.property_name = None
         self.possible_values = []
@@ -121,10 +263,9 @@ class TilePropertyAliasMap:
 
     @classmethod
     def get_name_from_id(cls, idx: int) -> str:
-        for k, v in cls.PropertyToID.items():
-            if v == idx:
-                return k
-        return None
+        if idx < 0 or idx >= len(cls.Properties):
+            return None
+        return cls.Properties[idx].property_name
 
     @classmethod
     def get_id_from_value(cls, prop_id: int, value: str) -> int:
@@ -151,14 +292,17 @@ class PropertyContainer:
     SURFACE_ISOFFSET   = 2
     SURFACE_ISTABLE    = 4
     SURFACE_ISTABLETOP = 8
-    numeric_property_names = ['PickUpWeight']
+    numeric_property_names = frozenset(['PickUpWeight'])
+
+    # Most tiles have few or no properties, so storage is only created once something is set
+    __slots__ = ('SpriteFlags1', 'SpriteFlags2', 'Properties', 'SurfaceFlags', 'flags_set')
 
     def __init__(self):
         self.SpriteFlags1 = 0
         self.SpriteFlags2 = 0
-        self.Properties   = {}
+        self.Properties   = None
         self.SurfaceFlags = 0
-        self.flags_set    = []
+        self.flags_set    = ()
 
     def set_flag(self, flag: int):
         # 32-bit shift space
@@ -166,7 +310,9 @@ class PropertyContainer:
             self.SpriteFlags1 |= (1 << (flag % 32))
         else:
             self.SpriteFlags2 |= (1 << (flag % 32))
-        if flag not in self.flags_set:
+        if not self.flags_set:
+            self.flags_set = [flag]
+        elif flag not in self.flags_set:
             self.flags_set.append(flag)
 
     def set_property(self, name: str, value: str, is_flag: bool = True):
@@ -184,11 +330,13 @@ class PropertyContainer:
             return
         vid = TilePropertyAliasMap.get_id_from_value(pid, value)
         self.SurfaceFlags &= ~self.SURFACE_VALID
+        if self.Properties is None:
+            self.Properties = {}
         self.Properties[pid] = vid
 
     def val(self, name: str):
         pid = TilePropertyAliasMap.get_id_from_name(name)
-        if pid not in self.Properties:
+        if not self.Properties or pid not in self.Properties:
             return None
         idx = self.Properties[pid]
         val = TilePropertyAliasMap.get_value_string(pid, idx)
@@ -229,9 +377,19 @@ class PropertyContainer:
 # —————————————————————————————————————————————————————————————————————
 
 class IsoSprite:
+    DEFAULT_TINT = (1.0, 1.0, 1.0, 1.0)
+
+    __slots__ = (
+        'properties', 'TintMod', 'name', 'id', 'tileSheetIndex', 'type', 'isBush',
+        'firerequirement', 'burntTile', 'forceAmbient', 'solidFloor', 'canBeRemoved',
+        'attachedFloor', 'cutN', 'cutW', 'solid', 'solidTrans', 'invisible', 'alwaysDraw',
+        'forceRender', 'moveWithWind', 'windType', 'Animate', 'treatAsWallOrder',
+        'hideForWaterRender', 'renderLayer',
+    )
+
     def __init__(self):
         self.properties = PropertyContainer()
-        self.TintMod    = [1.0, 1.0, 1.0, 1.0]
+        self.TintMod    = self.DEFAULT_TINT  # shared, replace rather than modify
         self.name       = ''
         self.id         = 20000000
         self.tileSheetIndex = 0
@@ -261,7 +419,7 @@ class IsoSprite:
         j = {'id': self.id, 'type': IsoObjectTypeName[self.type], 'tileSheetIndex': self.tileSheetIndex}
         if self.renderLayer != RenderLayer['Default']:
             j['renderLayer'] = RenderLayerName[self.renderLayer]
-        if any(v != 1.0 for v in self.TintMod):
+        if self.TintMod != self.DEFAULT_TINT and any(v != 1.0 for v in self.TintMod):
             j['tintMod'] = {'r': self.TintMod[0], 'g': self.TintMod[1], 'b': self.TintMod[2], 'a': self.TintMod[3]}
         props = self.properties.to_json()
         if props:
@@ -321,28 +479,39 @@ class IsoSpriteManager:
 # World parser
 # —————————————————————————————————————————————————————————————————————
 
+# Tile definition names that set a boolean sprite attribute
+SPRITE_BOOL_ATTRIBUTES = {
+    'ForceAmbient':'forceAmbient','solidFloor':'solidFloor','canBeRemoved':'canBeRemoved',
+    'attachedFloor':'attachedFloor','cutW':'cutW','cutN':'cutN','solid':'solid',
+    'solidTrans':'solidTrans','invisible':'invisible','alwaysDraw':'alwaysDraw',
+    'forceRender':'forceRender'
+}
+
 class IsoWorld:
     def __init__(self):
         self.property_value_map = {}
+        self._property_value_sets = {}  # membership for property_value_map lists
         self.tiles = {}
 
     def load_tile_definitions_property_strings(self, path: str):
-        data = open(path,'rb').read()
-        r = BufferReader(data)
-        r.read_int32(); r.read_int32()
-        sheet_count = r.read_int32()
-        for _ in range(sheet_count):
-            r.read_string(); r.read_string()
-            r.read_int32(); r.read_int32(); r.read_int32()
-            def_count = r.read_int32()
-            for _ in range(def_count):
-                prop_ct = r.read_int32()
-                for _ in range(prop_ct):
-                    name = r.read_string()
-                    val  = r.read_string()
-                    lst = self.property_value_map.setdefault(name,[])
-                    if val not in lst:
-                        lst.append(val)
+        self.add_tile_definitions_property_strings(decode_tiles_file(path))
+
+    def add_tile_definitions_property_strings(self, sheets: list):
+        """Collect the property values of a decoded .tiles file, see `decode_tiles_file`."""
+        value_map = self.property_value_map
+        value_sets = self._property_value_sets
+        for _, _, variants in sheets:
+            for props in variants:
+                for j in range(0, len(props), 2):
+                    name = props[j]
+                    val = props[j + 1]
+                    seen = value_sets.get(name)
+                    if seen is None:
+                        seen = value_sets[name] = set()
+                        value_map.setdefault(name,[])
+                    if val not in seen:
+                        seen.add(val)
+                        value_map[name].append(val)
 
     def set_custom_property_values(self):
         for k in ('WindowN','WindowW','DoorWallN','DoorWallW','WallSE'):
@@ -356,6 +525,7 @@ class IsoWorld:
     def generate_tile_property_lookup_tables(self):
         TilePropertyAliasMap.generate(self.property_value_map)
         self.property_value_map.clear()
+        self._property_value_sets.clear()
 
     def transform_tile_definition(self, spr, base, name, val):
         # Object-type
@@ -374,14 +544,8 @@ class IsoWorld:
             spr.firerequirement = int(val)
         elif name=='BurntTile':
             spr.burntTile = val
-        elif name in ('ForceAmbient','solidFloor','canBeRemoved','attachedFloor',
-                      'cutW','cutN','solid','solidTrans','invisible','alwaysDraw','forceRender'):
-            setattr(spr,{
-                'ForceAmbient':'forceAmbient','solidFloor':'solidFloor','canBeRemoved':'canBeRemoved',
-                'attachedFloor':'attachedFloor','cutW':'cutW','cutN':'cutN','solid':'solid',
-                'solidTrans':'solidTrans','invisible':'invisible','alwaysDraw':'alwaysDraw',
-                'forceRender':'forceRender'
-            }[name],True)
+        elif name in SPRITE_BOOL_ATTRIBUTES:
+            setattr(spr,SPRITE_BOOL_ATTRIBUTES[name],True)
             spr.properties.set_property(name,val,False)
         elif name=='MoveWithWind':
             spr.moveWithWind=True
@@ -420,38 +584,45 @@ class IsoWorld:
                             spr.properties.set_flag(IsoFlagType['open'])
 
     def read_tile_definitions(self, path: str, file_num: int):
-        data=open(path,'rb').read()
-        r=BufferReader(data)
-        r.read_int32(); r.read_int32()
-        sheet_count=r.read_int32()
-        for _ in range(sheet_count):
-            base=r.read_string()
-            r.read_string()
-            r.read_int32(); r.read_int32()
-            magic=r.read_int32()
-            variants=r.read_int32()
+        self.add_tile_definitions(decode_tiles_file(path), file_num)
+
+    def add_tile_definitions(self, sheets: list, file_num: int):
+        """Create sprites from a decoded .tiles file, see `decode_tiles_file`."""
+        add_sprite=IsoSpriteManager.instance.add_sprite
+        transform=self.transform_tile_definition
+        for base, magic, variants in sheets:
+            # Variant names are '<base>_<n>', so whether they contain 'damaged' or 'trash_' depends only on the base
+            attached=('damaged' in base or 'trash_' in base or base.endswith('trash'))
             defs=[]
-            for i in range(variants):
+            for i, props in enumerate(variants):
                 name=f"{base}_{i}"
                 tid = file_num*100000 + 10000 + magic*1000 + i
-                spr=IsoSpriteManager.instance.add_sprite(name, tid)
+                spr=add_sprite(name, tid)
                 spr.name=name
                 spr.tileSheetIndex=i
                 defs.append(spr)
-                if 'damaged' in name or 'trash_' in name:
+                if attached:
                     spr.attachedFloor=True
                     spr.properties.set_property('attachedFloor','true',False)
-                prop_ct=r.read_int32()
-                for _ in range(prop_ct):
-                    pname=r.read_string(); pval=r.read_string()
-                    self.transform_tile_definition(spr, base, pname, pval)
+                for j in range(0, len(props), 2):
+                    transform(spr, base, props[j], props[j + 1])
                 self.tiles[name]=spr
             self.set_open_door_properties(base, defs)
 
-def main():
+def main(force: bool = False):
+    """
+    Parse every .tiles file in the media directory into the tile store ('tiles_data.sqlite').
+
+    Files are decoded in parallel and cached individually, then applied in sorted order
+    so sprite ids and property lookup tables don't depend on which files were cached.
+
+    Args:
+        force (bool, optional): Decode every file, ignoring the per-file caches. Defaults to False.
+    """
     media_dir = get_media_dir()
     os.makedirs(DATA_DIR, exist_ok=True)
 
+    IsoSpriteManager.instance = None
     IsoSpriteManager()
     world = IsoWorld()
 
@@ -461,19 +632,22 @@ def main():
         for fname in files:
             if fname.endswith('.tiles'):
                 tiles_files.append(os.path.join(root, fname))
+    tiles_files.sort()
+
+    decoded_files = decode_tiles_files(tiles_files, media_dir, force=force)
 
     # Load tile definition property strings from all .tiles files
-    for tiles_file in sorted(tiles_files):
-        world.load_tile_definitions_property_strings(tiles_file)
+    for sheets in decoded_files:
+        world.add_tile_definitions_property_strings(sheets)
     world.set_custom_property_values()
     world.generate_tile_property_lookup_tables()
 
     # Read tile definitions from all .tiles files
-    for tiles_file in sorted(tiles_files):
-        world.read_tile_definitions(tiles_file, 1)
+    for sheets in decoded_files:
+        world.add_tile_definitions(sheets, 1)
 
-    combined = {k: spr.to_json() for k, spr in world.tiles.items()}
-    save_cache(combined, 'tiles_data.json', DATA_DIR)
+    # Stream definitions into the store rather than building one large dict
+    TileStore.build((name, sprite.to_json()) for name, sprite in world.tiles.items())
 
 if __name__=='__main__':
     main()
@@ -23,8 +23,7 @@ from tqdm import tqdm
 from collections import defaultdict
 from scripts.core.constants import PBAR_FORMAT, CACHE_DIR
 from scripts.core.language import Language, Translate
-from scripts.core.version import Version
-from scripts.core.cache import load_cache
+from scripts.core.cache import load_cache, is_cache_current
 from scripts.core import page_manager
 from scripts.parser.script_parser import extract_script_data
 from scripts.parser import literature_parser
@@ -1951,7 +1950,6 @@ def main(batch: bool = False):
 
     if not batch:
         Language.get()
-    game_version = Version.get()
 
     CRAFT_CACHE_FILE = "parsed_craftRecipe_data.json"
     BUILD_CACHE_FILE = "parsed_entity_data.json"
@@ -1966,36 +1964,20 @@ def main(batch: bool = False):
 
     # Craft cache
     echo.info("Loading craft cache")
-    try:
-        parsed_craft_data, craft_cache_version = load_cache(
-            craft_cache_path, "Craft", get_version=True
-        )
-        if craft_cache_version != game_version:
-            raise ValueError("Craft cache version mismatch")
-    except Exception as exc:
-        echo.info(f"{exc}; regenerating")
-        extract_script_data("craftRecipe")
-        parsed_craft_data, craft_cache_version = load_cache(
-            craft_cache_path, "Craft", get_version=True
-        )
-    craft_data = parsed_craft_data
+    if is_cache_current(craft_cache_path):
+        craft_data = load_cache(craft_cache_path, "Craft")
+    else:
+        echo.info("Craft cache version mismatch; regenerating")
+        craft_data = extract_script_data("craftRecipe")
     echo.success("Craft cache ready")
 
     # Build cache
     echo.info("Loading build cache")
-    try:
-        parsed_build_data, build_cache_version = load_cache(
-            build_cache_path, "Build", get_version=True
-        )
-        if build_cache_version != game_version:
-            raise ValueError("Build cache version mismatch")
-    except Exception as exc:
-        echo.info(f"{exc}; regenerating")
-        extract_script_data("entity")
-        parsed_build_data, build_cache_version = load_cache(
-            build_cache_path, "Build", get_version=True
-        )
-    build_data = parsed_build_data
+    if is_cache_current(build_cache_path):
+        build_data = load_cache(build_cache_path, "Build")
+    else:
+        echo.info("Build cache version mismatch; regenerating")
+        build_data = extract_script_data("entity")
     echo.success("Build cache ready")
     echo.success("Cache ready")
 
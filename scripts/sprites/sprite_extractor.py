@@ -7,23 +7,28 @@ Pack parsing is handled by ``scripts.parser.pack_parser``.
 from __future__ import annotations
 
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
+import hashlib
 import io
 import json
+import mmap
+import os
 import re
 
 from PIL import Image
 from tqdm.auto import tqdm
 
 from scripts.core.constants import CACHE_DIR, OUTPUT_DIR, PBAR_FORMAT
-from scripts.core.config_manager import get_game_directory
-from scripts.parser.pack_parser import Pack, PackSheet, SpriteEntry, parse_pack_file
+from scripts.core.config_manager import get_game_directory, get_png_compress_level, get_worker_count
+from scripts.parser.pack_parser import Pack, PackSheet, SpriteEntry, map_pack_file, parse_pack_file
 from scripts.utils import color
 
 
 PACK_METADATA_DIR = Path(CACHE_DIR) / "pack_metadata"
 SPRITE_OUTPUT_DIR = Path(OUTPUT_DIR) / "sprites"
+SPRITE_MANIFEST_PATH = Path(CACHE_DIR) / "sprite_manifest.json"
 
 WINDOWS_RESERVED_NAMES = {
     "CON",
@@ -44,6 +49,7 @@ class SpriteExtractionSummary:
     skipped_invalid: int = 0
     skipped_bounds: int = 0
     skipped_missing: int = 0
+    skipped_unchanged: int = 0
 
 
 def _safe_stem(name: str, fallback: str) -> str:
@@ -59,12 +65,6 @@ def _safe_stem(name: str, fallback: str) -> str:
     return stem[:180]
 
 
-def _sheet_image(pack: Pack, sheet: PackSheet) -> Image.Image:
-    """Load one embedded pack sheet as an RGBA image."""
-    with Image.open(io.BytesIO(pack.png_bytes(sheet))) as image:
-        return image.convert("RGBA")
-
-
 def _sprite_output_path(
     sprites_dir: Path,
     pack: Pack,
@@ -113,12 +113,190 @@ def _write_json(path: Path, data: dict) -> None:
     temporary_path.replace(path)
 
 
+def crop_sprite(image: Image.Image, values: tuple[int, ...]) -> Image.Image:
+    """Crop one sprite from its sheet and pad it to its full size."""
+    x_pos, y_pos, width, height, x_offset, y_offset, total_width, total_height = values
+    output_image = Image.new("RGBA", (total_width, total_height), (0, 0, 0, 0))
+    with image.crop((x_pos, y_pos, x_pos + width, y_pos + height)) as crop:
+        output_image.paste(crop, (x_offset, y_offset))
+    return output_image
+
+
+def _sprite_digest(image: Image.Image) -> str:
+    """Return a content hash for a sprite image."""
+    digest = hashlib.sha256(f"{image.width}x{image.height}:".encode("ascii"))
+    digest.update(image.tobytes())
+    return digest.hexdigest()
+
+
+def extract_sheet(task: tuple) -> list[tuple[str, str | None, bool]]:
+    """Extract the queued sprites of one sheet.
+
+    The sheet is decoded once and every sprite is cropped from it. ``task`` is
+    a picklable tuple so sheets can be handed to worker processes.
+
+    Args:
+        task: ``(source, png_start, png_end, jobs, compress_level, skip_unchanged)``.
+            ``source`` is a pack path, or the sheet's PNG bytes for packs without one.
+            ``jobs`` holds ``(sprite_values, output_path, known_digest)`` tuples.
+
+    Returns:
+        list[tuple[str, str | None, bool]]: ``(output_path, digest, written)`` per job.
+            ``digest`` is only computed when ``skip_unchanged`` is set.
+    """
+    source, png_start, png_end, jobs, compress_level, skip_unchanged = task
+
+    if isinstance(source, bytes):
+        png_data = source
+    else:
+        data = map_pack_file(source)
+        try:
+            png_data = data[png_start:png_end]
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    with Image.open(io.BytesIO(png_data)) as image:
+        sheet_image = image.convert("RGBA")
+
+    results = []
+    try:
+        for values, output_path, known_digest in jobs:
+            with crop_sprite(sheet_image, values) as output_image:
+                digest = _sprite_digest(output_image) if skip_unchanged else None
+
+                if digest is not None and digest == known_digest and os.path.exists(output_path):
+                    results.append((output_path, digest, False))
+                    continue
+
+                os.makedirs(os.path.dirname(output_path), exist_ok=True)
+                output_image.save(output_path, format="PNG", compress_level=compress_level)
+                results.append((output_path, digest, True))
+    finally:
+        sheet_image.close()
+
+    return results
+
+
+def _load_manifest() -> dict[str, str]:
+    """Load the sprite content hash manifest."""
+    try:
+        manifest = json.loads(SPRITE_MANIFEST_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return manifest if isinstance(manifest, dict) else {}
+
+
+def _queue_sprite(
+    queued: dict[str, tuple],
+    summary: SpriteExtractionSummary,
+    output_path: Path,
+    sheet_key,
+    sprite: SpriteEntry,
+) -> None:
+    """Queue one sprite for extraction from the sheet identified by ``sheet_key``."""
+    key = str(output_path)
+    if queued.pop(key, None) is not None:
+        # Sprites sharing an output path were written in order, so the last one wins.
+        summary.extracted += 1
+    queued[key] = (sheet_key, sprite.values())
+
+
+def _build_sheet_tasks(
+    queued: dict[str, tuple],
+    sheet_sources: dict,
+    compress_level: int,
+    manifest: dict[str, str] | None,
+) -> list[tuple]:
+    """Group queued sprites into one ``extract_sheet`` task per sheet."""
+    jobs_by_sheet: dict = defaultdict(list)
+
+    for output_path, (sheet_key, values) in queued.items():
+        known_digest = None
+        if manifest is not None:
+            known_digest = manifest.get(_relative_output_path(Path(output_path)))
+        jobs_by_sheet[sheet_key].append((values, output_path, known_digest))
+
+    return [
+        (*sheet_sources[sheet_key], jobs, compress_level, manifest is not None)
+        for sheet_key, jobs in jobs_by_sheet.items()
+    ]
+
+
+def _run_sheet_tasks(
+    tasks: list[tuple],
+    summary: SpriteExtractionSummary,
+    progress: tqdm,
+    manifest: dict[str, str] | None,
+) -> None:
+    """Run sheet tasks, in a process pool when there's more than one, and update the summary."""
+    max_workers = get_worker_count()
+
+    def record(results: list[tuple[str, str | None, bool]]) -> None:
+        for output_path, digest, written in results:
+            if written:
+                summary.extracted += 1
+            else:
+                summary.skipped_unchanged += 1
+            if manifest is not None and digest is not None:
+                manifest[_relative_output_path(Path(output_path))] = digest
+        progress.update(len(results))
+
+    if max_workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+            for results in executor.map(extract_sheet, tasks):
+                record(results)
+    else:
+        for task in tasks:
+            record(extract_sheet(task))
+
+    if manifest is not None:
+        _write_json(SPRITE_MANIFEST_PATH, manifest)
+
+
+def _sheet_source(pack: Pack, sheet: PackSheet) -> tuple:
+    """Return the ``(source, png_start, png_end)`` part of a sheet task."""
+    if pack.path is not None:
+        return str(pack.path), sheet.png_start, sheet.png_end
+    return bytes(pack.png_bytes(sheet)), 0, sheet.png_end - sheet.png_start
+
+
+def _sprite_in_bounds(sprite: SpriteEntry, sheet: PackSheet) -> bool:
+    """Check a sprite fits its sheet and its padded output size."""
+    x2 = sprite.x_pos + sprite.width
+    y2 = sprite.y_pos + sprite.height
+
+    return (
+        0 <= sprite.x_pos < sheet.sheet_width
+        and 0 <= sprite.y_pos < sheet.sheet_height
+        and sprite.x_pos < x2 <= sheet.sheet_width
+        and sprite.y_pos < y2 <= sheet.sheet_height
+        and sprite.total_width > 0
+        and sprite.total_height > 0
+        and sprite.x_offset + sprite.width <= sprite.total_width
+        and sprite.y_offset + sprite.height <= sprite.total_height
+    )
+
+
 def extract_sprites(
     pack: Pack,
     folder_level: int = 2,
     overwrite: bool = True,
+    *,
+    skip_unchanged: bool = False,
+    compress_level: int | None = None,
 ) -> SpriteExtractionSummary:
-    """Extract every valid sprite from one parsed pack."""
+    """Extract every valid sprite from one parsed pack.
+
+    Sheets are extracted in parallel, each decoded once in a worker process.
+
+    Args:
+        pack: Parsed pack to extract.
+        folder_level: Output folder structure, see ``_sprite_output_path``.
+        overwrite: Replace existing files when True.
+        skip_unchanged: Don't rewrite sprites whose content hash matches the sprite manifest.
+        compress_level: PNG compression level. Defaults to the ``png_compress_level`` setting.
+    """
     if folder_level not in {0, 1, 2}:
         raise ValueError("folder_level must be 0, 1, or 2.")
 
@@ -128,38 +306,24 @@ def extract_sprites(
     sprite_total = sum(len(sheet.sprites) for sheet in pack.sheets)
     pack_name = pack.path.stem if pack.path is not None else "pack"
 
-    progress = tqdm(total=sprite_total, desc=pack_name, unit="sprite", leave=False, bar_format=PBAR_FORMAT)
+    if compress_level is None:
+        compress_level = get_png_compress_level()
+    manifest = _load_manifest() if skip_unchanged else None
 
-    for sheet in pack.sheets:
-        image = _sheet_image(pack, sheet)
-        progress.set_postfix_str(sheet.name or f"sheet_{sheet.index}")
+    queued: dict[str, tuple] = {}
+    sheet_sources: dict[int, tuple] = {}
+
+    with tqdm(total=sprite_total, desc=pack_name, unit="sprite", leave=False, bar_format=PBAR_FORMAT) as progress:
+        for position, sheet in enumerate(pack.sheets):
+            sheet_sources[position] = _sheet_source(pack, sheet)
 
-        try:
             for entry_index, sprite in enumerate(sheet.sprites):
                 if not sprite.valid:
                     summary.skipped_invalid += 1
                     progress.update(1)
                     continue
 
-                x2 = sprite.x_pos + sprite.width
-                y2 = sprite.y_pos + sprite.height
-
-                if not (
-                    0 <= sprite.x_pos < image.width
-                    and 0 <= sprite.y_pos < image.height
-                    and sprite.x_pos < x2 <= image.width
-                    and sprite.y_pos < y2 <= image.height
-                ):
-                    summary.skipped_bounds += 1
-                    progress.update(1)
-                    continue
-
-                if (
-                    sprite.total_width <= 0
-                    or sprite.total_height <= 0
-                    or sprite.x_offset + sprite.width > sprite.total_width
-                    or sprite.y_offset + sprite.height > sprite.total_height
-                ):
+                if not _sprite_in_bounds(sprite, sheet):
                     summary.skipped_bounds += 1
                     progress.update(1)
                     continue
@@ -173,36 +337,21 @@ def extract_sprites(
                     fallback,
                     folder_level,
                 )
+                sprite.extracted_path = _relative_output_path(sprite_path)
 
-                if sprite_path.exists() and not overwrite:
+                if not overwrite and sprite_path.exists():
                     summary.skipped_existing += 1
-                    sprite.extracted_path = _relative_output_path(sprite_path)
                     progress.update(1)
                     continue
 
-                sprite_path.parent.mkdir(parents=True, exist_ok=True)
+                _queue_sprite(queued, summary, sprite_path, position, sprite)
 
-                crop = image.crop(
-                    (sprite.x_pos, sprite.y_pos, x2, y2)
-                )
-                output_image = Image.new(
-                    "RGBA",
-                    (sprite.total_width, sprite.total_height),
-                    (0, 0, 0, 0),
-                )
-                output_image.paste(
-                    crop,
-                    (sprite.x_offset, sprite.y_offset),
-                )
-                output_image.save(sprite_path, format="PNG")
+        # Superseded sprites were counted when replaced.
+        progress.update(summary.extracted)
 
-                sprite.extracted_path = _relative_output_path(sprite_path)
-                summary.extracted += 1
-                progress.update(1)
-        finally:
-            image.close()
+        tasks = _build_sheet_tasks(queued, sheet_sources, compress_level, manifest)
+        _run_sheet_tasks(tasks, summary, progress, manifest)
 
-    progress.close()
     return summary
 
 
@@ -223,6 +372,7 @@ def write_pack_metadata(pack: Pack) -> Path:
 def extract_pack_sprites(
     pack_path: str | Path,
     folder_level: int = 2,
+    skip_unchanged: bool = False,
 ) -> None:
     """Parse one pack, extract its sprites, and write its metadata."""
     pack_path = Path(pack_path)
@@ -230,9 +380,9 @@ def extract_pack_sprites(
     if not pack_path.is_file():
         raise FileNotFoundError(f"Pack file not found: {pack_path}")
 
-    pack = parse_pack_file(pack_path)
-    extract_sprites(pack, folder_level=folder_level)
-    write_pack_metadata(pack)
+    with parse_pack_file(pack_path) as pack:
+        extract_sprites(pack, folder_level=folder_level, skip_unchanged=skip_unchanged)
+        write_pack_metadata(pack)
 
 
 def extract_indexed_sprites(
@@ -241,6 +391,8 @@ def extract_indexed_sprites(
     *,
     output_names: dict[str, str] | None = None,
     overwrite: bool = True,
+    skip_unchanged: bool = False,
+    compress_level: int | None = None,
 ) -> SpriteExtractionSummary:
     """Extract selected sprites using the sprite index.
 
@@ -249,6 +401,8 @@ def extract_indexed_sprites(
         output_dir: Flat output directory for the selected images.
         output_names: Optional mapping of sprite ID to destination filename.
         overwrite: Replace existing files when True.
+        skip_unchanged: Don't rewrite sprites whose content hash matches the sprite manifest.
+        compress_level: PNG compression level. Defaults to the ``png_compress_level`` setting.
     """
     records = list(sprite_records)
     output_dir = Path(output_dir)
@@ -259,6 +413,10 @@ def extract_indexed_sprites(
     if not records:
         return summary
 
+    if compress_level is None:
+        compress_level = get_png_compress_level()
+    manifest = _load_manifest() if skip_unchanged else None
+
     texturepacks_dir = Path(get_game_directory()) / "media" / "texturepacks"
     records_by_pack: dict[str, list[dict]] = defaultdict(list)
 
@@ -269,14 +427,15 @@ def extract_indexed_sprites(
             continue
         records_by_pack[pack_file].append(record)
 
-    progress = tqdm(
+    queued: dict[str, tuple] = {}
+    sheet_sources: dict[tuple[str, int], tuple] = {}
+
+    with tqdm(
         total=len(records),
         desc="Extracting indexed sprites",
         unit="sprite",
         bar_format=PBAR_FORMAT,
-    )
-
-    try:
+    ) as progress:
         for pack_file, pack_records in records_by_pack.items():
             pack_path = texturepacks_dir / pack_file
             if not pack_path.is_file():
@@ -284,111 +443,87 @@ def extract_indexed_sprites(
                 progress.update(len(pack_records))
                 continue
 
-            pack = parse_pack_file(pack_path)
-            sheets = {sheet.index: sheet for sheet in pack.sheets}
-            records_by_sheet: dict[int, list[dict]] = defaultdict(list)
+            with parse_pack_file(pack_path) as pack:
+                sheets = {sheet.index: sheet for sheet in pack.sheets}
 
-            for record in pack_records:
-                records_by_sheet[record.get("sheet_index", -1)].append(record)
+                for record in pack_records:
+                    sheet = sheets.get(record.get("sheet_index", -1))
+                    if sheet is None:
+                        summary.skipped_missing += 1
+                        progress.update(1)
+                        continue
+
+                    entry_index = record.get("entry_index", -1)
+                    wanted_name = str(record.get("name", "")).casefold()
+                    sprite = None
+
+                    if 0 <= entry_index < len(sheet.sprites):
+                        candidate = sheet.sprites[entry_index]
+                        if candidate.name.casefold() == wanted_name:
+                            sprite = candidate
+
+                    if sprite is None:
+                        sprite = next(
+                            (
+                                candidate
+                                for candidate in sheet.sprites
+                                if candidate.name.casefold() == wanted_name
+                            ),
+                            None,
+                        )
 
-            for sheet_index, sheet_records in records_by_sheet.items():
-                sheet = sheets.get(sheet_index)
-                if sheet is None:
-                    summary.skipped_missing += len(sheet_records)
-                    progress.update(len(sheet_records))
-                    continue
+                    if sprite is None:
+                        summary.skipped_missing += 1
+                        progress.update(1)
+                        continue
 
-                image = _sheet_image(pack, sheet)
-                try:
-                    for record in sheet_records:
-                        entry_index = record.get("entry_index", -1)
-                        sprite = None
-
-                        if 0 <= entry_index < len(sheet.sprites):
-                            candidate = sheet.sprites[entry_index]
-                            if candidate.name.casefold() == str(record.get("name", "")).casefold():
-                                sprite = candidate
-
-                        if sprite is None:
-                            wanted_name = str(record.get("name", "")).casefold()
-                            sprite = next(
-                                (
-                                    candidate
-                                    for candidate in sheet.sprites
-                                    if candidate.name.casefold() == wanted_name
-                                ),
-                                None,
-                            )
-
-                        if sprite is None:
-                            summary.skipped_missing += 1
-                            progress.update(1)
-                            continue
-
-                        if not sprite.valid:
-                            summary.skipped_invalid += 1
-                            progress.update(1)
-                            continue
-
-                        x2 = sprite.x_pos + sprite.width
-                        y2 = sprite.y_pos + sprite.height
-
-                        if not (
-                            0 <= sprite.x_pos < image.width
-                            and 0 <= sprite.y_pos < image.height
-                            and sprite.x_pos < x2 <= image.width
-                            and sprite.y_pos < y2 <= image.height
-                            and sprite.total_width > 0
-                            and sprite.total_height > 0
-                            and sprite.x_offset + sprite.width <= sprite.total_width
-                            and sprite.y_offset + sprite.height <= sprite.total_height
-                        ):
-                            summary.skipped_bounds += 1
-                            progress.update(1)
-                            continue
-
-                        output_name = output_names.get(
-                            record.get("id", ""),
-                            record.get("file_name") or f"{sprite.name}.png",
-                        )
-                        output_name = Path(output_name).name
-                        suffix = Path(output_name).suffix or ".png"
-                        stem = _safe_stem(Path(output_name).stem, "sprite")
-                        output_path = output_dir / f"{stem}{suffix}"
-
-                        if output_path.exists() and not overwrite:
-                            summary.skipped_existing += 1
-                            progress.update(1)
-                            continue
-
-                        crop = image.crop((sprite.x_pos, sprite.y_pos, x2, y2))
-                        output_image = Image.new(
-                            "RGBA",
-                            (sprite.total_width, sprite.total_height),
-                            (0, 0, 0, 0),
-                        )
-                        output_image.paste(crop, (sprite.x_offset, sprite.y_offset))
-                        output_image.save(output_path, format="PNG")
-                        output_image.close()
-                        crop.close()
+                    if not sprite.valid:
+                        summary.skipped_invalid += 1
+                        progress.update(1)
+                        continue
 
-                        summary.extracted += 1
+                    if not _sprite_in_bounds(sprite, sheet):
+                        summary.skipped_bounds += 1
                         progress.update(1)
-                finally:
-                    image.close()
-    finally:
-        progress.close()
+                        continue
+
+                    output_name = output_names.get(
+                        record.get("id", ""),
+                        record.get("file_name") or f"{sprite.name}.png",
+                    )
+                    output_name = Path(output_name).name
+                    suffix = Path(output_name).suffix or ".png"
+                    stem = _safe_stem(Path(output_name).stem, "sprite")
+                    output_path = output_dir / f"{stem}{suffix}"
+
+                    if not overwrite and output_path.exists():
+                        summary.skipped_existing += 1
+                        progress.update(1)
+                        continue
+
+                    sheet_key = (pack_file, sheet.index)
+                    if sheet_key not in sheet_sources:
+                        sheet_sources[sheet_key] = _sheet_source(pack, sheet)
+                    _queue_sprite(queued, summary, output_path, sheet_key, sprite)
+
+        # Superseded sprites were counted when replaced.
+        progress.update(summary.extracted)
+
+        tasks = _build_sheet_tasks(queued, sheet_sources, compress_level, manifest)
+        _run_sheet_tasks(tasks, summary, progress, manifest)
 
     return summary
 
 
-def extract_all_sprites(folder_level: int = 2) -> None:
+def extract_all_sprites(folder_level: int = 2, skip_unchanged: bool = False) -> None:
     """Extract sprites from every Project Zomboid texture pack.
 
     Folder levels:
         0: completely flat
         1: pack folder
         2: pack folder and spritesheet folder
+
+    With ``skip_unchanged``, sprites whose content hash matches the sprite manifest aren't rewritten.
     """
     if folder_level not in {0, 1, 2}:
         raise ValueError("folder_level must be 0, 1, or 2.")
@@ -416,7 +551,7 @@ def extract_all_sprites(folder_level: int = 2) -> None:
         )
 
     for pack_path in tqdm(pack_files, desc="Texture packs", unit="pack", bar_format=PBAR_FORMAT):
-        extract_pack_sprites(pack_path, folder_level=folder_level)
+        extract_pack_sprites(pack_path, folder_level=folder_level, skip_unchanged=skip_unchanged)
 
 
 def main() -> None:
@@ -429,7 +564,10 @@ def main() -> None:
     user_input = input("> ").strip()
     folder_level = int(user_input) if user_input in {"0", "1", "2"} else 2
 
-    extract_all_sprites(folder_level=folder_level)
+    user_input = input("Skip sprites that haven't changed since the last extraction? (Y/N)\n> ").strip().lower()
+    skip_unchanged = user_input == "y"
+
+    extract_all_sprites(folder_level=folder_level, skip_unchanged=skip_unchanged)
 
 
 if __name__ == "__main__":
@@ -2,24 +2,29 @@
 Build a versioned index of sprites stored in Project Zomboid .pack files.
 
 The generated index is used to locate sprites by name, category, pack, and spritesheet without extracting every image.
+Each pack is indexed into its own cached shard, so only packs that changed are parsed again.
 """
 
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import asdict, dataclass
 from pathlib import Path
 
 from tqdm import tqdm
 
-from scripts.core.cache import load_cache, save_cache
-from scripts.core.config_manager import get_game_directory
-from scripts.core.constants import PBAR_FORMAT
+from scripts.core.cache import get_cache_meta, is_cache_current, load_cache, save_cache
+from scripts.core.config_manager import get_game_directory, get_worker_count
+from scripts.core.constants import CACHE_DIR, PBAR_FORMAT
+from scripts.core.file_loading import hash_file
 from scripts.core.version import Version
 from scripts.parser.pack_parser import Pack, SpriteEntry, parse_pack_file
 
 
-SCHEMA_VERSION = 1
+SCHEMA_VERSION = 2
 CACHE_FILE = "sprite_index.json"
+SHARD_DIR = os.path.join(CACHE_DIR, "sprite_index")
 
 PACK_PROFILES = {
     "ApCom": ("tiles", "1x", "tiles"),
@@ -504,16 +509,137 @@ def analyse_pack(pack: Pack, index: dict) -> None:
     index["counts"]["packs"] += 1
 
 
+def _get_pack_source(pack_path: Path, previous: dict | None = None) -> dict:
+    """Return the size, modified time and hash of a pack, reusing the previous hash if its stat is unchanged."""
+    stat = pack_path.stat()
+    source = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    if previous and previous.get("size") == source["size"] and previous.get("mtime_ns") == source["mtime_ns"]:
+        source["sha256"] = previous.get("sha256")
+    else:
+        source["sha256"] = hash_file(pack_path)
+
+    return source
+
+
+def _stat_matches(source: dict | None, pack_path: Path) -> bool:
+    """Check whether a recorded pack source still matches the file's size and modified time."""
+    if not source:
+        return False
+    stat = pack_path.stat()
+    return source.get("size") == stat.st_size and source.get("mtime_ns") == stat.st_mtime_ns
+
+
+def _shard_path(pack_path: Path) -> str:
+    """Return the cache path of a pack's index shard."""
+    return os.path.join(SHARD_DIR, f"{pack_path.name}.json")
+
+
+def _get_shard_source(pack_path: Path) -> dict | None:
+    """Return the pack source a current shard was saved with, read from its metadata without decoding the shard."""
+    shard_path = _shard_path(pack_path)
+    if not is_cache_current(shard_path):
+        return None
+    return get_cache_meta(shard_path).get("sources", {}).get(pack_path.name)
+
+
+def _load_shard(pack_path: Path) -> dict | None:
+    """Load a pack's index shard when its version and schema are current."""
+    shard_path = _shard_path(pack_path)
+    if not is_cache_current(shard_path):
+        return None
+
+    shard = load_cache(shard_path, cache_name="sprite index shard", suppress=True)
+    if not shard or shard.get("schema_version") != SCHEMA_VERSION:
+        return None
+
+    return shard
+
+
+def build_pack_shard(pack_path: Path, previous_sha256: str | None = None) -> tuple[dict, dict | None]:
+    """Hash a pack and, unless its hash matches, index it on its own.
+
+    Args:
+        pack_path: Path to the .pack file.
+        previous_sha256: Hash of the pack when its cached shard was built.
+
+    Returns:
+        The pack source (size, modified time and hash), and its index shard,
+        or None if the hash matched and the cached shard can be reused.
+    """
+    source = _get_pack_source(pack_path)
+    if previous_sha256 is not None and source["sha256"] == previous_sha256:
+        return source, None
+
+    shard = _new_index()
+    with parse_pack_file(pack_path) as pack:
+        analyse_pack(pack, shard)
+    shard["source"] = source
+
+    return source, shard
+
+
+def _build_pack_shard_worker(task: tuple[Path, str | None]) -> tuple[dict, dict | None]:
+    """Process pool entry point for :func:`build_pack_shard`."""
+    return build_pack_shard(*task)
+
+
+def merge_index(index: dict, shard: dict) -> None:
+    """Merge one pack's index shard into the global sprite index."""
+    index["packs"].update(shard["packs"])
+    index["sprites"].update(shard["sprites"])
+
+    for name, sprite_ids in shard["by_name"].items():
+        index["by_name"].setdefault(name, []).extend(sprite_ids)
+
+    for category, sprite_ids in shard["ui"].items():
+        index["ui"].setdefault(category, []).extend(sprite_ids)
+
+    for scale, categories in shard["tiles"].items():
+        for category, sprite_ids in categories.items():
+            index["tiles"].setdefault(scale, {}).setdefault(category, []).extend(sprite_ids)
+
+    index["other"].extend(shard["other"])
+
+    for pack_name in shard["unknown_packs"]:
+        if pack_name not in index["unknown_packs"]:
+            index["unknown_packs"].append(pack_name)
+
+    for key, count in shard["counts"].items():
+        index["counts"][key] = index["counts"].get(key, 0) + count
+
+
+def _store_shard(pack_path: Path, source: dict, shard: dict | None) -> dict:
+    """Save a built shard, or the previous shard with its updated source if the pack's hash didn't change.
+
+    The pack source is also saved as the shard's `sources`, so it can be checked without decoding the shard.
+    """
+    if shard is None:
+        shard = _load_shard(pack_path)
+        if shard is None:
+            source, shard = build_pack_shard(pack_path)
+        shard["source"] = source
+
+    save_cache(shard, f"{pack_path.name}.json", SHARD_DIR, suppress=True, sources={pack_path.name: source})
+    return shard
+
+
 def get_sprite_index(force: bool = False) -> dict:
-    """Build or load the versioned Project Zomboid sprite index."""
-    cached = _load_index_cache()
+    """Build or load the versioned Project Zomboid sprite index.
 
-    if cached is not None and not force:
-        return cached
+    The cached index is returned while every pack's size and modified time match. Otherwise each
+    changed pack is hashed, and only packs whose hash changed are parsed again, in a process pool.
+
+    Args:
+        force: Parse every pack again, ignoring cached shards.
+    """
+    cached = _load_index_cache()
 
     texturepacks_dir = (Path(get_game_directory()) / "media" / "texturepacks")
 
     if not texturepacks_dir.is_dir():
+        if cached is not None and not force:
+            return cached
         raise FileNotFoundError(f"Texture pack directory not found: {texturepacks_dir}")
 
     pack_files = sorted(
@@ -528,13 +654,55 @@ def get_sprite_index(force: bool = False) -> dict:
     if not pack_files:
         raise FileNotFoundError(f"No .pack files found in: {texturepacks_dir}")
 
-    index = _new_index()
+    if cached is not None and not force:
+        sources = cached.get("sources", {})
+        if set(sources) == {path.name for path in pack_files} and all(
+            _stat_matches(sources[path.name], path) for path in pack_files
+        ):
+            return cached
+
+    # Reuse shards whose pack is unchanged, and queue the rest to be hashed and parsed.
+    # Shards of changed packs are only decoded again if the pack's hash turns out to match.
+    shards: dict[str, dict] = {}
+    tasks: list[tuple[Path, str | None]] = []
 
-    for pack_path in tqdm(pack_files, desc="Indexing texture packs", unit="pack", bar_format=PBAR_FORMAT):
-        pack = parse_pack_file(pack_path)
-        analyse_pack(pack, index)
+    for pack_path in pack_files:
+        source = None if force else _get_shard_source(pack_path)
+
+        if source is not None and _stat_matches(source, pack_path):
+            shard = _load_shard(pack_path)
+            if shard is not None:
+                shards[pack_path.name] = shard
+                continue
+
+        tasks.append((pack_path, source.get("sha256") if source else None))
+
+    if tasks:
+        max_workers = get_worker_count()
+
+        with tqdm(total=len(tasks), desc="Indexing texture packs", unit="pack", bar_format=PBAR_FORMAT) as pbar:
+            if max_workers > 1 and len(tasks) > 1:
+                with ProcessPoolExecutor(max_workers=min(max_workers, len(tasks))) as executor:
+                    results = executor.map(_build_pack_shard_worker, tasks)
+                    for (pack_path, _), (source, shard) in zip(tasks, results):
+                        shards[pack_path.name] = _store_shard(pack_path, source, shard)
+                        pbar.update(1)
+            else:
+                for pack_path, previous_sha256 in tasks:
+                    source, shard = build_pack_shard(pack_path, previous_sha256)
+                    shards[pack_path.name] = _store_shard(pack_path, source, shard)
+                    pbar.update(1)
+
+    # Merge in pack order, so the index matches one built pack by pack
+    index = _new_index()
+    for pack_path in pack_files:
+        merge_index(index, shards[pack_path.name])
 
     index["unknown_packs"].sort(key=str.casefold)
+    index["sources"] = {
+        pack_path.name: shards[pack_path.name]["source"]
+        for pack_path in pack_files
+    }
     _save_index_cache(index)
 
     return index
@@ -17,7 +17,8 @@ The script handles:
 import os
 from os import path
 from scripts.core.constants import DATA_DIR
-from scripts.core.cache import load_cache, save_cache
+from scripts.core.cache import save_cache
+from scripts.tiles.tile_store import TileStore, TILE_STORE_PATH
 from scripts.utils import echo
 
 MANUAL_GROUPS = {
@@ -152,12 +153,12 @@ MANUAL_GROUPS = {
     'Window_24': ["fixtures_windows_01_62"],
 }
 
-def process_tiles(tiles_data: dict) -> dict:
+def process_tiles(tiles_data: TileStore) -> dict:
     """
     Process and organize tile data into furniture groups.
 
     Args:
-        tiles_data (dict): Raw tile data from the game files.
+        tiles_data (TileStore): Tile store parsed from the game files.
 
     Returns:
         dict: Processed and organized furniture groups.
@@ -189,18 +190,12 @@ def process_tiles(tiles_data: dict) -> dict:
         if group_obj:
             processed[display_name] = group_obj
 
-    remaining_tiles = {
-        name: info
-        for name, info in tiles_data.items()
-        if name not in manual_keys
-    }
-
     # Sort by display name
     buckets = {}
-    for tile_name, tile_info in remaining_tiles.items():
-        generic = tile_info.get('properties', {}).get('generic', {})
-        if 'IsMoveAble' not in generic or not any(k in generic for k in ('GroupName', 'CustomName')):
+    for tile_name, tile_info in tiles_data.named_movables():
+        if tile_name in manual_keys:
             continue
+        generic = tile_info['properties']['generic']
         group_name = generic.get('GroupName', '').strip()
         custom_name = generic.get('CustomName', '').strip()
         display_key = f"{group_name} {custom_name}".strip()
@@ -290,23 +285,25 @@ def main():
     Main execution function for the named furniture filter.
 
     This function:
-    1. Loads the tile data cache
+    1. Opens the tile store
     2. Processes tiles into furniture groups
     3. Saves the processed data back to cache
     4. Provides progress feedback through echo messages
     """
     os.makedirs(DATA_DIR, exist_ok=True)
 
-    tiles_cache_filename = 'tiles_data.json'
-    tiles_cache_path = path.join(DATA_DIR, tiles_cache_filename)
-    echo.info(f'Loading tiles cache from {tiles_cache_path}')
+    echo.info(f'Loading tile store from {TILE_STORE_PATH}')
     try:
-        tiles_data = load_cache(tiles_cache_path, 'Tiles')
+        tiles_data = TileStore.open()
     except Exception as err:
-        echo.error(f'Error loading tiles cache: {err}')
+        echo.error(f'Error loading tile store: {err}')
+        return
+    if tiles_data is None:
+        echo.error('Tile store not found. Run the tiles parser first.')
         return
 
-    processed_data = process_tiles(tiles_data)
+    with tiles_data:
+        processed_data = process_tiles(tiles_data)
 
     output_filename = 'named_furniture.json'
     output_path = path.join(DATA_DIR, output_filename)
@@ -0,0 +1,249 @@
+"""
+Project Zomboid Wiki Tile Store
+
+Stores parsed tile definitions in an SQLite database instead of one large JSON cache,
+so tile generators can query only the tiles they need rather than loading every tile
+into memory.
+
+Each tile is stored as its JSON definition, alongside indexed columns for the sprite name,
+tilesheet, CustomName, GroupName and container type, plus a table of its flags.
+"""
+
+import json
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from scripts.core.constants import DATA_DIR
+from scripts.core.version import Version
+
+TILE_STORE_FILE = "tiles_data.sqlite"
+TILE_STORE_PATH = os.path.join(DATA_DIR, TILE_STORE_FILE)
+SCHEMA_VERSION = 1  # bump when the tables change
+INSERT_BATCH_SIZE = 5000
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE tiles (
+    position INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    tilesheet TEXT NOT NULL,
+    sheet_index INTEGER,
+    custom_name TEXT,
+    group_name TEXT,
+    container TEXT,
+    is_moveable INTEGER NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE TABLE tile_flags (
+    name TEXT NOT NULL,
+    flag TEXT NOT NULL
+);
+CREATE INDEX tiles_tilesheet ON tiles (tilesheet);
+CREATE INDEX tiles_custom_name ON tiles (custom_name);
+CREATE INDEX tiles_group_name ON tiles (group_name);
+CREATE INDEX tiles_container ON tiles (container);
+CREATE INDEX tile_flags_flag ON tile_flags (flag);
+"""
+
+
+def _tile_row(position: int, name: str, tile: dict) -> tuple:
+    """Get the `tiles` row for a tile definition."""
+    generic = tile.get("properties", {}).get("generic", {})
+    return (
+        position,
+        name,
+        name.rsplit("_", 1)[0],
+        tile.get("tileSheetIndex"),
+        generic.get("CustomName"),
+        generic.get("GroupName"),
+        generic.get("container"),
+        int("IsMoveAble" in generic),
+        json.dumps(tile, ensure_ascii=False, separators=(",", ":")),
+    )
+
+
+class TileStore:
+    """
+    Read-only queries over the tile store. Results are streamed, in the order the tiles were parsed.
+
+    Use `TileStore.build` to create the store, and `TileStore.open` to read it.
+    """
+
+    def __init__(self, connection: sqlite3.Connection):
+        self._connection = connection
+
+    @classmethod
+    def open(cls, path: str = TILE_STORE_PATH) -> "TileStore | None":
+        """
+        Open an existing tile store.
+
+        Args:
+            path (str, optional): Path to the store. Defaults to TILE_STORE_PATH.
+
+        Returns:
+            TileStore | None: The store, or None if it doesn't exist or has an old schema.
+        """
+        if not os.path.isfile(path):
+            return None
+        connection = sqlite3.connect(Path(path).resolve().as_uri() + "?mode=ro", uri=True)
+        store = cls(connection)
+        if store.get_meta("schema") != str(SCHEMA_VERSION):
+            store.close()
+            return None
+        return store
+
+    @classmethod
+    def build(cls, tiles: Iterable[tuple[str, dict]], path: str = TILE_STORE_PATH) -> int:
+        """
+        Create the tile store from tile definitions, replacing any existing store.
+
+        The store is written to a temporary file first, so an interrupted build doesn't replace a working store.
+
+        Args:
+            tiles (Iterable[tuple[str, dict]]): (sprite name, tile definition) pairs. Can be a generator.
+            path (str, optional): Path to the store. Defaults to TILE_STORE_PATH.
+
+        Returns:
+            int: Number of tiles stored.
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = path + ".tmp"
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+        connection = sqlite3.connect(temp_path)
+        count = 0
+        try:
+            connection.executescript(SCHEMA)
+            rows, flag_rows = [], []
+            for name, tile in tiles:
+                rows.append(_tile_row(count, name, tile))
+                flag_rows.extend((name, flag) for flag in tile.get("properties", {}).get("flags", []))
+                count += 1
+                if len(rows) >= INSERT_BATCH_SIZE:
+                    cls._insert(connection, rows, flag_rows)
+                    rows, flag_rows = [], []
+            cls._insert(connection, rows, flag_rows)
+            connection.executemany(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                [("schema", str(SCHEMA_VERSION)), ("version", Version.get())],
+            )
+            connection.commit()
+        finally:
+            connection.close()
+
+        os.replace(temp_path, path)
+        return count
+
+    @staticmethod
+    def _insert(connection: sqlite3.Connection, rows: list[tuple], flag_rows: list[tuple]) -> None:
+        connection.executemany("INSERT INTO tiles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+        connection.executemany("INSERT INTO tile_flags (name, flag) VALUES (?, ?)", flag_rows)
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def __enter__(self) -> "TileStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get_meta(self, key: str) -> str | None:
+        """Get a value from the store's metadata, such as 'version'."""
+        try:
+            row = self._connection.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        except sqlite3.DatabaseError:
+            return None
+        return row[0] if row else None
+
+    @property
+    def version(self) -> str | None:
+        """Game version the store was built from."""
+        return self.get_meta("version")
+
+    def _iter(self, where: str = "", params: tuple = ()) -> Iterator[tuple[str, dict]]:
+        query = f"SELECT name, data FROM tiles {where} ORDER BY position"
+        for name, data in self._connection.execute(query, params):
+            yield name, json.loads(data)
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM tiles").fetchone()[0]
+
+    def __contains__(self, name: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM tiles WHERE name = ?", (name,)).fetchone() is not None
+
+    def get(self, name: str, default: dict = None) -> dict | None:
+        """
+        Get a tile definition by sprite name.
+
+        Args:
+            name (str): Sprite name, e.g. 'furniture_seating_indoor_01_0'.
+            default (dict, optional): Returned if the tile doesn't exist. Defaults to None.
+
+        Returns:
+            dict | None: The tile definition, as it was stored in 'tiles_data.json'.
+        """
+        row = self._connection.execute("SELECT data FROM tiles WHERE name = ?", (name,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def items(self) -> Iterator[tuple[str, dict]]:
+        """Iterate over every (sprite name, tile definition) pair."""
+        return self._iter()
+
+    def by_tilesheet(self, tilesheet: str) -> Iterator[tuple[str, dict]]:
+        """Iterate over the tiles of one tilesheet, e.g. 'furniture_seating_indoor_01'."""
+        return self._iter("WHERE tilesheet = ?", (tilesheet,))
+
+    def by_name(self, custom_name: str = None, group_name: str = None) -> Iterator[tuple[str, dict]]:
+        """
+        Iterate over tiles with a CustomName and/or GroupName.
+
+        Args:
+            custom_name (str, optional): CustomName to match.
+            group_name (str, optional): GroupName to match.
+        """
+        conditions, params = [], []
+        if custom_name is not None:
+            conditions.append("custom_name = ?")
+            params.append(custom_name)
+        if group_name is not None:
+            conditions.append("group_name = ?")
+            params.append(group_name)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._iter(where, tuple(params))
+
+    def with_flag(self, flag: str) -> Iterator[tuple[str, dict]]:
+        """Iterate over tiles that have a flag, e.g. 'solidtrans'."""
+        return self._iter("WHERE name IN (SELECT name FROM tile_flags WHERE flag = ?)", (flag,))
+
+    def named_movables(self) -> Iterator[tuple[str, dict]]:
+        """Iterate over movable tiles that have a CustomName or GroupName."""
+        return self._iter("WHERE is_moveable = 1 AND (custom_name IS NOT NULL OR group_name IS NOT NULL)")
+
+    def containers(self) -> Iterator[tuple[str, str]]:
+        """Iterate over (sprite name, container type) pairs, for tiles with a non-empty container type."""
+        query = "SELECT name, container FROM tiles WHERE container IS NOT NULL AND container != '' ORDER BY position"
+        return iter(self._connection.execute(query))
+
+
+def open_tile_store(path: str = TILE_STORE_PATH, current_only: bool = True) -> TileStore | None:
+    """
+    Open the tile store.
+
+    Args:
+        path (str, optional): Path to the store. Defaults to TILE_STORE_PATH.
+        current_only (bool, optional): Only open the store if it was built from the current game version. Defaults to True.
+
+    Returns:
+        TileStore | None: The store, or None if it doesn't exist or is outdated.
+    """
+    store = TileStore.open(path)
+    if store is not None and current_only and store.version != Version.get():
+        store.close()
+        return None
+    return store
@@ -9,6 +9,7 @@ from scripts.utils import echo
 from scripts.parser.tiles_parser import main as parse_tiles
 from scripts.parser.movable_definitions_parser import main as parse_movable_definitions
 from scripts.tiles.named_furniture_filter import main as parse_named_furniture
+from scripts.tiles.tile_store import open_tile_store
 from scripts.parser.script_parser import extract_script_data
 
 # generators
@@ -22,7 +23,6 @@ from scripts.tiles.entity_health import main as generate_entity_health
 from scripts.lists.furniture_list import generate_furniture_lists
 from scripts.lists.furniture_surfaces_list import generate_surface_list
 
-TILE_CACHE_FILE = "tiles_data.json"
 NAMED_FURNITURE_CACHE_FILE = "named_furniture.json"
 MOVABLE_DEFINITIONS_CACHE_FILE = "movable_definitions.json"
 ENTITY_CACHE_FILE = "parsed_entity_data.json"
@@ -61,6 +61,27 @@ def generate_cache(cache_path: str, cache_label: str, parser_func, game_version:
         return None, None
 
 
+def load_tile_store():
+    """
+    Open the tile store, parsing the game's .tiles files first if it's missing or outdated.
+
+    Returns:
+        TileStore | None: The open tile store, or None if it couldn't be opened.
+    """
+    try:
+        store = open_tile_store()
+        if store is None:
+            echo.info("Generating tile store")
+            parse_tiles()
+            store = open_tile_store()
+        if store is not None:
+            echo.info("Tile store loaded")
+        return store
+    except Exception as exc:
+        echo.error(f"Error loading tile store: {exc}")
+        return None
+
+
 def main(lang_code):
     """
     Main execution function for the tile processing pipeline.
@@ -82,12 +103,11 @@ def main(lang_code):
     os.makedirs(DATA_DIR, exist_ok=True)
     game_version = Version.get()
 
-    tile_path = os.path.join(DATA_DIR, TILE_CACHE_FILE)
     named_path = os.path.join(DATA_DIR, NAMED_FURNITURE_CACHE_FILE)
     defs_path = os.path.join(DATA_DIR, MOVABLE_DEFINITIONS_CACHE_FILE)
     entity_path = os.path.join(CACHE_DIR, ENTITY_CACHE_FILE)
 
-    tiles_data, _ = generate_cache(tile_path, "Tiles", parse_tiles, game_version)
+    tiles_data = load_tile_store()
     named_tiles_data, _ = generate_cache(
         named_path, "Named Tiles", parse_named_furniture, game_version
     )
@@ -105,6 +125,8 @@ def main(lang_code):
         or entity_data is None
     ):
         echo.error("One or more caches failed to load.")
+        if tiles_data is not None:
+            tiles_data.close()
         return
 
     echo.success("All caches loaded")
@@ -138,7 +160,8 @@ def main(lang_code):
     echo.success("Crafting surfaces list generated")
 
     echo.info("Generating container mapping")
-    generate_container_mapping(tiles_data, lang_code)
+    with tiles_data:
+        generate_container_mapping(tiles_data, lang_code)
     echo.success("Container mapping generated")
 
     echo.info("Generating entity articles")
@@ -1,7 +1,7 @@
 """
 Project Zomboid Wiki Container Mapping Generator
 
-This script processes the tiles cache to create a mapping of container types to their
+This script queries the tile store to create a mapping of container types to their
 associated tile textures. It identifies tiles that have a non-empty "container" property
 in their generic properties and groups them by container type.
 
@@ -12,20 +12,20 @@ belong to that container type, useful for wiki organization and cross-referencin
 import os
 import json
 from typing import Dict, List
-from scripts.core.constants import DATA_DIR, OUTPUT_LANG_DIR
+from scripts.core.constants import OUTPUT_LANG_DIR
 from scripts.core.language import Language
-from scripts.core.cache import load_cache
+from scripts.tiles.tile_store import TileStore
 from scripts.utils import echo
 
 
 def generate_container_mapping(
-    tiles_data: Dict, lang_code: str
+    tiles_data: TileStore, lang_code: str
 ) -> Dict[str, Dict[str, List[str]]]:
     """
     Generate container mapping from tiles data.
 
     Args:
-        tiles_data (Dict): The loaded tiles cache data
+        tiles_data (TileStore): The tile store to query
         lang_code (str): Language code for output directory
 
     Returns:
@@ -33,18 +33,9 @@ def generate_container_mapping(
     """
     container_mapping = {}
 
-    for tile_name, tile_data in tiles_data.items():
-        # Check if tile has properties and generic properties
-        if not tile_data.get("properties") or not tile_data["properties"].get(
-            "generic"
-        ):
-            continue
-
-        generic_props = tile_data["properties"]["generic"]
-        container_type = generic_props.get("container")
-
-        # Only process tiles with non-empty container property
-        if container_type and container_type.strip():
+    # Only tiles with a container property are read from the store
+    for tile_name, container_type in tiles_data.containers():
+        if container_type.strip():
             if container_type not in container_mapping:
                 container_mapping[container_type] = {"textures": []}
 
@@ -114,18 +105,20 @@ def save_container_mapping(
     echo.info(f"All container mappings saved to {container_mapping_dir}")
 
 
-def main(tiles_data: Dict = None, lang_code: str = None) -> None:
+def main(tiles_data: TileStore = None, lang_code: str = None) -> None:
     """
     Main function to generate container mapping from tiles data.
 
     Args:
-        tiles_data (Dict, optional): Pre-loaded tiles data. If None, loads from cache.
+        tiles_data (TileStore, optional): Open tile store. If None, opens the default store.
         lang_code (str, optional): Language code. If None, gets from Language.get().
     """
+    opened_store = None
     if tiles_data is None:
-        # Load tiles data from cache
-        tiles_cache_path = os.path.join(DATA_DIR, "cache", "tiles_data.json")
-        tiles_data = load_cache(tiles_cache_path, "Tiles")
+        tiles_data = opened_store = TileStore.open()
+        if tiles_data is None:
+            echo.error("Tile store not found. Run the tiles parser first.")
+            return
 
     if lang_code is None:
         lang_code = Language.get()
@@ -133,7 +126,11 @@ def main(tiles_data: Dict = None, lang_code: str = None) -> None:
     echo.info("Generating container mapping")
 
     # Generate the container mapping
-    container_mapping = generate_container_mapping(tiles_data, lang_code)
+    try:
+        container_mapping = generate_container_mapping(tiles_data, lang_code)
+    finally:
+        if opened_store is not None:
+            opened_store.close()
 
     # Save the mapping
     save_container_mapping(container_mapping, lang_code)
@@ -8,20 +8,34 @@ multiple grid cells, combining their individual sprites into a single cohesive i
 while maintaining proper positioning and orientation.
 
 The script processes sprites based on their facing direction (North, South, East, West)
-and grid positions, using threading for improved performance.
+and grid positions, stitching in a process pool for improved performance. Decoded sprites
+are kept in a bounded LRU cache, and can be read straight from the texture packs through
+the sprite index instead of extracted tile images. Composites whose input sprites haven't
+changed since the last run aren't re-encoded.
 
 This script supports both:
 - Furniture tiles (from named_furniture.json with explicit SpriteGridPos)
 - Entity tiles (from parsed_entity_data.json with spriteOutputs lists)
 """
 
+import hashlib
+import io
 import os
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
 from PIL import Image
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor
 from scripts.core.language import Language
-from scripts.core.cache import load_cache
+from scripts.core.cache import load_cache, save_cache
+from scripts.core.config_manager import get_game_directory, get_worker_count
 from scripts.core.constants import RESOURCE_DIR, OUTPUT_DIR, CACHE_DIR
+from scripts.parser.pack_parser import Pack, parse_pack_file
+from scripts.sprites.sprite_extractor import crop_sprite
+from scripts.sprites.sprite_indexer import get_preferred_sprite, get_sprite_index
 from scripts.utils import echo
 
 SPRITE_WIDTH = 128
@@ -64,18 +78,313 @@ FACING_TO_FOLDER = {
     "W": "West",
 }
 
-THREAD_POOL_MAX_WORKERS = (os.cpu_count() / 2) or 2
-
-LANGUAGE_CODE = Language.get()
+SPRITE_CACHE_SIZE = 512  # decoded sprites kept in memory
+SHEET_CACHE_SIZE = 4  # decoded pack sheets kept in memory when reading from packs
 
 CACHE_FILENAME = "named_furniture.json"
 NAMED_FURNITURE_CACHE_PATH = os.path.join("data", CACHE_FILENAME)
+STITCH_MANIFEST_FILE = "stitch_manifest.json"
+# Sprite digests from earlier runs, as {sprite: [source key, digest]}
+SPRITE_DIGESTS_FILE = "stitch_sprite_digests.json"
 
 SPRITE_IMAGES_DIRECTORY = os.path.join(RESOURCE_DIR, "tile_images")
-OUTPUT_IMAGES_BASE_PATH = os.path.join(OUTPUT_DIR, LANGUAGE_CODE, "tiles", "images")
-OUTPUT_ENTITY_IMAGES_BASE_PATH = os.path.join(
-    OUTPUT_DIR, LANGUAGE_CODE, "tiles", "entity_images_stitched"
-)
+
+
+@dataclass(slots=True)
+class StitchResult:
+    """Outcome of one stitching task."""
+
+    output_base_name: str
+    facing_direction: str
+    status: str  # 'stitched', 'unchanged', 'missing' or 'failed'
+    output_file_path: str | None = None
+    input_hash: str | None = None
+    missing_sprites: list[str] = field(default_factory=list)
+    error: str | None = None
+    sprite_digests: dict[str, list] = field(default_factory=dict)  # {sprite: [source key, digest]} of the inputs
+
+
+def get_output_images_path() -> str:
+    """Get the output directory for stitched furniture images, in the current language."""
+    return os.path.join(OUTPUT_DIR, Language.get(), "tiles", "images")
+
+
+def get_entity_output_images_path() -> str:
+    """Get the output directory for stitched entity images, in the current language."""
+    return os.path.join(OUTPUT_DIR, Language.get(), "tiles", "entity_images_stitched")
+
+
+def get_output_file_path(output_images_path: str, facing_direction: str, output_base_name: str) -> str:
+    """Get the file path of a stitched image."""
+    return os.path.join(
+        output_images_path,
+        FACING_TO_FOLDER.get(facing_direction, facing_direction),
+        f"{output_base_name}.png",
+    )
+
+
+class SpriteSource:
+    """
+    Load decoded sprites for stitching, keeping recently used ones in a bounded LRU cache.
+
+    Sprites are read from the extracted tile images, or directly from the texture packs
+    using the sprite index. The cache is thread-safe so one source can be shared across
+    every stitch task.
+    """
+
+    def __init__(
+        self,
+        from_packs: bool = None,
+        cache_size: int = SPRITE_CACHE_SIZE,
+        sprite_records: dict[str, dict | None] = None,
+        known_digests: dict[str, list] = None,
+    ):
+        """
+        Args:
+            from_packs (bool, optional): Read sprites from the texture packs instead of extracted images.
+                Defaults to True only if the tile images directory doesn't exist.
+            cache_size (int, optional): Maximum number of decoded sprites to keep. Defaults to SPRITE_CACHE_SIZE.
+            sprite_records (dict[str, dict | None], optional): Pack records already resolved with
+                `resolve_records`. If given, the sprite index is never loaded. Defaults to None.
+            known_digests (dict[str, list], optional): Digests from an earlier run, see `use_known_digests`. Defaults to None.
+        """
+        if from_packs is None:
+            from_packs = not os.path.isdir(SPRITE_IMAGES_DIRECTORY)
+        self.from_packs = from_packs
+        self.cache_size = cache_size
+        self._sprites: OrderedDict[str, Image.Image | None] = OrderedDict()
+        self._digests: dict[str, tuple[str, str] | None] = {}
+        self._known_digests: dict[str, list] = known_digests or {}
+        self._pack_stats: dict[str, str | None] = {}
+        self._sheets: OrderedDict[tuple[str, int], Image.Image] = OrderedDict()
+        self._packs: dict[str, Pack] = {}
+        self._index = None
+        self._records = sprite_records
+        self._lock = threading.Lock()
+        self._sheet_lock = threading.Lock()
+
+    def get(self, sprite_identifier: str) -> Image.Image | None:
+        """
+        Get a decoded RGBA sprite. The returned image is shared and must not be modified.
+
+        Args:
+            sprite_identifier (str): Sprite name, without the '.png' extension.
+
+        Returns:
+            Image.Image | None: The sprite image, or None if it couldn't be found.
+        """
+        with self._lock:
+            if sprite_identifier in self._sprites:
+                self._sprites.move_to_end(sprite_identifier)
+                return self._sprites[sprite_identifier]
+
+        if self.from_packs:
+            sprite_image = self._load_from_pack(sprite_identifier)
+        else:
+            sprite_image = self._load_from_file(sprite_identifier)
+
+        with self._lock:
+            self._sprites[sprite_identifier] = sprite_image
+            self._sprites.move_to_end(sprite_identifier)
+            while len(self._sprites) > self.cache_size:
+                self._sprites.popitem(last=False)
+
+        return sprite_image
+
+    def use_known_digests(self, known_digests: dict[str, list]) -> None:
+        """
+        Reuse sprite digests from an earlier run, so sprites whose source hasn't changed aren't decoded to be hashed.
+
+        Args:
+            known_digests (dict[str, list]): Digests as {sprite: [source key, digest]}, from `StitchResult.sprite_digests`.
+        """
+        with self._lock:
+            self._known_digests = known_digests
+
+    def get_digest(self, sprite_identifier: str) -> str | None:
+        """
+        Get a content hash of a decoded sprite, which is kept after the sprite leaves the cache.
+
+        Args:
+            sprite_identifier (str): Sprite name, without the '.png' extension.
+
+        Returns:
+            str | None: SHA-256 of the sprite's size and pixels, or None if it couldn't be found.
+        """
+        digest_record = self.get_digest_record(sprite_identifier)
+        return digest_record[1] if digest_record else None
+
+    def get_digest_record(self, sprite_identifier: str) -> tuple[str, str] | None:
+        """
+        Get a content hash of a sprite, with the key of the source it was computed from.
+
+        The sprite is only decoded if its source key doesn't match a known digest.
+
+        Args:
+            sprite_identifier (str): Sprite name, without the '.png' extension.
+
+        Returns:
+            tuple[str, str] | None: The source key and SHA-256 of the sprite's size and pixels, or None if it couldn't be found.
+        """
+        with self._lock:
+            if sprite_identifier in self._digests:
+                return self._digests[sprite_identifier]
+            known = self._known_digests.get(sprite_identifier)
+
+        digest_record = None
+        source_key = self._get_source_key(sprite_identifier)
+        if source_key is not None:
+            if known and known[0] == source_key:
+                digest_record = (source_key, known[1])
+            else:
+                sprite_image = self.get(sprite_identifier)
+                if sprite_image is not None:
+                    digest = hashlib.sha256(f"{sprite_image.width}x{sprite_image.height}:".encode("ascii"))
+                    digest.update(sprite_image.tobytes())
+                    digest_record = (source_key, digest.hexdigest())
+
+        with self._lock:
+            self._digests[sprite_identifier] = digest_record
+        return digest_record
+
+    def _get_source_key(self, sprite_identifier: str) -> str | None:
+        """Get a key that changes with the sprite's source file or its place in it, without decoding the sprite."""
+        if not self.from_packs:
+            try:
+                stat = os.stat(os.path.join(SPRITE_IMAGES_DIRECTORY, f"{sprite_identifier}.png"))
+            except OSError:
+                return None
+            return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+        with self._sheet_lock:
+            record = self._find_record(sprite_identifier)
+            if record is None:
+                return None
+
+            pack_file = record["pack_file"]
+            if pack_file not in self._pack_stats:
+                pack_path = Path(get_game_directory()) / "media" / "texturepacks" / pack_file
+                try:
+                    stat = pack_path.stat()
+                    self._pack_stats[pack_file] = f"{stat.st_size}:{stat.st_mtime_ns}"
+                except OSError:
+                    self._pack_stats[pack_file] = None
+            pack_stat = self._pack_stats[pack_file]
+
+        if pack_stat is None:
+            return None
+        location = ",".join(
+            str(record[key])
+            for key in (
+                "sheet_index", "x", "y", "width", "height", "x_offset", "y_offset", "total_width", "total_height"
+            )
+        )
+        return f"{pack_file}:{pack_stat}:{location}"
+
+    def _load_from_file(self, sprite_identifier: str) -> Image.Image | None:
+        """Decode a sprite from the extracted tile images."""
+        image_file_path = os.path.join(SPRITE_IMAGES_DIRECTORY, f"{sprite_identifier}.png")
+        if not os.path.isfile(image_file_path):
+            return None
+
+        with Image.open(image_file_path) as sprite_image:
+            return sprite_image.convert("RGBA")
+
+    def resolve_records(self, sprite_identifiers: Iterable[str]) -> dict[str, dict | None]:
+        """
+        Look up the pack records for sprites, loading the sprite index if needed.
+
+        Args:
+            sprite_identifiers (Iterable[str]): Sprite names, without the '.png' extension.
+
+        Returns:
+            dict[str, dict | None]: Pack record for each sprite, or None if it isn't in the index.
+        """
+        with self._sheet_lock:
+            return {
+                sprite_identifier: self._find_record(sprite_identifier)
+                for sprite_identifier in sprite_identifiers
+            }
+
+    def _find_record(self, sprite_identifier: str) -> dict | None:
+        """Get the preferred pack record for a sprite. Caller holds `_sheet_lock`."""
+        if self._records is not None:
+            return self._records.get(sprite_identifier)
+
+        if self._index is None:
+            self._index = get_sprite_index()
+
+        return (
+            get_preferred_sprite(self._index, sprite_identifier, domain="tiles", scale="2x")
+            or get_preferred_sprite(self._index, sprite_identifier, domain="tiles")
+        )
+
+    def _load_from_pack(self, sprite_identifier: str) -> Image.Image | None:
+        """Crop a sprite from its texture pack sheet, found through the sprite index."""
+        with self._sheet_lock:
+            record = self._find_record(sprite_identifier)
+            if record is None:
+                return None
+
+            sheet_image = self._get_sheet(record["pack_file"], record["sheet_index"])
+            if sheet_image is None:
+                return None
+
+            return crop_sprite(sheet_image, (
+                record["x"],
+                record["y"],
+                record["width"],
+                record["height"],
+                record["x_offset"],
+                record["y_offset"],
+                record["total_width"],
+                record["total_height"],
+            ))
+
+    def _get_sheet(self, pack_file: str, sheet_index: int) -> Image.Image | None:
+        """Get a decoded pack sheet, keeping the most recently used ones. Caller holds `_sheet_lock`."""
+        sheet_key = (pack_file, sheet_index)
+        if sheet_key in self._sheets:
+            self._sheets.move_to_end(sheet_key)
+            return self._sheets[sheet_key]
+
+        pack = self._packs.get(pack_file)
+        if pack is None:
+            pack_path = Path(get_game_directory()) / "media" / "texturepacks" / pack_file
+            if not pack_path.is_file():
+                return None
+            pack = self._packs[pack_file] = parse_pack_file(pack_path)
+
+        sheet = next((sheet for sheet in pack.sheets if sheet.index == sheet_index), None)
+        if sheet is None:
+            return None
+
+        with Image.open(io.BytesIO(pack.png_bytes(sheet))) as image:
+            sheet_image = image.convert("RGBA")
+
+        self._sheets[sheet_key] = sheet_image
+        while len(self._sheets) > SHEET_CACHE_SIZE:
+            self._sheets.popitem(last=False)[1].close()
+
+        return sheet_image
+
+    def close(self) -> None:
+        """Release cached images and unmap any open texture packs."""
+        with self._lock, self._sheet_lock:
+            self._sprites.clear()
+            self._digests.clear()
+            for sheet_image in self._sheets.values():
+                sheet_image.close()
+            self._sheets.clear()
+            for pack in self._packs.values():
+                pack.close()
+            self._packs.clear()
+
+    def __enter__(self) -> "SpriteSource":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
 
 def parse_grid_position(position_string: str) -> tuple[int, int]:
@@ -181,11 +490,12 @@ def composite_sprites(
     facing_direction: str,
     sprite_entries_list: list[dict],
     output_base_name: str,
-    progress_bar,
     output_images_path: str = None,
     horizontal_offsets: dict = None,
     vertical_offsets: dict = None,
-) -> None:
+    sprite_source: SpriteSource = None,
+    previous_hash: str = None,
+) -> StitchResult:
     """
     Create a composite image by combining multiple sprite images for a specific facing direction.
 
@@ -193,10 +503,14 @@ def composite_sprites(
         facing_direction (str): The direction the sprite is facing ('N', 'S', 'E', or 'W').
         sprite_entries_list (list[dict]): List of sprite entries containing sprite IDs and grid positions.
         output_base_name (str): Base name for the output file.
-        progress_bar: tqdm progress bar instance for tracking progress.
-        output_images_path (str, optional): Base path for output images. Defaults to OUTPUT_IMAGES_BASE_PATH.
+        output_images_path (str, optional): Base path for output images. Defaults to the furniture output path.
         horizontal_offsets (dict, optional): Horizontal offset values. Defaults to SPRITE_HORIZONTAL_OFFSETS.
         vertical_offsets (dict, optional): Vertical offset values. Defaults to SPRITE_VERTICAL_OFFSETS.
+        sprite_source (SpriteSource, optional): Source for decoded sprites, shared between tasks. Defaults to a new SpriteSource.
+        previous_hash (str, optional): Input hash from the last run. If it matches and the output exists, it isn't rewritten.
+
+    Returns:
+        StitchResult: The outcome, with the hash of the input sprites and layout.
 
     The function handles:
         - Sorting sprites by grid position
@@ -205,11 +519,13 @@ def composite_sprites(
         - Saving the resulting image to the appropriate directory
     """
     if output_images_path is None:
-        output_images_path = OUTPUT_IMAGES_BASE_PATH
+        output_images_path = get_output_images_path()
     if horizontal_offsets is None:
         horizontal_offsets = SPRITE_HORIZONTAL_OFFSETS
     if vertical_offsets is None:
         vertical_offsets = SPRITE_VERTICAL_OFFSETS
+    if sprite_source is None:
+        sprite_source = SpriteSource()
 
     # Sort entries by grid coordinates
     sprite_entries_list.sort(
@@ -248,47 +564,226 @@ def composite_sprites(
     canvas_width = (maximum_x_position - minimum_x_position) + SPRITE_WIDTH
     canvas_height = (maximum_y_position - minimum_y_position) + SPRITE_HEIGHT
 
+    # Hash the input sprites and where they're drawn, so unchanged composites can be skipped
+    input_hash = hashlib.sha256(f"{canvas_width}x{canvas_height}".encode("ascii"))
+    missing_sprites = []
+    sprite_digests = {}
+
+    for sprite_entry, (x_offset, y_offset) in zip(
+        sprite_entries_list, absolute_position_coordinates
+    ):
+        sprite_identifier = sprite_entry["sprite"]
+        digest_record = sprite_source.get_digest_record(sprite_identifier)
+        if digest_record is None:
+            missing_sprites.append(sprite_identifier)
+            continue
+        sprite_digests[sprite_identifier] = list(digest_record)
+        input_hash.update(
+            f";{digest_record[1]}@{x_offset - minimum_x_position},{y_offset - minimum_y_position}".encode("ascii")
+        )
+
+    if missing_sprites:
+        return StitchResult(
+            output_base_name, facing_direction, "missing",
+            missing_sprites=missing_sprites, sprite_digests=sprite_digests,
+        )
+
+    input_hash = input_hash.hexdigest()
+    output_file_path = get_output_file_path(output_images_path, facing_direction, output_base_name)
+
+    if previous_hash == input_hash and os.path.isfile(output_file_path):
+        return StitchResult(
+            output_base_name, facing_direction, "unchanged", output_file_path, input_hash,
+            sprite_digests=sprite_digests,
+        )
+
     composite_canvas = Image.new("RGBA", (canvas_width, canvas_height), (0, 0, 0, 0))
-    has_missing_sprites = False
 
     # Composite each sprite onto the canvas
     for sprite_entry, position_offset in zip(
         sprite_entries_list, absolute_position_coordinates
     ):
-        sprite_identifier = sprite_entry["sprite"]
-        image_filename = f"{sprite_identifier}.png"
-        image_file_path = os.path.join(SPRITE_IMAGES_DIRECTORY, image_filename)
-        if not os.path.isfile(image_file_path):
-            echo.warning(f"Missing sprite: {sprite_identifier}")
-            has_missing_sprites = True
-            continue
+        sprite_image = sprite_source.get(sprite_entry["sprite"])
+        if sprite_image is None:
+            # Only possible if the file was removed after it was hashed and evicted from the cache
+            return StitchResult(
+                output_base_name, facing_direction, "missing", missing_sprites=[sprite_entry["sprite"]]
+            )
 
-        sprite_image = Image.open(image_file_path).convert("RGBA")
         x_offset, y_offset = position_offset
         canvas_draw_x = x_offset - minimum_x_position
         canvas_draw_y = y_offset - minimum_y_position
         composite_canvas.alpha_composite(sprite_image, (canvas_draw_x, canvas_draw_y))
 
-    if has_missing_sprites:
-        echo.warning(
-            f"Skipping {output_base_name} ({facing_direction}) due to missing pieces"
+    # Save composited image
+    os.makedirs(os.path.dirname(output_file_path), exist_ok=True)
+    composite_canvas.save(output_file_path)
+    return StitchResult(
+        output_base_name, facing_direction, "stitched", output_file_path, input_hash,
+        sprite_digests=sprite_digests,
+    )
+
+
+_worker_sprite_source: SpriteSource | None = None
+
+
+def _init_stitch_worker(
+    from_packs: bool, sprite_records: dict[str, dict | None] = None, known_digests: dict[str, list] = None
+) -> None:
+    """
+    Give each worker process its own sprite source, so sprites are decoded once per worker.
+
+    Pack records are resolved once by the parent, so workers never load or rebuild the sprite index.
+    """
+    global _worker_sprite_source
+    _worker_sprite_source = SpriteSource(from_packs, sprite_records=sprite_records, known_digests=known_digests)
+
+
+def _run_stitch_task(task: tuple, sprite_source: SpriteSource) -> StitchResult:
+    """Run one stitching task, returning any exception as a failed result."""
+    facing_direction, sprite_entries_list, output_base_name, output_images_path, horizontal_offsets, vertical_offsets, previous_hash = task
+    try:
+        return composite_sprites(
+            facing_direction,
+            sprite_entries_list,
+            output_base_name,
+            output_images_path,
+            horizontal_offsets,
+            vertical_offsets,
+            sprite_source,
+            previous_hash,
+        )
+    except Exception as exc:
+        return StitchResult(
+            output_base_name, facing_direction, "failed", error=f"{type(exc).__name__}: {exc}"
         )
-        progress_bar.update(1)
-        return
 
-    # Save composited image
-    output_directory = os.path.join(
-        output_images_path, FACING_TO_FOLDER.get(facing_direction, facing_direction)
+
+def _stitch_worker(task: tuple) -> StitchResult:
+    """Process pool entry point for `_run_stitch_task`."""
+    return _run_stitch_task(task, _worker_sprite_source)
+
+
+def run_stitching_tasks(
+    stitching_tasks_list: list[tuple[str, list[dict], str]],
+    output_images_path: str,
+    horizontal_offsets: dict,
+    vertical_offsets: dict,
+    sprite_source: SpriteSource = None,
+    description: str = "Stitching",
+    skip_unchanged: bool = True,
+) -> list[StitchResult]:
+    """
+    Stitch composites in a process pool, and report any that were skipped or failed.
+
+    Args:
+        stitching_tasks_list (list[tuple[str, list[dict], str]]): Tasks in the format
+            (facing_direction, sprite_entries_list, output_base_name).
+        output_images_path (str): Base path for output images.
+        horizontal_offsets (dict): Horizontal offset values.
+        vertical_offsets (dict): Vertical offset values.
+        sprite_source (SpriteSource, optional): Source for decoded sprites when stitching in this process.
+            Worker processes use their own source of the same kind. Defaults to a new SpriteSource.
+        description (str, optional): Progress bar description. Defaults to 'Stitching'.
+        skip_unchanged (bool, optional): Skip composites whose input sprites and layout match the last run. Defaults to True.
+
+    Returns:
+        list[StitchResult]: One result per task, in task order.
+    """
+    if sprite_source is None:
+        sprite_source = SpriteSource()
+
+    manifest = load_cache(STITCH_MANIFEST_FILE, "stitch manifest", suppress=True)
+    # Digests keyed by each sprite's source stat, so unchanged composites are skipped without decoding
+    known_digests = load_cache(SPRITE_DIGESTS_FILE, "sprite digests", suppress=True)
+
+    tasks = []
+    manifest_keys = []
+    for facing_direction, sprite_entries_list, output_base_name in stitching_tasks_list:
+        manifest_key = os.path.relpath(
+            get_output_file_path(output_images_path, facing_direction, output_base_name), OUTPUT_DIR
+        )
+        previous_hash = manifest.get(manifest_key) if skip_unchanged else None
+        manifest_keys.append(manifest_key)
+        tasks.append((
+            facing_direction,
+            sprite_entries_list,
+            output_base_name,
+            output_images_path,
+            horizontal_offsets,
+            vertical_offsets,
+            previous_hash,
+        ))
+
+    results: list[StitchResult] = []
+    max_workers = get_worker_count()
+
+    with tqdm(total=len(tasks), desc=description, unit="tile") as progress_bar:
+        if max_workers > 1 and len(tasks) > 1:
+            task_sprites = {sprite_entry["sprite"] for task in tasks for sprite_entry in task[1]}
+            sprite_records = None
+            if sprite_source.from_packs:
+                sprite_records = sprite_source.resolve_records(task_sprites)
+            task_digests = {
+                sprite: known_digests[sprite] for sprite in task_sprites if sprite in known_digests
+            }
+
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(tasks)),
+                initializer=_init_stitch_worker,
+                initargs=(sprite_source.from_packs, sprite_records, task_digests),
+            ) as executor:
+                for result in executor.map(
+                    _stitch_worker,
+                    tasks,
+                    chunksize=max(1, len(tasks) // (max_workers * 4)),
+                ):
+                    results.append(result)
+                    progress_bar.update(1)
+        else:
+            sprite_source.use_known_digests(known_digests)
+            for task in tasks:
+                results.append(_run_stitch_task(task, sprite_source))
+                progress_bar.update(1)
+
+    counts = {"stitched": 0, "unchanged": 0, "missing": 0, "failed": 0}
+    for manifest_key, result in zip(manifest_keys, results):
+        counts[result.status] += 1
+        known_digests.update(result.sprite_digests)
+        if result.input_hash is not None:
+            manifest[manifest_key] = result.input_hash
+        else:
+            manifest.pop(manifest_key, None)
+
+        if result.status == "missing":
+            echo.warning(
+                f"Skipping {result.output_base_name} ({result.facing_direction}) due to missing pieces: "
+                + ", ".join(result.missing_sprites)
+            )
+        elif result.status == "failed":
+            echo.error(
+                f"Failed to stitch {result.output_base_name} ({result.facing_direction}): {result.error}"
+            )
+
+    save_cache(manifest, STITCH_MANIFEST_FILE, suppress=True)
+    save_cache(known_digests, SPRITE_DIGESTS_FILE, suppress=True)
+    echo.info(
+        f"Stitched {counts['stitched']}, unchanged {counts['unchanged']}, "
+        f"skipped {counts['missing']} with missing sprites, failed {counts['failed']}."
     )
-    os.makedirs(output_directory, exist_ok=True)
-    output_file_path = os.path.join(output_directory, f"{output_base_name}.png")
-    composite_canvas.save(output_file_path)
-    progress_bar.update(1)
+    return results
 
 
-def stitch_furniture_tiles() -> None:
+def stitch_furniture_tiles(sprite_source: SpriteSource = None, skip_unchanged: bool = True) -> list[StitchResult]:
     """
     Process furniture tiles from named_furniture cache and create composite images.
+
+    Args:
+        sprite_source (SpriteSource, optional): Source for decoded sprites. Defaults to a new SpriteSource.
+        skip_unchanged (bool, optional): Skip composites whose input sprites haven't changed. Defaults to True.
+
+    Returns:
+        list[StitchResult]: One result per stitching task.
     """
     named_furniture_data = load_cache(NAMED_FURNITURE_CACHE_PATH, "named furniture")
     stitching_tasks_list: list[tuple[str, list[dict], str]] = []
@@ -328,63 +823,53 @@ def stitch_furniture_tiles() -> None:
     echo.info(
         f"Stitching {len(stitching_tasks_list)} multi-sprite furniture tiles across all facings…"
     )
-    with tqdm(
-        total=len(stitching_tasks_list), desc="Stitching furniture", unit="tile"
-    ) as progress_bar:
-        with ThreadPoolExecutor(max_workers=THREAD_POOL_MAX_WORKERS) as thread_pool:
-            for (
-                facing_direction,
-                sorted_sprite_entries,
-                output_base_name,
-            ) in stitching_tasks_list:
-                thread_pool.submit(
-                    composite_sprites,
-                    facing_direction,
-                    sorted_sprite_entries,
-                    output_base_name,
-                    progress_bar,
-                )
+    return run_stitching_tasks(
+        stitching_tasks_list,
+        get_output_images_path(),
+        SPRITE_HORIZONTAL_OFFSETS,
+        SPRITE_VERTICAL_OFFSETS,
+        sprite_source,
+        description="Stitching furniture",
+        skip_unchanged=skip_unchanged,
+    )
 
 
-def stitch_entity_tiles() -> None:
+def stitch_entity_tiles(sprite_source: SpriteSource = None, skip_unchanged: bool = True) -> list[StitchResult]:
     """
     Process entity tiles from parsed_entity_data cache and create composite images.
+
+    Args:
+        sprite_source (SpriteSource, optional): Source for decoded sprites. Defaults to a new SpriteSource.
+        skip_unchanged (bool, optional): Skip composites whose input sprites haven't changed. Defaults to True.
+
+    Returns:
+        list[StitchResult]: One result per stitching task.
     """
     entity_cache_path = os.path.join(CACHE_DIR, "parsed_entity_data.json")
     entity_data = load_cache(entity_cache_path, "entity")
 
     if not entity_data:
         echo.warning("No entity data found, skipping entity tile stitching")
-        return
+        return []
 
     stitching_tasks_list = extract_entity_stitching_tasks(entity_data)
 
     if not stitching_tasks_list:
         echo.info("No multi-sprite entity tiles found to stitch")
-        return
+        return []
 
     echo.info(
         f"Stitching {len(stitching_tasks_list)} multi-sprite entity tiles across all facings…"
     )
-    with tqdm(
-        total=len(stitching_tasks_list), desc="Stitching entities", unit="tile"
-    ) as progress_bar:
-        with ThreadPoolExecutor(max_workers=THREAD_POOL_MAX_WORKERS) as thread_pool:
-            for (
-                facing_direction,
-                sprite_entries_list,
-                output_base_name,
-            ) in stitching_tasks_list:
-                thread_pool.submit(
-                    composite_sprites,
-                    facing_direction,
-                    sprite_entries_list,
-                    output_base_name,
-                    progress_bar,
-                    OUTPUT_ENTITY_IMAGES_BASE_PATH,
-                    ENTITY_HORIZONTAL_OFFSETS,
-                    ENTITY_VERTICAL_OFFSETS,
-                )
+    return run_stitching_tasks(
+        stitching_tasks_list,
+        get_entity_output_images_path(),
+        ENTITY_HORIZONTAL_OFFSETS,
+        ENTITY_VERTICAL_OFFSETS,
+        sprite_source,
+        description="Stitching entities",
+        skip_unchanged=skip_unchanged,
+    )
 
 
 def stitch_entity_sprites_for_lang(lang_code: str = None) -> None:
@@ -397,27 +882,35 @@ def stitch_entity_sprites_for_lang(lang_code: str = None) -> None:
     stitch_entity_tiles()
 
 
-def main() -> None:
+def main(from_packs: bool = None) -> None:
     """
     Main execution function for the tile stitcher.
 
     Processes both furniture and entity caches to identify multi-tile objects and creates
-    composite images for each valid combination. Uses multi-threading to improve
+    composite images for each valid combination. Uses a process pool to improve
     performance when processing multiple sprites.
+
+    Args:
+        from_packs (bool, optional): Read sprites from the texture packs instead of extracted images.
+            Defaults to True only if the tile images directory doesn't exist.
     """
     echo.info("Starting tile stitching process…")
 
-    # Stitch furniture tiles
-    try:
-        stitch_furniture_tiles()
-    except Exception as exc:
-        echo.error(f"Failed to stitch furniture tiles: {exc}")
-
-    # Stitch entity tiles
-    try:
-        stitch_entity_tiles()
-    except Exception as exc:
-        echo.error(f"Failed to stitch entity tiles: {exc}")
+    # Shared by both stages only when stitching in this process; pool workers build their own
+    # source per stage, so a sprite used by both may be decoded twice. Unchanged composites
+    # aren't decoded at all, as sprite digests are persisted against each sprite's source stat.
+    with SpriteSource(from_packs) as sprite_source:
+        # Stitch furniture tiles
+        try:
+            stitch_furniture_tiles(sprite_source)
+        except Exception as exc:
+            echo.error(f"Failed to stitch furniture tiles: {exc}")
+
+        # Stitch entity tiles
+        try:
+            stitch_entity_tiles(sprite_source)
+        except Exception as exc:
+            echo.error(f"Failed to stitch entity tiles: {exc}")
 
     echo.success("Tile stitching completed")
 
@@ -92,8 +92,9 @@ def setup_language(lang_code):
     Language.set(lang_code)
     Language.set_subpage(lang_code)
 
-    # Force translation loading for the new language
-    Translate.load()
+    # Release the previous language's translations, and load the new language
+    Translate.release(keep=[lang_code])
+    Translate.load(lang_code)
 
     # Clear translations cache
     from scripts.items.item_infobox import translations_cache
@@ -435,6 +436,10 @@ def main():
         # Reset once_run_scripts for this batch
         reset_mark_once()
 
+        # Rebuild any outdated translation caches in parallel
+        if len(languages) > 1:
+            Translate.preload(languages)
+
         # Process each language
         for i, lang_code in enumerate(languages, 1):
             if len(languages) > 1:
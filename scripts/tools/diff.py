@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from tqdm import tqdm
 import difflib
 
@@ -10,6 +10,14 @@ from scripts.utils import echo
 FILE_TYPES = (".txt", ".lua")
 
 
+def _intern_lines(old_lines: list[str], new_lines: list[str]) -> tuple[list[int], list[int]]:
+    """Map each distinct line to an integer id, so matching compares ints instead of strings."""
+    ids = {}
+    old_ids = [ids.setdefault(line, len(ids)) for line in old_lines]
+    new_ids = [ids.setdefault(line, len(ids)) for line in new_lines]
+    return old_ids, new_ids
+
+
 def generate_line_diff(old_path: Path, new_path: Path) -> list[dict] | bool:
     """Return grouped diff blocks with full 'old' and 'new' line lists."""
     try:
@@ -18,12 +26,26 @@ def generate_line_diff(old_path: Path, new_path: Path) -> list[dict] | bool:
     except UnicodeDecodeError:
         return True
 
-    matcher = difflib.SequenceMatcher(None, old_lines, new_lines)
+    # Trim the common head and tail, so only the changed region is matched
+    start = 0
+    max_start = min(len(old_lines), len(new_lines))
+    while start < max_start and old_lines[start] == new_lines[start]:
+        start += 1
+    end = 0
+    max_end = max_start - start
+    while end < max_end and old_lines[-1 - end] == new_lines[-1 - end]:
+        end += 1
+
+    old_ids, new_ids = _intern_lines(
+        old_lines[start:len(old_lines) - end], new_lines[start:len(new_lines) - end]
+    )
+    matcher = difflib.SequenceMatcher(None, old_ids, new_ids)
     blocks = []
 
     for tag, i1, i2, j1, j2 in matcher.get_opcodes():
         if tag == "equal":
             continue
+        i1, i2, j1, j2 = i1 + start, i2 + start, j1 + start, j2 + start
 
         block = {
             "start_line_old": i1 + 1,
@@ -37,15 +59,59 @@ def generate_line_diff(old_path: Path, new_path: Path) -> list[dict] | bool:
     return blocks or True
 
 
+def _line_diff_task(paths: tuple[Path, Path]) -> list[dict] | bool:
+    """Process pool wrapper for `generate_line_diff()`."""
+    return generate_line_diff(*paths)
+
+
+def _find_changed_files(
+    common: list[str],
+    old_files: dict[str, Path],
+    new_files: dict[str, Path]
+    ) -> list[str]:
+    """
+    Return the common files whose contents differ.
+
+    Files with different sizes are changed without being read. Otherwise hashes are compared,
+    reusing memoised hashes so an unchanged build is only hashed once. These are kept in their
+    own memo, so compared builds don't end up in the game snapshot's memo.
+    """
+    changed = []
+    same_size = []
+    for path in common:
+        old_stat = os.stat(old_files[path])
+        new_stat = os.stat(new_files[path])
+        if old_stat.st_size != new_stat.st_size:
+            changed.append(path)
+        else:
+            same_size.append((path, old_stat, new_stat))
+
+    if same_size:
+        files = []
+        for path, old_stat, new_stat in same_size:
+            files.append((os.path.abspath(old_files[path]), old_stat))
+            files.append((os.path.abspath(new_files[path]), new_stat))
+        hashes = hash_files(files, memo_file=COMPARE_HASH_MEMO_FILE)
+        for i, (path, _, _) in enumerate(same_size):
+            if hashes[2 * i] != hashes[2 * i + 1]:
+                changed.append(path)
+
+    return sorted(changed)
+
+
 def compare_dirs(
     old: dict[str, str],
     new: dict[str, str],
     max_workers: int | None = None,
-    use_snapshots: bool = False
+    use_snapshots: bool = False,
+    use_processes: bool = False
     ) -> dict[str, list[str] | dict[str, dict[int, dict[str, str]] | bool]]:
     """
     Compare two directories and return a dict with added, removed, and changed files.
     Includes line-by-line diffs for .lua and .txt files.
+
+    Line diffs run in threads, or in a process pool if `use_processes` is True,
+    which is faster when many large files have changed.
     """
     old_dir = Path(old.get("path"))
     new_dir = Path(new.get("path"))
@@ -66,42 +132,36 @@ def compare_dirs(
 
     modified: dict[str, dict[int, dict[str, str]] | bool] = {}
 
-    def compare_pair(path: str) -> tuple[str, dict[int, dict[str, str]] | bool] | None:
-        old_path = old_files[path]
-        new_path = new_files[path]
-
-        # Snapshots are hashes
-        if use_snapshots:
-            if old_path != new_path:
-                return path, True
-            return None
-
-        # Do file comparisons
-        if file_loading.hash_file(old_path) != file_loading.hash_file(new_path):
-            if path.endswith(FILE_TYPES):
-                return path, generate_line_diff(old_path, new_path)
-            return path, True
-        return None
-    
-    max_workers = cfg.get_max_workers() if isinstance(cfg.get_max_workers(), int) else None
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = {
-            executor.submit(compare_pair, path): path
-            for path in common
-        }
-
-        with tqdm(total=len(futures), desc="Comparing files", unit=" files", bar_format=constants.PBAR_FORMAT, leave=False) as pbar:
-            for future in as_completed(futures):
-                path = futures[future]
-                pbar.set_postfix_str(f"{path[:100]}{'...' if len(path) > 100 else ''}")
-                result = future.result()
-                if result:
-                    path, diff = result
-                    modified[path] = diff
-                pbar.update(1)
-        
-        echo.success("File comparisons complted.")
+    # Snapshots are hashes
+    if use_snapshots:
+        for path in common:
+            if old_files[path] != new_files[path]:
+                modified[path] = True
+    else:
+        changed = _find_changed_files(common, old_files, new_files)
+        text_files = [path for path in changed if path.endswith(FILE_TYPES)]
+        for path in changed:
+            modified[path] = True
+
+        if text_files:
+            max_workers = max_workers or cfg.get_worker_count()
+            executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+            tasks = [(old_files[path], new_files[path]) for path in text_files]
+
+            with executor_class(max_workers=min(max_workers, len(tasks))) as executor:
+                futures = {
+                    executor.submit(_line_diff_task, task): path
+                    for path, task in zip(text_files, tasks)
+                }
+
+                with tqdm(total=len(futures), desc="Comparing files", unit=" files", bar_format=constants.PBAR_FORMAT, leave=False) as pbar:
+                    for future in as_completed(futures):
+                        path = futures[future]
+                        pbar.set_postfix_str(f"{path[:100]}{'...' if len(path) > 100 else ''}")
+                        modified[path] = future.result()
+                        pbar.update(1)
+
+    echo.success("File comparisons complted.")
 
     return {
         "added": added,
@@ -168,6 +228,8 @@ def save_diff_to_txt(
 
 SNAPSHOT_FILE = Path(constants.DATA_DIR) / "media_snapshot.json"
 SNAP_DIR = Path(constants.SNAPSHOT_DIR)
+HASH_MEMO_FILE = SNAP_DIR / "file_hashes.json"
+COMPARE_HASH_MEMO_FILE = SNAP_DIR / "compare_file_hashes.json"
 
 SCRIPTS_DIR = Path(file_loading.get_scripts_dir())
 LUA_DIR = Path(file_loading.get_lua_dir())
@@ -180,15 +242,105 @@ MEDIA_DIRS = [
 def get_snapshot_file(version: str, name: str = "media") -> Path:
     return SNAP_DIR / f"{name}_snapshot_v{version}.json"
 
-def scan_game_snapshot(directories: list[Path] = MEDIA_DIRS) -> dict[str, str]:
-    all_files = {}
+def _load_hash_memo(memo_file: Path = HASH_MEMO_FILE) -> dict[str, list]:
+    """Load a file hash memo, mapping absolute paths to `[size, mtime_ns, hash]`."""
+    if memo_file.exists():
+        return file_loading.load_json(str(memo_file))
+    return {}
+
+
+def _iter_snapshot_files(directories: list[Path]):
+    """Yield `(snapshot key, path, stat)` for every file in the directories."""
     for base_dir in directories:
-        for f in base_dir.rglob("*"):
-            if f.is_file():
-                relative_path = str(f.relative_to(base_dir))
-                key = f"{base_dir.name}/{relative_path}"
-                all_files[key] = file_loading.hash_file(f)
-    return all_files
+        base = os.path.abspath(base_dir)
+        for root, _, files in os.walk(base):
+            for fname in files:
+                path = os.path.join(root, fname)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield f"{base_dir.name}/{os.path.relpath(path, base)}", path, stat
+
+
+def _memo_hash(memo: dict[str, list], path: str, stat: os.stat_result) -> str | None:
+    """Return the memoised hash for a file, or None if its size or mtime changed."""
+    entry = memo.get(path)
+    if entry and entry[0] == stat.st_size and entry[1] == stat.st_mtime_ns:
+        return entry[2]
+    return None
+
+
+def hash_files(
+    files: list[tuple[str, os.stat_result]],
+    prune_dirs: list[Path] = (),
+    memo_file: Path = HASH_MEMO_FILE
+    ) -> list[str]:
+    """
+    Hash files, reusing memoised hashes for files whose size and mtime haven't changed.
+
+    Files that need hashing are read in parallel threads when there's more than one.
+
+    Args:
+        files (list[tuple[str, os.stat_result]]): Absolute file paths and their stats.
+        prune_dirs (list[Path], optional): Directories that were fully listed in `files`, so memo entries
+            for other files in them are dropped.
+        memo_file (Path, optional): Memo to read and update. Defaults to HASH_MEMO_FILE.
+
+    Returns:
+        list[str]: sha256 hashes, in the same order as `files`.
+    """
+    memo = _load_hash_memo(memo_file)
+    hashes = [_memo_hash(memo, path, stat) for path, stat in files]
+    stale = [i for i, file_hash in enumerate(hashes) if file_hash is None]
+
+    if stale:
+        max_workers = cfg.get_worker_count()
+        paths = [Path(files[i][0]) for i in stale]
+        if max_workers > 1 and len(stale) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(stale))) as executor:
+                stale_hashes = list(executor.map(file_loading.hash_file, paths))
+        else:
+            stale_hashes = [file_loading.hash_file(path) for path in paths]
+        for i, file_hash in zip(stale, stale_hashes):
+            hashes[i] = file_hash
+
+    # Keep memo entries for other directories, and drop deleted files from the pruned ones
+    roots = tuple(os.path.join(os.path.abspath(base_dir), "") for base_dir in prune_dirs)
+    updated = {path: entry for path, entry in memo.items() if not path.startswith(roots)}
+    for (path, stat), file_hash in zip(files, hashes):
+        updated[path] = [stat.st_size, stat.st_mtime_ns, file_hash]
+    if stale or len(updated) != len(memo):
+        file_loading.save_json(str(memo_file), updated)
+    return hashes
+
+
+def scan_game_snapshot(directories: list[Path] = MEDIA_DIRS) -> dict[str, str]:
+    """
+    Hash every file in the directories, mapped by '<dir name>/<relative path>'.
+
+    Hashes are memoised by size and mtime, so only new or changed files are re-read.
+    """
+    files = list(_iter_snapshot_files(directories))
+    hashes = hash_files([(path, stat) for _, path, stat in files], prune_dirs=directories)
+    return {key: file_hash for (key, _, _), file_hash in zip(files, hashes)}
+
+
+def has_snapshot_changed(snapshot: dict[str, str], directories: list[Path] = MEDIA_DIRS) -> bool:
+    """
+    Check whether the directories differ from a snapshot, using only file stats.
+
+    Reads no file contents, so a file that was touched but not modified still counts as changed.
+    `scan_game_snapshot()` gives an exact answer.
+    """
+    memo = _load_hash_memo()
+    count = 0
+    for key, path, stat in _iter_snapshot_files(directories):
+        file_hash = _memo_hash(memo, path, stat)
+        if file_hash is None or snapshot.get(key) != file_hash:
+            return True
+        count += 1
+    return count != len(snapshot)
 
 def load_snapshot(version: str, name: str = "media") -> dict[str, str]:
     path = get_snapshot_file(version, name)
@@ -235,7 +387,7 @@ def main():
     old = {"version": str(old_version), "path": os.path.join(old_path)}
     new = {"version": str(new_version), "path": os.path.join(new_path)}
 
-    diff = compare_dirs(old, new)
+    diff = compare_dirs(old, new, use_processes=cfg.get_worker_count() > 1)
     save_diff_to_json(diff, old, new)
     save_diff_to_txt(diff, old, new)
 
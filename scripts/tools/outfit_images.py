@@ -1,6 +1,8 @@
 from pathlib import Path
-from PIL import Image
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image, ImageChops
 from scripts.core.constants import RESOURCE_DIR, OUTPUT_DIR
+from scripts.core import config_manager as config
 from scripts.utils import echo
 from tqdm import tqdm
 
@@ -49,12 +51,58 @@ def is_green_pixel(pixel_rgb):
     return False
 
 
-def process_outfit_image(input_path: Path, output_path: Path):
+def _band_mask(band: Image.Image, minimum: int = None, maximum: int = None) -> Image.Image:
+    """Returns an 'L' mask that is 255 where the band value is within the given bounds, otherwise 0."""
+    low = 0 if minimum is None else minimum
+    high = 255 if maximum is None else maximum
+    return band.point(lambda value: 255 if low <= value <= high else 0)
+
+
+def get_green_mask(img: Image.Image) -> Image.Image:
+    """
+    Build a greenscreen mask for a whole image at once, matching `is_green_pixel`.
+
+    Returns:
+        Image.Image: 'L' mask that is 255 for greenscreen pixels and 0 otherwise.
+    """
+    r, g, b = img.convert("RGB").split()
+
+    strict = ImageChops.multiply(
+        ImageChops.multiply(
+            _band_mask(r, maximum=GREEN_TOLERANCE["red_max"]),
+            _band_mask(g, minimum=GREEN_TOLERANCE["green_min"]),
+        ),
+        _band_mask(b, maximum=GREEN_TOLERANCE["blue_max"]),
+    )
+
+    loose = ImageChops.multiply(
+        ImageChops.multiply(
+            _band_mask(r, maximum=GREEN_TOLERANCE_LOOSE["red_max"]),
+            _band_mask(g, minimum=GREEN_TOLERANCE_LOOSE["green_min"]),
+        ),
+        _band_mask(b, maximum=GREEN_TOLERANCE_LOOSE["blue_max"]),
+    )
+    # Loose matches must also be dominantly green: g > r and g > b
+    loose = ImageChops.multiply(
+        loose,
+        ImageChops.multiply(
+            _band_mask(ImageChops.subtract(g, r), minimum=1),
+            _band_mask(ImageChops.subtract(g, b), minimum=1),
+        ),
+    )
+
+    return ImageChops.lighter(strict, loose)
+
+
+def process_outfit_image(input_path: Path, output_path: Path) -> bool:
     """
     Process a single outfit image:
     1. Crop to specified coordinates
     2. Remove green background pixels using tolerance-based detection
     3. Save with maximum lossless compression
+
+    Returns:
+        bool: True if the image was processed and saved, False if it failed.
     """
     try:
         # Open image
@@ -73,16 +121,8 @@ def process_outfit_image(input_path: Path, output_path: Path):
             else:
                 cropped_img = img.crop(CROP_BOX)
 
-            pixels = cropped_img.load()
-
-            width, height = cropped_img.size
-            for x in range(width):
-                for y in range(height):
-                    pixel_rgb = pixels[x, y][:3]
-                    if is_green_pixel(
-                        pixel_rgb
-                    ):
-                        pixels[x, y] = (0, 255, 0, 0)
+            # Replace greenscreen pixels with transparent green
+            cropped_img.paste((0, 255, 0, 0), mask=get_green_mask(cropped_img))
 
             # Create output directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -96,9 +136,25 @@ def process_outfit_image(input_path: Path, output_path: Path):
             )
 
         echo.success(f"Processed: {input_path.name} -> {output_path.name}")
+        return True
 
     except Exception as e:
         echo.error(f"Failed to process {input_path.name}: {str(e)}")
+        return False
+
+
+def _process_outfit_image_worker(task: tuple[Path, Path]) -> bool:
+    """Process pool entry point for `process_outfit_image`."""
+    return process_outfit_image(*task)
+
+
+def get_output_name(original_name: str) -> str:
+    """Get the output file name for an outfit render, capitalising the gender suffix."""
+    if original_name.lower().endswith("female.png"):
+        return original_name[:-10] + "Female.png"
+    elif original_name.lower().endswith("male.png"):
+        return original_name[:-8] + "Male.png"
+    return original_name
 
 
 def main():
@@ -116,30 +172,40 @@ def main():
 
     echo.info(f"Found {len(png_files)} PNG files to process")
 
+    tasks = [
+        (input_file, OUTPUT_IMAGES_DIR / get_output_name(input_file.name))
+        for input_file in png_files
+    ]
+
     processed_count = 0
     error_count = 0
 
-    for input_file in tqdm(png_files, desc="Processing outfit images", unit="images"):
-        original_name = input_file.name
-        if original_name.lower().endswith("female.png"):
-            output_name = (
-                original_name[:-10] + "Female.png"
-            )
-        elif original_name.lower().endswith("male.png"):
-            output_name = (
-                original_name[:-8] + "Male.png"
-            )
+    max_workers = config.get_worker_count()
+    with tqdm(
+        total=len(tasks), desc="Processing outfit images", unit="images"
+    ) as pbar:
+        if max_workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(max_workers, len(tasks))
+            ) as executor:
+                results = executor.map(
+                    _process_outfit_image_worker,
+                    tasks,
+                    chunksize=max(1, len(tasks) // (max_workers * 4)),
+                )
+                for success in results:
+                    if success:
+                        processed_count += 1
+                    else:
+                        error_count += 1
+                    pbar.update(1)
         else:
-            output_name = original_name
-
-        output_file = OUTPUT_IMAGES_DIR / output_name
-
-        try:
-            process_outfit_image(input_file, output_file)
-            processed_count += 1
-        except Exception as e:
-            echo.error(f"Failed to process {input_file.name}: {str(e)}")
-            error_count += 1
+            for task in tasks:
+                if process_outfit_image(*task):
+                    processed_count += 1
+                else:
+                    error_count += 1
+                pbar.update(1)
 
     if error_count == 0:
         echo.success(
@@ -276,12 +276,12 @@ def extract_new_icons(new_sources: dict[str, list[dict]]) -> dict[str, list[str]
 
 
 def _reset_loaded_item_icon_cache() -> None:
-    """Reset Item's icon list when it is already loaded in this process."""
+    """Reset Item's icon caches when it is already loaded in this process."""
     item_module = sys.modules.get("scripts.objects.item")
     item_class = getattr(item_module, "Item", None) if item_module else None
 
     if item_class is not None:
-        item_class._icon_cache_files = None
+        item_class.reset_icon_cache()
 
 
 def update_icons() -> dict[str, list[str]]:
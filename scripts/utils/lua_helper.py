@@ -1,11 +1,47 @@
 import os
 import re
-from lupa import LuaRuntime, LuaError
+from collections import ChainMap, OrderedDict
+from collections.abc import Iterator
+from lupa import LuaRuntime, LuaError, lua_type
 from scripts.core.file_loading import get_lua_files, read_file, get_lua_dir
 from scripts.core.cache import save_cache
 from scripts.utils import echo
 
 
+# Most recently used Lua runtimes, keyed by everything that was loaded into them
+RUNTIME_POOL_SIZE = 4
+_runtime_pool: OrderedDict[tuple, LuaRuntime] = OrderedDict()
+
+
+def _runtime_key(
+    lua_files: str | list[str],
+    dependencies: list[str] | None,
+    inject_lua: str | list[str] | None,
+    prefer: str | None,
+    media_type: str,
+) -> tuple:
+    """Builds the pool key for a Lua load. Only loads with the same files, dependencies and options share a runtime."""
+
+    def as_tuple(value):
+        if value is None:
+            return ()
+        return (value,) if isinstance(value, str) else tuple(value)
+
+    return (
+        os.path.normpath(get_lua_dir()),
+        as_tuple(lua_files),
+        as_tuple(dependencies),
+        as_tuple(inject_lua),
+        prefer,
+        media_type,
+    )
+
+
+def clear_lua_runtimes() -> None:
+    """Releases all pooled Lua runtimes, so the next load re-executes its files."""
+    _runtime_pool.clear()
+
+
 def load_lua_file(
     lua_files: str | list[str],
     lua_runtime: LuaRuntime = None,
@@ -13,19 +49,33 @@ def load_lua_file(
     inject_lua: str = None,
     prefer: str = None,
     media_type: str = "lua",
+    shared: bool = True,
 ) -> LuaRuntime:
     """
     Loads and executes Lua files in the given Lua runtime.
 
+    When no runtime is given, the last `RUNTIME_POOL_SIZE` loaded runtimes are kept per process. Loading exactly
+    the same files, dependencies and injected code again returns the same runtime object instead of re-executing
+    them. Loads that only have some files in common don't share anything. The runtime isn't copied, so callers
+    that modify it after loading (e.g. executing more code in it), or load large files once, should pass `shared=False`.
+
     :param lua_files: Lua file names or paths (single or list).
     :param lua_runtime: Existing runtime or None to create one.
     :param dependencies: Lua dependencies to load first.
     :param inject_lua: Optional code to run before loading any files.
     :param prefer: Optional keyword to prioritise among duplicate file paths.
     :param media_type: The section of the game file map to search.
+    :param shared: Reuse a pooled runtime for an identical load, and add new ones to the pool. Ignored if `lua_runtime` is given.
     :return: Lua runtime.
     """
+    pool_key = None
     if not lua_runtime:
+        if shared:
+            pool_key = _runtime_key(lua_files, dependencies, inject_lua, prefer, media_type)
+            if pool_key in _runtime_pool:
+                _runtime_pool.move_to_end(pool_key)
+                return _runtime_pool[pool_key]
+
         lua_runtime = LuaRuntime(unpack_returned_tuples=True)
         lua_path = os.path.normpath(get_lua_dir()).replace(os.sep, "/")
         extra_paths = [
@@ -63,69 +113,138 @@ def load_lua_file(
         echo.error(str(e))
         raise
 
+    # Only pool fully loaded runtimes
+    if pool_key is not None:
+        _runtime_pool[pool_key] = lua_runtime
+        while len(_runtime_pool) > RUNTIME_POOL_SIZE:
+            _runtime_pool.popitem(last=False)
+
     return lua_runtime
 
 
-def lua_to_python(lua_data: object, _depth: int = 0) -> object:
+# Placeholder for a table that contains itself, which can't be represented in JSON
+CYCLIC_REFERENCE = "<Cyclic reference>"
+
+# Levels of each table converted entry by entry by `parse_lua_tables(release=True)`, e.g. `ProceduralDistributions.list`
+RELEASE_DEPTH = 2
+
+
+def _convert_value(value: object) -> object:
+    """Converts a non-table Lua value to its Python equivalent, using a string for functions and other Lua types."""
+    if isinstance(value, str):
+        # Remove 'base:' prefix from strings if present
+        if value.lower().startswith("base:"):
+            value = value[5:]
+        # Handle 'base:' after semicolons in semicolon-separated values
+        if ";base:" in value.lower():
+            value = re.sub(r";base:", ";", value, flags=re.IGNORECASE)
+        return value
+    if isinstance(value, (float, int, bool, type(None))):
+        return value
+    return str(value)
+
+
+def _table_entries(lua_table: object) -> tuple[bool, list[tuple]]:
+    """
+    Gets the entries of a Lua table, with keys starting with `__` skipped.
+
+    :param lua_table: The Lua table.
+    :return: Whether the table is an array, and its (key, value, Lua key) entries. Dict keys are converted, and Lua functions are moved to the end as strings.
+    """
+    keys = [
+        k for k in lua_table.keys() if not (isinstance(k, str) and k.startswith("__"))
+    ]
+    if all(isinstance(k, int) for k in keys):
+        return True, [(k, lua_table[k], k) for k in keys]
+
+    # Move lua functions to the bottom of the data
+    regular_items = []
+    function_items = []
+    for k in keys:
+        try:
+            if lua_type(k) == "table":
+                raise TypeError("tables can't be used as keys")
+            value = lua_table[k]
+            python_key = _convert_value(k)
+
+            if lua_type(value) == "function":
+                function_items.append((python_key, str(value), k))
+            else:
+                regular_items.append((python_key, value, k))
+        except Exception as e:
+            echo.error(f"Error converting key {k!r}: {e}")
+            continue
+    return False, regular_items + function_items
+
+
+def _convert_table(lua_table: object, converted: dict, active: set) -> list | dict:
+    """
+    Converts a Lua table and all tables nested in it, using an explicit stack instead of recursion.
+
+    Tables are identified by their address, so a table referenced more than once is only converted once and
+    shares its Python object. A table referenced from inside itself becomes `CYCLIC_REFERENCE`.
+
+    :param lua_table: The Lua table to convert.
+    :param converted: Tables converted so far, mapping their address to the (Lua table, Python object). The Lua table is kept so its address isn't reused.
+    :param active: Addresses of the tables still being converted, i.e. the parents of the current table.
+    :return: The converted list or dict.
+    """
+    root = [None]
+    # Entries are (lua table, parent, slot), or (None, address) once a table's children are done
+    stack = [(lua_table, root, 0)]
+
+    while stack:
+        entry = stack.pop()
+        if entry[0] is None:
+            active.discard(entry[1])
+            continue
+
+        table, parent, slot = entry
+        address = repr(table)
+        if address in active:
+            parent[slot] = CYCLIC_REFERENCE
+            continue
+        if address in converted:
+            parent[slot] = converted[address][1]
+            continue
+
+        is_array, entries = _table_entries(table)
+        result = [None] * len(entries) if is_array else {}
+        converted[address] = (table, result)
+        active.add(address)
+        parent[slot] = result
+        stack.append((None, address))
+
+        children = []
+        for index, (key, value, _) in enumerate(entries):
+            child_slot = index if is_array else key
+            if lua_type(value) == "table":
+                # Set now to keep the key order, and fill once the child is converted
+                result[child_slot] = None
+                children.append((value, result, child_slot))
+            else:
+                result[child_slot] = _convert_value(value)
+
+        # Reversed so children are converted in key order
+        stack.extend(reversed(children))
+
+    return root[0]
+
+
+def lua_to_python(lua_data: object) -> object:
     """
     Converts Lua data to its Python equivalent (dict, list, or basic value).
 
+    Nested tables are converted without recursion, so there is no depth limit. Tables referenced more than once
+    are converted once, and tables that contain themselves are replaced with `CYCLIC_REFERENCE`.
+
     :param lua_data: The Lua data to convert. Can be a basic type (int, float, bool, str, None), Lua table (converted to Python dict or list), or a Lua function (converted to a string).
     :return: The corresponding Python data structure (dict, list, basic type, or string).
     """
-    if _depth > 20:
-        return "<Max recursion reached>"
-
     try:
-        # Return basic values
-        if isinstance(lua_data, (float, int, bool, str, type(None))):
-            # Remove 'base:' prefix from strings if present
-            if isinstance(lua_data, str):
-                value = lua_data
-                if value.lower().startswith("base:"):
-                    value = value[5:]
-                # Handle 'base:' after semicolons in semicolon-separated values
-                if ";base:" in value.lower():
-                    value = re.sub(r";base:", ";", value, flags=re.IGNORECASE)
-                return value
-            return lua_data
-
-        # Determine whether it's a list (array) or dict (table)
-        if type(lua_data).__name__ == "_LuaTable":
-            # Skip keys starting with `__`
-            keys = [
-                k
-                for k in lua_data.keys()
-                if not (isinstance(k, str) and k.startswith("__"))
-            ]
-            is_array = all(isinstance(k, int) for k in keys)
-
-            if is_array:
-                return [lua_to_python(lua_data[k]) for k in keys]
-            else:
-                # Move lua functions to the bottom of the data
-                regular_items = {}
-                function_items = {}
-
-                for k in keys:
-                    try:
-                        value = lua_data[k]
-                        python_key = lua_to_python(k, _depth=_depth + 1)
-
-                        if type(value).__name__ == "_LuaFunction":
-                            function_items[python_key] = str(value)
-                        else:
-                            regular_items[python_key] = lua_to_python(
-                                value, _depth=_depth + 1
-                            )
-                    except Exception as e:
-                        echo.error(f"Error converting key {k!r}: {e}")
-                        continue
-                # Merge dicts, adding regular items first
-                return {**regular_items, **function_items}
-
-        # Return string as a fallback
-        return str(lua_data)
+        if lua_type(lua_data) == "table":
+            return _convert_table(lua_data, {}, set())
+        return _convert_value(lua_data)
 
     except KeyError as e:
         raise KeyError(f"Invalid key encountered in Lua table: {e}")
@@ -135,14 +254,95 @@ def lua_to_python(lua_data: object, _depth: int = 0) -> object:
         raise TypeError(f"Unsupported data type encountered: {e}")
 
 
-def parse_lua_tables(lua_runtime: LuaRuntime, tables: list[str] = None) -> dict:
+def _iter_entries(
+    lua_table: object, entries: list[tuple], release: bool, depth: int, active: set, released: dict
+) -> Iterator[tuple[object, object]]:
+    """
+    Converts the entries of a Lua table one at a time.
+
+    :param lua_table: The Lua table the entries belong to.
+    :param entries: The table's entries, from `_table_entries`. Consumed as they're converted.
+    :param release: Remove each entry from the Lua table once it's converted.
+    :param depth: Number of levels converted entry by entry. Entries below that are converted whole.
+    :param active: Addresses of this table and its parents, so references back to them are caught.
+    :param released: Tables emptied so far, mapping their address to the (Lua table, Python object), so
+        other references to them get the converted data instead of the empty table.
+    :return: Iterator of (key, value) pairs.
+    """
+    entries.reverse()
+    while entries:
+        key, value, lua_key = entries.pop()
+        if lua_type(value) == "table":
+            address = repr(value)
+            if address in released:
+                value = released[address][1]
+            elif depth > 1 and address not in active:
+                value = _convert_released(value, release, depth - 1, active, released)
+            else:
+                value = _convert_table(value, ChainMap({}, released), set(active))
+        else:
+            value = _convert_value(value)
+
+        if release:
+            lua_table[lua_key] = None
+        yield key, value
+
+
+def _convert_released(
+    lua_table: object, release: bool, depth: int, active: set, released: dict
+) -> list | dict:
+    """Converts a Lua table with `_iter_entries`, returning the list or dict `lua_to_python` would."""
+    is_array, entries = _table_entries(lua_table)
+    items = _iter_entries(lua_table, entries, release, depth, active | {repr(lua_table)}, released)
+    result = [value for _, value in items] if is_array else dict(items)
+    if release:
+        released[repr(lua_table)] = (lua_table, result)
+    return result
+
+
+def iter_lua_table(lua_table: object, release: bool = False, depth: int = 1) -> Iterator[tuple[object, object]]:
+    """
+    Converts a Lua table one top-level entry at a time, for tables too large to hold twice in memory.
+
+    Each value is converted on its own, so tables shared between top-level entries are converted again for each.
+
+    :param lua_table: The Lua table to convert.
+    :param release: Remove each entry from the Lua table once it's converted, so the Lua copy shrinks as the Python one grows.
+        Tables emptied this way are remembered, so later references to them still get their data.
+    :param depth: Number of levels converted entry by entry, e.g. 2 to also stream `ProceduralDistributions.list`.
+    :return: Iterator of (key, value) pairs, in the same order as `lua_to_python`. Arrays keep their Lua indices as keys.
+    """
+    try:
+        _, entries = _table_entries(lua_table)
+        yield from _iter_entries(lua_table, entries, release, depth, {repr(lua_table)}, {})
+
+    except KeyError as e:
+        raise KeyError(f"Invalid key encountered in Lua table: {e}")
+    except LuaError as e:
+        raise LuaError(f"Lua execution error while accessing data: {e}")
+
+
+def parse_lua_tables(lua_runtime: LuaRuntime, tables: list[str] = None, release: bool = False) -> dict:
     """
     Parses Lua tables from the provided Lua runtime and converts them into Python data structures.
 
     :param lua_runtime: The initialised Lua runtime environment containing the Lua code to parse.
     :param tables: List of Lua table names to extract. If None, all global tables (excluding standard Lua libraries) will be extracted.
+    :param release: Convert the tables entry by entry with `iter_lua_table`, emptying them in the runtime as they're converted.
+        Uses less memory for large tables, but leaves the runtime unusable.
     :return: Dictionary containing extracted tables with their Python data representations.
     """
+
+    # Tables emptied so far, shared across all the tables parsed, as they can reference each other
+    released = {}
+
+    def convert(lua_table):
+        if release and lua_type(lua_table) == "table":
+            if repr(lua_table) in released:
+                return released[repr(lua_table)][1]
+            return _convert_released(lua_table, True, RELEASE_DEPTH, set(), released)
+        return lua_to_python(lua_table)
+
     parsed_data = {}
     globals_dict = lua_runtime.globals()
 
@@ -167,13 +367,13 @@ def parse_lua_tables(lua_runtime: LuaRuntime, tables: list[str] = None) -> dict:
         for table_name in tables:
             try:
                 lua_table = lua_runtime.eval(table_name)
-                parsed_data[table_name] = lua_to_python(lua_table)
+                parsed_data[table_name] = convert(lua_table)
             except LuaError:
                 echo.warning(f"Table '{table_name}' not found.")
     else:
         for key, value in globals_dict.items():
-            if key not in STANDARD_LUA_LIBS and type(value).__name__ == "_LuaTable":
-                parsed_data[key] = lua_to_python(value)
+            if key not in STANDARD_LUA_LIBS and lua_type(value) == "table":
+                parsed_data[key] = convert(value)
 
     return parsed_data
 